@@ -0,0 +1,74 @@
+# application/batching.py
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, List, Tuple
+
+# (operation name, amount, caller's future)
+PendingOperation = Tuple[str, float, Future]
+
+
+class AccountOperationBatcher:
+    """
+    Coalesces operations on the same account that arrive within a short
+    window. The first caller for an idle account becomes the batch leader:
+    it waits `window_seconds`, drains everything queued for that account
+    and hands it to `apply_batch` in arrival order. Other callers just
+    enqueue and get a Future back.
+    """
+    def __init__(self, apply_batch: Callable[[str, List[PendingOperation]], None],
+                 window_seconds: float = 0.0005, max_batch: int = 256):
+        if window_seconds < 0 or max_batch < 1:
+            raise ValueError("Batch window must be non-negative and max batch at least 1")
+        self._apply_batch = apply_batch
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._lock = Lock()
+        self._queues: Dict[str, List[PendingOperation]] = {}
+        # one batch per account is applied at a time, keeping operations ordered;
+        # each entry is [lock, leaders holding or waiting for it] and is dropped at zero
+        self._apply_locks: Dict[str, list] = {}
+        self.batches = 0
+        self.operations = 0
+
+    def submit(self, account_id: str, operation: str, amount: float) -> Future:
+        future = Future()
+        with self._lock:
+            queue = self._queues.get(account_id)
+            if queue is not None and len(queue) < self.max_batch:
+                queue.append((operation, amount, future))
+                return future
+            # no open batch (or it is full): this caller leads a new one
+            queue = [(operation, amount, future)]
+            self._queues[account_id] = queue
+            entry = self._apply_locks.get(account_id)
+            if entry is None:
+                entry = self._apply_locks[account_id] = [Lock(), 0]
+            entry[1] += 1
+        if self.window_seconds:
+            time.sleep(self.window_seconds)
+        with self._lock:
+            # close the batch so later arrivals start the next one
+            if self._queues.get(account_id) is queue:
+                del self._queues[account_id]
+        try:
+            with entry[0]:
+                self._run(account_id, queue)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._apply_locks[account_id]
+        return future
+
+    def _run(self, account_id: str, queue: List[PendingOperation]) -> None:
+        with self._lock:
+            self.batches += 1
+            self.operations += len(queue)
+        try:
+            self._apply_batch(account_id, queue)
+        except Exception as e:
+            # never leave a caller waiting on an unresolved future
+            for _, _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
@@ -1,7 +1,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List
+from typing import List, Tuple
 
 
 class InterestServiceInterface(ABC):
@@ -20,6 +20,13 @@ class InterestServiceInterface(ABC):
         """Calculate interest for an account without modifying its state (preview)."""
         pass
 
+    @abstractmethod
+    def calculate_interest_projection(
+        self, account_id: str, start: date, end: date, step_days: int = 1
+    ) -> List[Tuple[date, float]]:
+        """Project accrued interest from `start` to `end` every `step_days` days (preview)."""
+        pass
+
     @abstractmethod
     def set_interest_strategy(self, account_id: str, strategy_id: str) -> None:
         """Assign or update the interest strategy for a given account."""
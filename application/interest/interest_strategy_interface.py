@@ -1,8 +1,26 @@
 from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict
 from domain.interest.interest_strategy import InterestStrategy
+from domain.interest.rate_schedule import RateSchedule
 
 class InterestStrategyRepositoryInterface(ABC):
     @abstractmethod
     def get_strategy(self, strategy_id: str) -> InterestStrategy:
         """Fetch a configured InterestStrategy by its ID."""
         pass
+
+    @abstractmethod
+    def get_rate_schedule(self, strategy_id: str) -> RateSchedule:
+        """Fetch the effective-dated rate history for a strategy ID."""
+        pass
+
+    @abstractmethod
+    def get_rate_schedules(self) -> Dict[str, RateSchedule]:
+        """Fetch the rate history of every configured strategy ID."""
+        pass
+
+    @abstractmethod
+    def set_rate(self, strategy_id: str, rate: float, effective_from: date) -> int:
+        """Add a rate effective from the given date; return the new schedule version."""
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 class LimitEnforcementServiceInterface(ABC):
     @abstractmethod
@@ -14,4 +15,14 @@ class LimitEnforcementServiceInterface(ABC):
     @abstractmethod
     def reset_limits_monthly(self) -> None:
         """Reset monthly usage counters for all accounts."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def try_consume(self, account_id: str, amount: float, at: datetime = None) -> bool:
+        """Atomically check and record usage; raise ValueError if a limit would be exceeded."""
+        pass
+
+    @abstractmethod
+    def release(self, account_id: str, amount: float, at: datetime) -> None:
+        """Roll back usage recorded by try_consume for a failed operation."""
+        pass
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import Dict, List
 from domain.interest.statement import MonthlyStatement
 
 # StatementService interface
@@ -10,3 +11,21 @@ class StatementServiceInterface(ABC):
     ) -> MonthlyStatement:
         """Generate a monthly statement for the specified account and period."""
         pass
+
+    def generate_statements(
+        self, account_ids: List[str], year: int, month: int, as_of: date
+    ) -> Dict[str, MonthlyStatement]:
+        """Statements for many accounts; unknown IDs are left out."""
+        statements = {}
+        for account_id in account_ids:
+            try:
+                statements[account_id] = self.generate_statement(account_id, year, month, as_of)
+            except KeyError:
+                continue
+        return statements
+
+    def stream_statement(
+        self, account_id: str, year: int, month: int, as_of: date
+    ) -> MonthlyStatement:
+        """Like generate_statement, but transactions are read lazily as they are iterated."""
+        return self.generate_statement(account_id, year, month, as_of)
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from concurrent.futures import Future
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from domain.accounts.create_accounts import Account
+from domain.clock import get_clock, utc_date
 from domain.accounts.factory import AccountFactory
 from domain.accounts.transaction import Transaction
+from domain.accounts.snapshot import AccountSnapshot
 from domain.accounts.service_rule import BusinessRuleService
 from domain.interest.limits_constraint import LimitConstraint
+from application.interest.limit_check import LimitEnforcementServiceInterface
+from application.batching import AccountOperationBatcher, PendingOperation
 
 
 # Repository interfaces for Application Layer
@@ -19,6 +25,11 @@ class AccountRepositoryInterface(ABC):
         """Retrieve an account by its ID."""
         pass
 
+    @abstractmethod
+    def get_accounts(self, account_ids: List[str]) -> Dict[str, Account]:
+        """Retrieve many accounts in one call; IDs that don't exist are left out."""
+        pass
+
     @abstractmethod
     def update_account(self, account: Account) -> None:
         """Update an existing account's state."""
@@ -29,6 +40,50 @@ class AccountRepositoryInterface(ABC):
         """Atomically update two accounts (for transfers)."""
         pass
 
+    @abstractmethod
+    def close_account(self, account_id: str) -> Account:
+        """Remove an account and return its final state."""
+        pass
+
+    @abstractmethod
+    def get_accounts_by_owner(self, owner: str) -> List[Account]:
+        """All open accounts belonging to an owner, in creation order."""
+        pass
+
+    @abstractmethod
+    def apply_delta(self, account_id: str, amount: float, min_balance: Optional[float] = None) -> float:
+        """
+        Atomically add `amount` (negative for a debit) to the balance and return
+        the new balance. Raise ValueError if it would fall below `min_balance`.
+        """
+        pass
+
+    def apply_deltas(self, account_id: str,
+                     deltas: List[Tuple[float, Optional[float]]]) -> List[Union[float, Exception]]:
+        """
+        Apply (amount, min_balance) pairs in order as one repository call. Each
+        result is the new balance, or the ValueError for a delta that was
+        refused; refused deltas leave the balance alone and later ones still run.
+        Backends should override this to avoid a round-trip per delta.
+        """
+        results: List[Union[float, Exception]] = []
+        for amount, min_balance in deltas:
+            try:
+                results.append(self.apply_delta(account_id, amount, min_balance))
+            except ValueError as e:
+                results.append(e)
+        return results
+
+    @abstractmethod
+    def apply_transfer(self, source_id: str, dest_id: str, amount: float) -> None:
+        """Atomically move `amount` between two accounts; raise ValueError if the source lacks funds."""
+        pass
+
+    @abstractmethod
+    def get_account_version(self, account_id: str) -> int:
+        """Return a counter that changes whenever the account's state is persisted."""
+        pass
+
     @abstractmethod
     def get_constraints(self, account_id: str) -> LimitConstraint:
         """Retrieve the limit constraints for a given account."""
@@ -43,6 +98,33 @@ class AccountRepositoryInterface(ABC):
         """Retrieve all constraints."""
         pass
 
+    @abstractmethod
+    def try_consume(self, account_id: str, amount: float, at: datetime) -> bool:
+        """Atomically check and record limit usage; raise ValueError if a limit would be exceeded."""
+        pass
+
+    @abstractmethod
+    def release(self, account_id: str, amount: float, at: datetime) -> None:
+        """Roll back usage recorded by try_consume for an operation that failed."""
+        pass
+
+    def check_constraint(self, account_id: str, amount: float, at: datetime) -> None:
+        """Check limits without recording usage; raise ValueError if one would be exceeded."""
+        self.get_constraints(account_id).check(amount, utc_date(at), at)
+
+    def refresh_constraints(self, account_ids: Optional[Iterable[str]] = None) -> None:
+        """Apply pending epoch resets to the given accounts' constraints (default: all)."""
+        constraints = self.get_constraint_dict()
+        for account_id in list(account_ids if account_ids is not None else constraints):
+            constraint = constraints.get(account_id)
+            if constraint is not None:
+                constraint.refresh()
+
+    @abstractmethod
+    def snapshot(self) -> List[AccountSnapshot]:
+        """Return a point-in-time copy of every account's state for read-only runs."""
+        pass
+
 class TransactionRepositoryInterface(ABC):
     @abstractmethod
     def save_transaction(self, transaction: Transaction) -> str:
@@ -59,6 +141,14 @@ class TransactionRepositoryInterface(ABC):
         """Retrieve a single transaction by its ID."""
         pass
 
+    def list_transactions_for_accounts(self, account_ids: List[str]) -> Dict[str, List[Transaction]]:
+        """Transactions for many accounts in one call, keyed by account ID."""
+        return {account_id: self.list_transactions(account_id) for account_id in account_ids}
+
+    def iter_transactions(self, account_id: str) -> Iterator[Transaction]:
+        """Yield an account's transactions one at a time; backends should override to avoid building a list."""
+        yield from self.list_transactions(account_id)
+
     
 
 
@@ -80,24 +170,102 @@ class AccountCreationService:
 
 
 class TransactionService:
-    def __init__(self, account_repo: AccountRepositoryInterface, transaction_repo: TransactionRepositoryInterface):
+    def __init__(self, account_repo: AccountRepositoryInterface, transaction_repo: TransactionRepositoryInterface,
+                 limit_service: LimitEnforcementServiceInterface = None,
+                 batch_window: Optional[float] = None):
         self.account_repo = account_repo
         self.transaction_repo = transaction_repo
+        # Optional: enforce daily/monthly/rolling limits on every operation
+        self.limit_service = limit_service
+        # Optional: coalesce concurrent submit_* calls per account (window in seconds)
+        self.batcher = None
+        if batch_window is not None:
+            self.batcher = AccountOperationBatcher(self._apply_batch, batch_window)
 
     def deposit(self, account_id: str, amount: float) -> str:
-        account = self.account_repo.get_account(account_id)
-        account.deposit(amount)
-        self.account_repo.update_account(account)
+        Account.check_deposit(amount)
+        at = self._consume_limit(account_id, amount)
+        try:
+            self.account_repo.apply_delta(account_id, amount)
+        except Exception:
+            self._release_limit(account_id, amount, at)
+            raise
         transaction = Transaction(account_id, "DEPOSIT", amount)
         return self.transaction_repo.save_transaction(transaction)
 
     def withdraw(self, account_id: str, amount: float) -> str:
-        account = self.account_repo.get_account(account_id)
-        account.withdraw(amount)
-        self.account_repo.update_account(account)
+        Account.check_withdrawal(amount)
+        at = self._consume_limit(account_id, amount)
+        try:
+            # the repository checks funds and debits in one step
+            self.account_repo.apply_delta(account_id, -amount, min_balance=0.0)
+        except Exception:
+            # a failed debit must not count against the limits
+            self._release_limit(account_id, amount, at)
+            raise
         transaction = Transaction(account_id, "WITHDRAW", amount)
         return self.transaction_repo.save_transaction(transaction)
 
+    def submit_deposit(self, account_id: str, amount: float) -> Future:
+        """Queue a deposit; the future resolves to its transaction ID or raises its error."""
+        return self._submit(account_id, "DEPOSIT", amount)
+
+    def submit_withdraw(self, account_id: str, amount: float) -> Future:
+        return self._submit(account_id, "WITHDRAW", amount)
+
+    def _submit(self, account_id: str, operation: str, amount: float) -> Future:
+        if self.batcher is not None:
+            return self.batcher.submit(account_id, operation, amount)
+        future = Future()
+        self._apply_batch(account_id, [(operation, amount, future)])
+        return future
+
+    def _apply_batch(self, account_id: str, ops: List[PendingOperation]) -> None:
+        # One repository call for the whole batch, applied in order under the
+        # account's balance lock; each op succeeds or fails on its own
+        accepted = []
+        for operation, amount, future in ops:
+            at = None
+            try:
+                if operation == "DEPOSIT":
+                    Account.check_deposit(amount)
+                else:
+                    Account.check_withdrawal(amount)
+                at = self._consume_limit(account_id, amount)
+            except Exception as e:
+                self._release_limit(account_id, amount, at)
+                future.set_exception(e)
+                continue
+            accepted.append((operation, amount, future, at))
+        if not accepted:
+            return
+        deltas = [(amount, None) if operation == "DEPOSIT" else (-amount, 0.0)
+                  for operation, amount, _, _ in accepted]
+        try:
+            results = self.account_repo.apply_deltas(account_id, deltas)
+        except Exception as e:
+            # nothing was applied (e.g. the account does not exist)
+            results = [e] * len(accepted)
+        for (operation, amount, future, at), result in zip(accepted, results):
+            if isinstance(result, Exception):
+                self._release_limit(account_id, amount, at)
+                future.set_exception(result)
+                continue
+            transaction = Transaction(account_id, operation, amount)
+            future.set_result(self.transaction_repo.save_transaction(transaction))
+
+    def _consume_limit(self, account_id: str, amount: float):
+        # Non-positive amounts are rejected by the domain and never consume a limit
+        if self.limit_service is None or amount <= 0:
+            return None
+        at = get_clock().now()
+        self.limit_service.try_consume(account_id, amount, at)
+        return at
+
+    def _release_limit(self, account_id: str, amount: float, at) -> None:
+        if at is not None:
+            self.limit_service.release(account_id, amount, at)
+
     def get_transactions(self, account_id: str) -> List[Transaction]:
         return self.transaction_repo.list_transactions(account_id)
     
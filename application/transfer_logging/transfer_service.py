@@ -3,9 +3,11 @@ from application.services import (
     AccountRepositoryInterface,
     TransactionRepositoryInterface,
 )
+from application.interest.limit_check import LimitEnforcementServiceInterface
 from application.transfer_logging.notifications_services import NotificationAdapterInterface
+from domain.accounts.create_accounts import Account
+from domain.clock import get_clock
 from domain.transfer.transfer import TransferTransaction
-from domain.transfer.transfer_service import TransferService
 
 
 class FundTransferService:
@@ -14,23 +16,34 @@ class FundTransferService:
         account_repo: AccountRepositoryInterface,
         transaction_repo: TransactionRepositoryInterface,
         notification_adapter: NotificationAdapterInterface = None,
+        limit_service: LimitEnforcementServiceInterface = None,
     ):
         self.account_repo = account_repo
         self.transaction_repo = transaction_repo
         self.notification_adapter = notification_adapter
+        # Optional: the transfer counts against the source account's limits
+        self.limit_service = limit_service
 
     def transfer_funds(self, source_id: str, dest_id: str, amount: float) -> str:
-        # Fetch domain objects
-        source = self.account_repo.get_account(source_id)
-        destination = self.account_repo.get_account(dest_id)
-        # Domain-level transfer
-        transfer_tx: TransferTransaction = TransferService.execute(source, destination, amount)
-        # Persist updated accounts
-        self.account_repo.update_accounts(source, destination)
+        at = None
+        if self.limit_service is not None and amount > 0:
+            at = get_clock().now()
+            self.limit_service.try_consume(source_id, amount, at)
+        try:
+            Account.check_withdrawal(amount)
+            # The repository debits and credits both accounts in one atomic step
+            self.account_repo.apply_transfer(source_id, dest_id, amount)
+        except Exception:
+            # a failed debit must not count against the limits
+            if at is not None:
+                self.limit_service.release(source_id, amount, at)
+            raise
         # Persist transaction
+        transfer_tx = TransferTransaction(source_id, dest_id, amount)
         tx_id = self.transaction_repo.save_transaction(transfer_tx)
         # Notify user if adapter provided
         if self.notification_adapter:
+            source = self.account_repo.get_account(source_id)
             subject = "Transfer Completed"
             body = f"Transferred {amount} from {source_id} to {dest_id}. Transaction ID: {tx_id}"
             # For simplicity, assume owner name is recipient identifier
@@ -0,0 +1,95 @@
+# benchmarks/bench_batching.py
+"""
+Deposit throughput with and without per-account micro-batching, with
+accounts drawn from a Zipfian distribution so a few hot accounts take
+most of the traffic.
+
+    PYTHONPATH=. python benchmarks/bench_batching.py --ops 20000 --threads 16
+    PYTHONPATH=. python benchmarks/bench_batching.py --latency-ms 1
+"""
+import argparse
+import bisect
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from threading import Lock
+
+from application.services import TransactionService
+from domain.accounts.factory import AccountFactory
+from infrastructure.account_repo import InMemoryAccountRepository
+from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+
+class SlowAccountRepository(InMemoryAccountRepository):
+    """
+    Adds a fixed delay to each balance write to stand in for a remote
+    backend, and counts those round-trips. The delay is taken outside the
+    balance lock, as network time would be.
+    """
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+        self.round_trips = 0
+        self._count_lock = Lock()
+
+    def _round_trip(self):
+        with self._count_lock:
+            self.round_trips += 1
+        time.sleep(self.latency)
+
+    def apply_delta(self, account_id, amount, min_balance=None):
+        self._round_trip()
+        return super().apply_delta(account_id, amount, min_balance)
+
+    def apply_deltas(self, account_id, deltas):
+        self._round_trip()
+        return super().apply_deltas(account_id, deltas)
+
+
+def zipf_sampler(n: int, s: float, rng: random.Random):
+    # P(rank k) is proportional to 1 / k**s
+    cumulative = list(accumulate(1.0 / (k ** s) for k in range(1, n + 1)))
+    total = cumulative[-1]
+    return lambda: bisect.bisect_left(cumulative, rng.random() * total)
+
+
+def run(ops: int, accounts: int, threads: int, skew: float, batch_window, latency: float) -> float:
+    account_repo = SlowAccountRepository(latency)
+    for i in range(accounts):
+        account_repo.create_account(AccountFactory.create_account("checking", f"A{i}", "bench", 0.0))
+    service = TransactionService(account_repo, InMemoryTransactionRepository(), batch_window=batch_window)
+    sample = zipf_sampler(accounts, skew, random.Random(42))
+    targets = [f"A{sample()}" for _ in range(ops)]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = list(pool.map(lambda a: service.submit_deposit(a, 1.0), targets))
+    for f in futures:
+        f.result()
+    elapsed = time.perf_counter() - started
+
+    trips = account_repo.round_trips
+    # sanity check: every deposit must have landed exactly once
+    lost = ops - sum(account_repo.get_account(f"A{i}").balance for i in range(accounts))
+    print(f"window={batch_window!s:>8}  {ops / elapsed:10.0f} ops/s  "
+          f"{trips} repository round-trips ({ops / trips:.1f} ops/trip)  "
+          f"lost updates={lost:.0f}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--accounts", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--skew", type=float, default=1.2)
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="simulated repository round-trip time")
+    args = parser.parse_args()
+    for window in (None, 0.0, 0.0005, 0.002):
+        run(args.ops, args.accounts, args.threads, args.skew, window, args.latency_ms / 1000)
+
+
+if __name__ == "__main__":
+    main()
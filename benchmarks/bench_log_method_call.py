@@ -0,0 +1,47 @@
+# benchmarks/bench_log_method_call.py
+"""
+Per-call overhead of @log_method_call with its level disabled, with 1-in-N
+sampling, and fully enabled (records go to a NullHandler).
+
+    PYTHONPATH=. python benchmarks/bench_log_method_call.py
+"""
+import logging
+import timeit
+
+from infrastructure.logger import log_method_call
+
+log = logging.getLogger("bench.log_method_call")
+log.addHandler(logging.NullHandler())
+log.propagate = False
+
+
+def plain(account_id, amount):
+    return amount
+
+
+disabled = log_method_call(log, level=logging.DEBUG)(plain)
+sampled = log_method_call(log, level=logging.INFO, sample_rate=100)(plain)
+enabled = log_method_call(log, level=logging.INFO)(plain)
+
+
+def per_call_ns(fn, number: int) -> float:
+    best = min(timeit.repeat(lambda: fn("ACC-1", 10.0), number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main():
+    log.setLevel(logging.INFO)
+    base = per_call_ns(plain, 200_000)
+    print(f"{'variant':<22} {'ns/call':>9} {'overhead':>9}")
+    for name, fn, number in (
+        ("undecorated", plain, 200_000),
+        ("DEBUG disabled", disabled, 200_000),
+        ("INFO, 1 in 100", sampled, 50_000),
+        ("INFO, every call", enabled, 20_000),
+    ):
+        ns = per_call_ns(fn, number)
+        print(f"{name:<22} {ns:9.0f} {ns - base:+9.0f}")
+
+
+if __name__ == "__main__":
+    main()
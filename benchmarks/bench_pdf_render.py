@@ -0,0 +1,66 @@
+# benchmarks/bench_pdf_render.py
+"""
+Time and peak memory of the platypus PdfStatementAdapter against the
+CanvasStatementRenderer for statements of 100, 10k and 100k transactions.
+
+    PYTHONPATH=. python benchmarks/bench_pdf_render.py
+    PYTHONPATH=. python benchmarks/bench_pdf_render.py --sizes 100 1000 --platypus-max 1000 --memory
+"""
+import argparse
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+
+from domain.accounts.transaction import Transaction
+from domain.interest.statement import MonthlyStatement
+from infrastructure.interest.pdf_canvas_renderer import CanvasStatementRenderer
+from infrastructure.interest.pdf_statement_adapter import PdfStatementAdapter
+
+
+def make_statement(rows: int) -> MonthlyStatement:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    txs = []
+    for i in range(rows):
+        tx = Transaction("BENCH", "DEPOSIT" if i % 3 else "WITHDRAW", 10.0 + i % 97)
+        tx.timestamp = start + timedelta(seconds=i * 20)
+        txs.append(tx)
+    return MonthlyStatement("BENCH", 2024, 1, 0.0, 0.0, 0.0, txs, date(2024, 2, 1))
+
+
+def measure(renderer, statement, memory: bool):
+    started = time.perf_counter()
+    data = renderer.render(statement)
+    elapsed = time.perf_counter() - started
+    peak = None
+    if memory:
+        # a second, traced run; tracing slows rendering too much to time it
+        tracemalloc.start()
+        renderer.render(statement)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak, len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--platypus-max", type=int, default=10_000,
+                        help="skip the platypus renderer above this many rows")
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory")
+    args = parser.parse_args()
+
+    renderers = [("platypus", PdfStatementAdapter()), ("canvas", CanvasStatementRenderer())]
+    print(f"{'rows':>8}  {'renderer':<9} {'seconds':>8} {'peak MiB':>9} {'PDF KiB':>8}")
+    for rows in args.sizes:
+        statement = make_statement(rows)
+        for name, renderer in renderers:
+            if name == "platypus" and rows > args.platypus_max:
+                print(f"{rows:>8}  {name:<9} {'skipped':>8}")
+                continue
+            elapsed, peak, size = measure(renderer, statement, args.memory)
+            peak_mib = f"{peak / 2**20:9.1f}" if peak is not None else f"{'-':>9}"
+            print(f"{rows:>8}  {name:<9} {elapsed:8.2f} {peak_mib} {size / 1024:8.0f}")
+
+
+if __name__ == "__main__":
+    main()
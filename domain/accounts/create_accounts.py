@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import date
+from domain.clock import get_clock
 
 
 class Account(ABC):
@@ -9,20 +10,32 @@ class Account(ABC):
         self.owner = owner
         self.balance = balance
         self.interest_strategy = interest_strategy
-        self.last_interest_date = last_interest_date or date.today()
+        self.last_interest_date = last_interest_date or get_clock().today()
 
     def deposit(self, amount: float):
-        if amount <= 0:
-            raise ValueError("Deposit must be positive")
+        Account.check_deposit(amount)
         self.balance += amount
 
     def withdraw(self, amount: float):
-        if amount <= 0:
-            raise ValueError("Withdrawal must be positive")
+        Account.check_withdrawal(amount)
         if self.balance < amount:
             raise ValueError("Insufficient balance")
         self.balance -= amount
 
+    def adjust_balance(self, delta: float) -> None:
+        # Unchecked credit or debit, e.g. an interest posting
+        self.balance += delta
+
+    @staticmethod
+    def check_deposit(amount: float) -> None:
+        if amount <= 0:
+            raise ValueError("Deposit must be positive")
+
+    @staticmethod
+    def check_withdrawal(amount: float) -> None:
+        if amount <= 0:
+            raise ValueError("Withdrawal must be positive")
+
 
     @abstractmethod
     def account_type(self) -> str:
@@ -0,0 +1,17 @@
+# domain/accounts/snapshot.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """
+    Immutable, picklable copy of the account state needed for interest runs.
+    """
+    account_id: str
+    account_type: str
+    balance: float
+    last_interest_date: date
+    # set when the account has its own interest strategy instead of its type's
+    strategy_id: Optional[str] = None
@@ -0,0 +1,119 @@
+# domain/accounts/striped_account.py
+from threading import Lock, get_ident
+from typing import List
+from domain.accounts.create_accounts import Account
+
+
+class StripedAccount(Account):
+    """
+    Decorator around an Account for high fan-in destinations. Credits go to
+    one of N sub-balances picked by hash, each with its own lock, so
+    concurrent credits don't contend. Debits and balance reads aggregate
+    all stripes.
+    """
+    def __init__(self, base_account: Account, stripes: int = 8):
+        if stripes < 1:
+            raise ValueError("Stripe count must be at least 1")
+        # stripes must exist before Account.__init__ assigns the balance
+        self._stripes: List[float] = [0.0] * stripes
+        self._locks = [Lock() for _ in range(stripes)]
+        super().__init__(
+            base_account.account_id,
+            base_account.owner,
+            base_account.balance,
+            interest_strategy=base_account.interest_strategy,
+            last_interest_date=base_account.last_interest_date
+        )
+        self._base = base_account
+        # set once unstriped() hands the balance back to the wrapped account
+        self._retired = False
+
+    @property
+    def stripe_count(self) -> int:
+        return len(self._stripes)
+
+    @property
+    def balance(self) -> float:
+        return sum(self._stripes)
+
+    @balance.setter
+    def balance(self, value: float) -> None:
+        with _AllLocks(self._locks):
+            self._stripes[0] = value
+            for i in range(1, len(self._stripes)):
+                self._stripes[i] = 0.0
+
+    def stripe_balances(self) -> List[float]:
+        return list(self._stripes)
+
+    def deposit(self, amount: float, stripe_key=None):
+        Account.check_deposit(amount)
+        self.adjust_balance(amount, stripe_key)
+
+    def adjust_balance(self, delta: float, stripe_key=None) -> None:
+        # concurrent callers usually run on different threads, so that is the default key
+        i = hash(stripe_key if stripe_key is not None else get_ident()) % len(self._stripes)
+        with self._locks[i]:
+            self._stripes[i] += delta
+
+    def credit_if_live(self, delta: float, stripe_key=None) -> bool:
+        """
+        Like adjust_balance, but refuses once the account has been unstriped,
+        so a caller holding a stale reference can retry on the current one.
+        """
+        i = hash(stripe_key if stripe_key is not None else get_ident()) % len(self._stripes)
+        with self._locks[i]:
+            if self._retired:
+                return False
+            self._stripes[i] += delta
+            return True
+
+    def withdraw(self, amount: float):
+        Account.check_withdrawal(amount)
+        with _AllLocks(self._locks):
+            if sum(self._stripes) < amount:
+                raise ValueError("Insufficient balance")
+            remaining = amount
+            for i, value in enumerate(self._stripes):
+                if value <= 0:
+                    continue
+                taken = min(value, remaining)
+                self._stripes[i] = value - taken
+                remaining -= taken
+                if remaining <= 0:
+                    break
+
+    def consolidate(self) -> float:
+        """Fold every stripe into the first one; returns the balance."""
+        with _AllLocks(self._locks):
+            total = sum(self._stripes)
+            self._stripes[0] = total
+            for i in range(1, len(self._stripes)):
+                self._stripes[i] = 0.0
+            return total
+
+    def unstriped(self) -> Account:
+        """The wrapped account carrying this account's current state."""
+        with _AllLocks(self._locks):
+            self._retired = True
+            self._base.balance = sum(self._stripes)
+        self._base.interest_strategy = self.interest_strategy
+        self._base.last_interest_date = self.last_interest_date
+        return self._base
+
+    def account_type(self) -> str:
+        return self._base.account_type()
+
+
+class _AllLocks:
+    # always acquired in index order, so two aggregating callers cannot deadlock
+    def __init__(self, locks):
+        self._locks = locks
+
+    def __enter__(self):
+        for lock in self._locks:
+            lock.acquire()
+
+    def __exit__(self, *exc):
+        for lock in reversed(self._locks):
+            lock.release()
@@ -1,5 +1,5 @@
 from uuid import uuid4
-from datetime import datetime, timezone
+from domain.clock import get_clock
 
 class Transaction:
     def __init__(
@@ -12,7 +12,7 @@ class Transaction:
         self.account_id = account_id
         self.transaction_type = transaction_type
         self.amount = amount
-        self.timestamp = datetime.now(timezone.utc)
+        self.timestamp = get_clock().now()
 
     def __repr__(self):
         return (
@@ -0,0 +1,88 @@
+# domain/clock.py
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta, timezone
+
+
+class Clock(ABC):
+    """Source of the current time for timestamps and limit dates."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Current UTC time, timezone-aware."""
+        pass
+
+    @abstractmethod
+    def today(self) -> date:
+        """Current UTC calendar date, the day limits are counted against."""
+        pass
+
+
+class CoarseClock(Clock):
+    """
+    Caches the current datetime and date and refreshes them at most once per
+    `resolution_seconds`, so callers within the same tick share one object
+    instead of each allocating their own.
+    """
+    def __init__(self, resolution_seconds: float = 0.001):
+        self._resolution_ns = int(resolution_seconds * 1_000_000_000)
+        # (expiry in ns, now, today), replaced as a whole so readers never see a mix
+        self._cached = (0, None, None)
+
+    def _refresh(self):
+        ns = time.time_ns()
+        cached = self._cached
+        if ns < cached[0]:
+            return cached
+        now = datetime.fromtimestamp(ns / 1_000_000_000, timezone.utc)
+        cached = (ns + self._resolution_ns, now, now.date())
+        self._cached = cached
+        return cached
+
+    def now(self) -> datetime:
+        return self._refresh()[1]
+
+    def today(self) -> date:
+        return self._refresh()[2]
+
+
+class FrozenClock(Clock):
+    """Fixed time for tests and simulations; moves only when told to."""
+    def __init__(self, at: datetime):
+        self.set(at)
+
+    def set(self, at: datetime) -> None:
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        self._now = at
+
+    def advance(self, **kwargs) -> None:
+        """Move forward by a timedelta given as keyword arguments, e.g. advance(days=1)."""
+        self._now += timedelta(**kwargs)
+
+    def now(self) -> datetime:
+        return self._now
+
+    def today(self) -> date:
+        return utc_date(self._now)
+
+
+def utc_date(at: datetime) -> date:
+    """UTC calendar date of a timestamp; naive timestamps are taken to be UTC."""
+    if at.tzinfo is not None:
+        at = at.astimezone(timezone.utc)
+    return at.date()
+
+
+_clock: Clock = CoarseClock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Install a process-wide clock; returns the previous one so callers can restore it."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
@@ -0,0 +1,93 @@
+# domain/interest/day_count.py
+from array import array
+from datetime import date
+from typing import Iterable, Optional
+
+ACT_365 = "ACT/365"
+ACT_360 = "ACT/360"
+THIRTY_360 = "30/360"
+BUS_252 = "BUS/252"
+
+DAY_COUNT_CONVENTIONS = (ACT_365, ACT_360, THIRTY_360, BUS_252)
+
+
+class BusinessCalendar:
+    """
+    Precomputed calendar for a range of years. A prefix array of business-day
+    counts makes any business-day count between two dates in range O(1).
+    """
+    def __init__(self, start_year: int = 1990, end_year: int = 2100,
+                 holidays: Iterable[date] = (), weekend: Iterable[int] = (5, 6)):
+        if end_year < start_year:
+            raise ValueError("Calendar end year must not be before start year")
+        self.start_year = start_year
+        self.end_year = end_year
+        self.holidays = frozenset(holidays)
+        self.weekend = frozenset(weekend)
+        self._first = date(start_year, 1, 1).toordinal()
+        self._last = date(end_year + 1, 1, 1).toordinal()
+        holiday_ordinals = {h.toordinal() for h in self.holidays}
+        # _business_prefix[i] = business days in [first, first + i)
+        prefix = array('l', [0])
+        running = 0
+        for ordinal in range(self._first, self._last):
+            # date.weekday() for an ordinal: ordinal 1 (0001-01-01) was a Monday
+            if (ordinal - 1) % 7 not in self.weekend and ordinal not in holiday_ordinals:
+                running += 1
+            prefix.append(running)
+        self._business_prefix = prefix
+
+    def __reduce__(self):
+        # rebuild from parameters instead of shipping the prefix array between processes
+        return (BusinessCalendar, (self.start_year, self.end_year, tuple(self.holidays), tuple(self.weekend)))
+
+    def _index(self, d: date, boundary: bool = False) -> int:
+        # `boundary` admits the day after the range, valid only as an interval end
+        ordinal = d.toordinal()
+        if not self._first <= ordinal < self._last + boundary:
+            raise ValueError(f"Date {d.isoformat()} outside calendar range {self.start_year}-{self.end_year}")
+        return ordinal - self._first
+
+    def is_business_day(self, d: date) -> bool:
+        i = self._index(d)
+        return self._business_prefix[i + 1] - self._business_prefix[i] == 1
+
+    def business_days_between(self, start: date, end: date) -> int:
+        """Business days in [start, end); negative if end is before start."""
+        # either argument may be the exclusive end, since the interval can run backwards
+        return self._business_prefix[self._index(end, True)] - self._business_prefix[self._index(start, True)]
+
+    @staticmethod
+    def days_between(start: date, end: date) -> int:
+        return end.toordinal() - start.toordinal()
+
+    @staticmethod
+    def days_30_360(start: date, end: date) -> int:
+        # US 30/360: day 31 rolls back to 30; end day rolls back only if start did
+        d1 = min(start.day, 30)
+        d2 = end.day
+        if d1 == 30 and d2 == 31:
+            d2 = 30
+        return 360 * (end.year - start.year) + 30 * (end.month - start.month) + (d2 - d1)
+
+    def year_fraction(self, start: date, end: date, convention: str = ACT_365) -> float:
+        if convention == ACT_365:
+            return self.days_between(start, end) / 365
+        if convention == ACT_360:
+            return self.days_between(start, end) / 360
+        if convention == THIRTY_360:
+            return self.days_30_360(start, end) / 360
+        if convention == BUS_252:
+            return self.business_days_between(start, end) / 252
+        raise ValueError(f"Unknown day count convention: {convention}")
+
+
+_default_calendar: Optional[BusinessCalendar] = None
+
+
+def default_calendar() -> BusinessCalendar:
+    """Shared weekend-only calendar, built on first use."""
+    global _default_calendar
+    if _default_calendar is None:
+        _default_calendar = BusinessCalendar()
+    return _default_calendar
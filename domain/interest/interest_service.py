@@ -13,8 +13,12 @@ class InterestService:
             raise ValueError("No valid interest strategy attached to account")
         # Calculate interest
         interest = account.interest_strategy.calculate_interest(account, as_of)
+        return InterestService.post_interest(account, interest, as_of)
+
+    @staticmethod
+    def post_interest(account: Account, interest: float, as_of: date) -> float:
         # Update balance and last_interest_date
-        account.balance += interest
+        account.adjust_balance(interest)
         account.last_interest_date = as_of
         return interest
 
@@ -2,9 +2,13 @@
 
 from abc import ABC, abstractmethod
 from datetime import date
+from typing import List, Optional, Sequence
 from domain.accounts.create_accounts import Account
 
 class InterestStrategy(ABC):
+    # Configuration ID the strategy was built from, e.g. "savings"
+    strategy_id: Optional[str] = None
+
     @abstractmethod
     def calculate_interest(self, account: Account, as_of: date) -> float:
         """
@@ -13,5 +17,24 @@ class InterestStrategy(ABC):
         """
         pass
 
+    def accrual_factor(self, start: date, end: date) -> Optional[float]:
+        """
+        Interest per unit of balance accrued from `start` to `end`, or None if
+        the strategy is not linear in the balance. Batch runs share this value
+        across accounts with the same period.
+        """
+        return None
+
+    def cache_key(self) -> tuple:
+        """Identity of this strategy and its rates, for caching computed interest."""
+        return (self.strategy_id or type(self).__name__, id(self))
+
+    def calculate_interest_curve(self, account: Account, dates: Sequence[date]) -> List[float]:
+        """
+        Compute the interest that would be earned as of each date in `dates`,
+        without modifying the account. Strategies with a closed form override this.
+        """
+        return [self.calculate_interest(account, d) for d in dates]
+
 
 
@@ -1,7 +1,7 @@
 # domain/interest/limit_account.py
 from domain.accounts.create_accounts import Account
 from domain.interest.limits_constraint import LimitConstraint 
-from datetime import date
+from domain.clock import get_clock, utc_date
 
 class LimitedAccount(Account):
     """
@@ -19,17 +19,25 @@ class LimitedAccount(Account):
         self._constraint = constraint
 
     def deposit(self, amount: float):
-        today = date.today()
-        self._constraint.check(amount, today)
-        self._base.deposit(amount)
-        self._constraint.record(amount, today)
+        at = get_clock().now()
+        today = utc_date(at)
+        self._constraint.try_consume(amount, today, at)
+        try:
+            self._base.deposit(amount)
+        except Exception:
+            self._constraint.release(amount, today, at)
+            raise
         self.balance = self._base.balance
 
     def withdraw(self, amount: float):
-        today = date.today()
-        self._constraint.check(amount, today)
-        self._base.withdraw(amount)
-        self._constraint.record(amount, today)
+        at = get_clock().now()
+        today = utc_date(at)
+        self._constraint.try_consume(amount, today, at)
+        try:
+            self._base.withdraw(amount)
+        except Exception:
+            self._constraint.release(amount, today, at)
+            raise
         self.balance = self._base.balance
 
     def account_type(self) -> str:
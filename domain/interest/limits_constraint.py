@@ -1,6 +1,37 @@
 # domain/interest/limit_constraint.py
-from dataclasses import dataclass
-from datetime import date
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from threading import Lock
+from domain.clock import get_clock
+from domain.interest.rolling_window import RollingWindowCounter
+
+ROLLING_24H_SECONDS = 24 * 3600
+ROLLING_30D_SECONDS = 30 * 24 * 3600
+# 15-minute buckets for the 24-hour window, 3-hour buckets for the 30-day window
+ROLLING_24H_BUCKETS = 96
+ROLLING_30D_BUCKETS = 240
+
+
+class LimitEpochs:
+    """
+    Global day and month counters. A scheduled reset only bumps a counter;
+    each constraint clears its own usage the next time it is touched.
+    """
+    def __init__(self):
+        self.day = 0
+        self.month = 0
+        self._lock = Lock()
+
+    def advance_day(self) -> None:
+        with self._lock:
+            self.day += 1
+
+    def advance_month(self) -> None:
+        with self._lock:
+            self.month += 1
+
+
+DEFAULT_LIMIT_EPOCHS = LimitEpochs()
 
 
 @dataclass
@@ -10,9 +41,44 @@ class LimitConstraint:
     daily_used: float = 0.0
     monthly_used: float = 0.0
     last_record_date: date | None = None
+    rolling_24h_limit: float | None = None
+    rolling_30d_limit: float | None = None
+    _rolling_24h: RollingWindowCounter | None = field(default=None, init=False, repr=False, compare=False)
+    _rolling_30d: RollingWindowCounter | None = field(default=None, init=False, repr=False, compare=False)
+    epochs: LimitEpochs = field(default=DEFAULT_LIMIT_EPOCHS, repr=False, compare=False)
+    _day_epoch: int = field(default=0, init=False, repr=False, compare=False)
+    _month_epoch: int = field(default=0, init=False, repr=False, compare=False)
 
+    def __post_init__(self):
+        self._day_epoch = self.epochs.day
+        self._month_epoch = self.epochs.month
+        # ring buffers are only allocated for the windows that are limited
+        if self.rolling_24h_limit is not None:
+            self._rolling_24h = RollingWindowCounter(ROLLING_24H_SECONDS, ROLLING_24H_BUCKETS)
+        if self.rolling_30d_limit is not None:
+            self._rolling_30d = RollingWindowCounter(ROLLING_30D_SECONDS, ROLLING_30D_BUCKETS)
 
-    def check(self, amount: float, on_date: date) -> None:
+    def refresh(self) -> None:
+        """Apply any daily/monthly reset that happened since this constraint was last touched."""
+        if self._day_epoch != self.epochs.day:
+            self.daily_used = 0.0
+            self._day_epoch = self.epochs.day
+        if self._month_epoch != self.epochs.month:
+            self.monthly_used = 0.0
+            self._month_epoch = self.epochs.month
+
+    def rolling_24h_used(self, at: datetime | None = None) -> float:
+        if self._rolling_24h is None:
+            return 0.0
+        return self._rolling_24h.total(at or get_clock().now())
+
+    def rolling_30d_used(self, at: datetime | None = None) -> float:
+        if self._rolling_30d is None:
+            return 0.0
+        return self._rolling_30d.total(at or get_clock().now())
+
+    def check(self, amount: float, on_date: date, at: datetime | None = None) -> None:
+        self.refresh()
         # reset counters if day or month changed
         if self.last_record_date != on_date:
             if self.last_record_date is None or on_date.month != self.last_record_date.month:
@@ -23,13 +89,49 @@ class LimitConstraint:
             raise ValueError("Daily limit exceeded")
         if self.monthly_limit is not None and self.monthly_used + amount > self.monthly_limit:
             raise ValueError("Monthly limit exceeded")
+        if self._rolling_24h is not None or self._rolling_30d is not None:
+            at = at or get_clock().now()
+            if self._rolling_24h is not None and self._rolling_24h.total(at) + amount > self.rolling_24h_limit:
+                raise ValueError("Rolling 24-hour limit exceeded")
+            if self._rolling_30d is not None and self._rolling_30d.total(at) + amount > self.rolling_30d_limit:
+                raise ValueError("Rolling 30-day limit exceeded")
 
-    def record(self, amount: float, on_date: date) -> None:
+    def record(self, amount: float, on_date: date, at: datetime | None = None) -> None:
         # assume check already passed
+        self.refresh()
         if self.last_record_date != on_date:
             if self.last_record_date is None or on_date.month != self.last_record_date.month:
                 self.monthly_used = 0.0
             self.daily_used = 0.0
             self.last_record_date = on_date
         self.daily_used += amount
-        self.monthly_used += amount
\ No newline at end of file
+        self.monthly_used += amount
+        if self._rolling_24h is not None or self._rolling_30d is not None:
+            at = at or get_clock().now()
+            if self._rolling_24h is not None:
+                self._rolling_24h.add(amount, at)
+            if self._rolling_30d is not None:
+                self._rolling_30d.add(amount, at)
+
+    def try_consume(self, amount: float, on_date: date, at: datetime | None = None) -> None:
+        """Check and record in one step; raises ValueError and records nothing on violation."""
+        at = at or get_clock().now()
+        self.check(amount, on_date, at)
+        self.record(amount, on_date, at)
+
+    def release(self, amount: float, on_date: date, at: datetime | None = None) -> None:
+        """Undo a consume whose operation failed afterwards."""
+        self.refresh()
+        if self.last_record_date == on_date:
+            self.daily_used = max(self.daily_used - amount, 0.0)
+            self.monthly_used = max(self.monthly_used - amount, 0.0)
+        elif self.last_record_date is not None and (on_date.year, on_date.month) == (
+            self.last_record_date.year, self.last_record_date.month
+        ):
+            self.monthly_used = max(self.monthly_used - amount, 0.0)
+        if self._rolling_24h is not None or self._rolling_30d is not None:
+            at = at or get_clock().now()
+            if self._rolling_24h is not None:
+                self._rolling_24h.add(-amount, at)
+            if self._rolling_30d is not None:
+                self._rolling_30d.add(-amount, at)
@@ -0,0 +1,123 @@
+# domain/interest/rate_schedule.py
+from bisect import bisect_right
+from datetime import date
+from threading import Lock
+from typing import Iterable, List, Tuple
+
+
+class RateSchedule:
+    """
+    Versioned history of annual rates, each effective from a given date.
+    Boundaries are kept as a sorted ordinal array with prefix sums of
+    rate-days, so accrual over any period is O(log n) in the number of
+    rate changes.
+    """
+    def __init__(self, entries: Iterable[Tuple[date, float]] = (), base_rate: float = 0.0):
+        # base_rate applies before the first effective-from date
+        self._base_rate = base_rate
+        self._lock = Lock()
+        self.version = 0
+        self._table = self._build(sorted(entries, key=lambda e: e[0]))
+
+    @classmethod
+    def constant(cls, rate: float) -> "RateSchedule":
+        return cls(base_rate=rate)
+
+    @staticmethod
+    def _build(entries: List[Tuple[date, float]]):
+        starts: List[int] = []
+        rates: List[float] = []
+        for effective_from, rate in entries:
+            ordinal = effective_from.toordinal()
+            if starts and starts[-1] == ordinal:
+                # a later entry for the same date replaces the earlier one
+                rates[-1] = rate
+            else:
+                starts.append(ordinal)
+                rates.append(rate)
+        # cumulative rate-days from the first boundary up to each boundary
+        cumulative = [0.0]
+        for i in range(1, len(starts)):
+            cumulative.append(cumulative[-1] + rates[i - 1] * (starts[i] - starts[i - 1]))
+        return starts, rates, cumulative
+
+    def add_rate(self, rate: float, effective_from: date) -> int:
+        """Record a new rate version; returns the new schedule version."""
+        with self._lock:
+            starts, rates, _ = self._table
+            entries = [(date.fromordinal(s), r) for s, r in zip(starts, rates)]
+            entries.append((effective_from, rate))
+            # stable sort keeps the new entry last among equal dates
+            self._table = self._build(sorted(entries, key=lambda e: e[0]))
+            self.version += 1
+            return self.version
+
+    def __getstate__(self):
+        # the lock is process-local; schedules are shipped to worker processes
+        return {"base_rate": self._base_rate, "version": self.version, "table": self._table}
+
+    def __setstate__(self, state):
+        self._base_rate = state["base_rate"]
+        self.version = state["version"]
+        self._table = state["table"]
+        self._lock = Lock()
+
+    def shifted(self, delta: float) -> "RateSchedule":
+        """Copy of this schedule with `delta` added to every rate."""
+        shifted = RateSchedule(
+            [(d, rate + delta) for d, rate in self.entries()],
+            base_rate=self._base_rate + delta,
+        )
+        shifted.version = self.version
+        return shifted
+
+    @property
+    def base_rate(self) -> float:
+        return self._base_rate
+
+    def entries(self) -> List[Tuple[date, float]]:
+        starts, rates, _ = self._table
+        return [(date.fromordinal(s), r) for s, r in zip(starts, rates)]
+
+    def rate_on(self, on_date: date) -> float:
+        starts, rates, _ = self._table
+        i = bisect_right(starts, on_date.toordinal()) - 1
+        return rates[i] if i >= 0 else self._base_rate
+
+    @property
+    def current_rate(self) -> float:
+        _, rates, _ = self._table
+        return rates[-1] if rates else self._base_rate
+
+    def _rate_days_to(self, table, ordinal: int) -> float:
+        # integral of the rate from the first boundary up to `ordinal`
+        starts, rates, cumulative = table
+        i = bisect_right(starts, ordinal) - 1
+        if i < 0:
+            return self._base_rate * (ordinal - starts[0])
+        return cumulative[i] + rates[i] * (ordinal - starts[i])
+
+    def rate_days(self, start: date, end: date) -> float:
+        """Sum of the daily annual rate over [start, end): rate * days per segment."""
+        table = self._table
+        if not table[0]:
+            return self._base_rate * (end.toordinal() - start.toordinal())
+        return self._rate_days_to(table, end.toordinal()) - self._rate_days_to(table, start.toordinal())
+
+    def segments(self, start: date, end: date) -> List[Tuple[date, date, float]]:
+        """Split [start, end) into (segment_start, segment_end, rate) pieces."""
+        starts, rates, _ = self._table
+        lo, hi = start.toordinal(), end.toordinal()
+        if hi <= lo:
+            return []
+        i = bisect_right(starts, lo) - 1
+        pieces = []
+        cursor = lo
+        while cursor < hi:
+            nxt = starts[i + 1] if i + 1 < len(starts) else hi
+            seg_end = min(nxt, hi)
+            rate = rates[i] if i >= 0 else self._base_rate
+            pieces.append((date.fromordinal(cursor), date.fromordinal(seg_end), rate))
+            cursor = seg_end
+            i += 1
+        return pieces
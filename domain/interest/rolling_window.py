@@ -0,0 +1,55 @@
+# domain/interest/rolling_window.py
+from array import array
+from datetime import datetime
+
+
+class RollingWindowCounter:
+    """
+    Sum of amounts recorded over a sliding time window, stored in a fixed
+    ring of time buckets. Memory is bounded by the bucket count and each
+    add/total is O(1) amortised, however many amounts are recorded.
+
+    The window is quantised to whole buckets: an amount counts until its
+    bucket falls out of the window, so usage can be over-stated by at most
+    one bucket span, never under-stated.
+    """
+    __slots__ = ("window_seconds", "bucket_seconds", "_sums", "_head", "_total")
+
+    def __init__(self, window_seconds: float, buckets: int):
+        if window_seconds <= 0 or buckets <= 0:
+            raise ValueError("Window and bucket count must be positive")
+        self.window_seconds = window_seconds
+        self.bucket_seconds = window_seconds / buckets
+        # one slot more than the window holds: the newest bucket is partial,
+        # so the oldest bucket still overlapping the window must survive it
+        self._sums = array('d', bytes(8 * (buckets + 1)))
+        # absolute index of the newest bucket, None until the first record
+        self._head = None
+        self._total = 0.0
+
+    def _advance(self, at: datetime) -> int:
+        index = int(at.timestamp() // self.bucket_seconds)
+        head = self._head
+        if head is None:
+            self._head = index
+        elif index > head:
+            size = len(self._sums)
+            # clear the buckets that slid out; at most one full ring
+            for step in range(1, min(index - head, size) + 1):
+                slot = (head + step) % size
+                self._total -= self._sums[slot]
+                self._sums[slot] = 0.0
+            self._head = index
+            if index - head >= size:
+                self._total = 0.0
+        # an earlier timestamp than the newest bucket is folded into it
+        return self._head
+
+    def total(self, at: datetime) -> float:
+        self._advance(at)
+        return max(self._total, 0.0)
+
+    def add(self, amount: float, at: datetime) -> None:
+        head = self._advance(at)
+        self._sums[head % len(self._sums)] += amount
+        self._total += amount
@@ -1,12 +1,6 @@
-from domain.interest.interest_strategy import InterestStrategy
-from domain.accounts.create_accounts import Account
-from datetime import date
+from domain.interest.scheduled_interest import ScheduledInterestStrategy
 
 
-class SavingsInterestStrategy(InterestStrategy):
-    def __init__(self, annual_rate: float):
-        self.annual_rate = annual_rate
-
-    def calculate_interest(self, account: Account, as_of: date) -> float:
-        days = (as_of - account.last_interest_date).days
-        return account.balance * self.annual_rate * days / 365
\ No newline at end of file
+class SavingsInterestStrategy(ScheduledInterestStrategy):
+    strategy_id = "savings"
+    rate_multiplier = 1.0
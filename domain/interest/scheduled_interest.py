@@ -0,0 +1,57 @@
+# domain/interest/scheduled_interest.py
+from datetime import date
+from typing import List, Sequence
+from domain.accounts.create_accounts import Account
+from domain.interest.day_count import ACT_365, ACT_360, DAY_COUNT_CONVENTIONS, BusinessCalendar, default_calendar
+from domain.interest.interest_strategy import InterestStrategy
+from domain.interest.rate_schedule import RateSchedule
+
+
+class ScheduledInterestStrategy(InterestStrategy):
+    """
+    Simple interest on the balance using an effective-dated rate schedule
+    and a day-count convention. Subclasses set the share of the rate earned.
+    """
+    rate_multiplier = 1.0
+
+    def __init__(self, annual_rate: float = 0.0, schedule: RateSchedule = None,
+                 day_count: str = ACT_365, calendar: BusinessCalendar = None):
+        if day_count not in DAY_COUNT_CONVENTIONS:
+            raise ValueError(f"Unknown day count convention: {day_count}")
+        self.schedule = schedule or RateSchedule.constant(annual_rate)
+        self.day_count = day_count
+        self.calendar = calendar or default_calendar()
+
+    @property
+    def annual_rate(self) -> float:
+        return self.schedule.current_rate
+
+    def with_schedule(self, schedule: RateSchedule) -> "ScheduledInterestStrategy":
+        """Same strategy and conventions, different rates."""
+        return type(self)(schedule=schedule, day_count=self.day_count, calendar=self.calendar)
+
+    def cache_key(self) -> tuple:
+        # a new rate version changes the key, so cached previews are not reused
+        return (self.strategy_id, id(self.schedule), self.schedule.version, self.day_count)
+
+    def accrual_factor(self, start: date, end: date) -> float:
+        if end < start:
+            return -self.accrual_factor(end, start)
+        if self.day_count == ACT_365:
+            accrued = self.schedule.rate_days(start, end) / 365
+        elif self.day_count == ACT_360:
+            accrued = self.schedule.rate_days(start, end) / 360
+        else:
+            # Each rate segment accrues only over the days it was in effect
+            accrued = sum(
+                rate * self.calendar.year_fraction(seg_start, seg_end, self.day_count)
+                for seg_start, seg_end, rate in self.schedule.segments(start, end)
+            )
+        return accrued * self.rate_multiplier
+
+    def calculate_interest(self, account: Account, as_of: date) -> float:
+        return account.balance * self.accrual_factor(account.last_interest_date, as_of)
+
+    def calculate_interest_curve(self, account: Account, dates: Sequence[date]) -> List[float]:
+        balance, start = account.balance, account.last_interest_date
+        return [balance * self.accrual_factor(start, d) for d in dates]
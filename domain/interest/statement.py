@@ -1,6 +1,7 @@
 # domain/interest/statement.py
 from dataclasses import dataclass
 from datetime import date
+from typing import Iterable
 from domain.accounts.transaction import Transaction
 
 @dataclass
@@ -11,5 +12,6 @@ class MonthlyStatement:
     opening_balance: float
     closing_balance: float
     interest_earned: float
-    transactions: list[Transaction]
+    # a list, or a re-iterable lazy view when the statement is streamed
+    transactions: Iterable[Transaction]
     generated_on: date
@@ -1,6 +1,12 @@
-from typing import Dict
+from datetime import datetime
+from itertools import count
+from threading import Event, Lock, Thread
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from application.services import AccountRepositoryInterface
 from domain.accounts.create_accounts import Account
+from domain.accounts.snapshot import AccountSnapshot
+from domain.accounts.striped_account import StripedAccount
+from domain.clock import utc_date
 from domain.interest.limits_constraint import LimitConstraint
 
 
@@ -9,9 +15,21 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
         # key: account_id, value: Account instance
         self._accounts: Dict[str, Account] = {}
         self._constraints: Dict[str, LimitConstraint] = {}
+        # owner -> account IDs (a dict used as an insertion-ordered set)
+        self._by_owner: Dict[str, Dict[str, None]] = {}
+        # bumped on every write so readers can detect stale cached state
+        self._versions: Dict[str, int] = {}
+        self._version_counter = count(1)
+        # per-account locks make limit check-and-record and balance updates atomic
+        self._limit_locks: Dict[str, Lock] = {}
+        self._balance_locks: Dict[str, Lock] = {}
+        self._locks_guard = Lock()
 
     def create_account(self, account: Account) -> str:
+        previous = self._accounts.get(account.account_id)
         self._accounts[account.account_id] = account
+        self._reindex_owner(account, previous)
+        self._bump_version(account.account_id)
         return account.account_id
 
     def get_account(self, account_id: str) -> Account:
@@ -20,10 +38,17 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
             raise KeyError(f"Account {account_id} not found")
         return account
 
+    def get_accounts(self, account_ids: List[str]) -> Dict[str, Account]:
+        accounts = self._accounts
+        return {i: accounts[i] for i in account_ids if i in accounts}
+
     def update_account(self, account: Account) -> None:
-        if account.account_id not in self._accounts:
+        previous = self._accounts.get(account.account_id)
+        if previous is None:
             raise KeyError(f"Account {account.account_id} not found")
         self._accounts[account.account_id] = account
+        self._reindex_owner(account, previous)
+        self._bump_version(account.account_id)
     
     def update_accounts(self, source: Account, dest: Account) -> None:
 
@@ -34,14 +59,147 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
          
         if source.account_id not in self._accounts or dest.account_id not in self._accounts:
             raise KeyError("One or both accounts not found")
-        self._accounts[source.account_id] = source
-        self._accounts[dest.account_id] = dest
+        for account in (source, dest):
+            previous = self._accounts[account.account_id]
+            self._accounts[account.account_id] = account
+            self._reindex_owner(account, previous)
+        self._bump_version(source.account_id)
+        self._bump_version(dest.account_id)
+
+    def close_account(self, account_id: str) -> Account:
+        account = self._accounts.pop(account_id, None)
+        if account is None:
+            raise KeyError(f"Account {account_id} not found")
+        self._unindex_owner(account.owner, account_id)
+        self._versions.pop(account_id, None)
+        self._constraints.pop(account_id, None)
+        return account
+
+    def get_accounts_by_owner(self, owner: str) -> List[Account]:
+        ids = self._by_owner.get(owner)
+        if not ids:
+            return []
+        return [self._accounts[account_id] for account_id in list(ids)]
+
+    def _reindex_owner(self, account: Account, previous: Optional[Account]) -> None:
+        if previous is not None and previous.owner != account.owner:
+            self._unindex_owner(previous.owner, account.account_id)
+        self._by_owner.setdefault(account.owner, {})[account.account_id] = None
+
+    def _unindex_owner(self, owner: str, account_id: str) -> None:
+        ids = self._by_owner.get(owner)
+        if ids is not None:
+            ids.pop(account_id, None)
+            if not ids:
+                del self._by_owner[owner]
+
+    def apply_delta(self, account_id: str, amount: float, min_balance: Optional[float] = None) -> float:
+        account = self.get_account(account_id)
+        # unguarded striped credits only contend on their own stripe; if striping
+        # was switched off meanwhile they fall through to the locked path
+        if not (min_balance is None and isinstance(account, StripedAccount)
+                and account.credit_if_live(amount)):
+            with self._lock(self._balance_locks, account_id):
+                # read under the lock so a concurrent striping swap cannot strand the update
+                account = self.get_account(account_id)
+                if min_balance is not None and account.balance + amount < min_balance:
+                    raise ValueError("Insufficient balance")
+                account.adjust_balance(amount)
+        self._bump_version(account_id)
+        return account.balance
+
+    def apply_deltas(self, account_id: str,
+                     deltas: List[Tuple[float, Optional[float]]]) -> List[Union[float, Exception]]:
+        results: List[Union[float, Exception]] = []
+        with self._lock(self._balance_locks, account_id):
+            # read under the lock so a concurrent striping swap cannot strand the update
+            account = self.get_account(account_id)
+            for amount, min_balance in deltas:
+                if min_balance is not None and account.balance + amount < min_balance:
+                    results.append(ValueError("Insufficient balance"))
+                    continue
+                account.adjust_balance(amount)
+                results.append(account.balance)
+        if any(not isinstance(r, Exception) for r in results):
+            self._bump_version(account_id)
+        return results
+
+    def apply_transfer(self, source_id: str, dest_id: str, amount: float) -> None:
+        dest = self.get_account(dest_id)
+        if isinstance(dest, StripedAccount) and dest_id != source_id:
+            # only the debit needs guarding; the credit lands on one stripe, as in apply_delta
+            with self._lock(self._balance_locks, source_id):
+                source = self.get_account(source_id)
+                if source.balance < amount:
+                    raise ValueError("Insufficient balance")
+                credited = dest.credit_if_live(amount)
+                if credited:
+                    source.adjust_balance(-amount)
+            if credited:
+                self._bump_version(source_id)
+                self._bump_version(dest_id)
+                return
+            # striping was switched off meanwhile: lock both accounts as usual
+        # lock in ID order so opposite transfers cannot deadlock
+        locks = [self._lock(self._balance_locks, i) for i in sorted({source_id, dest_id})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            source = self.get_account(source_id)
+            dest = self.get_account(dest_id)
+            if source.balance < amount:
+                raise ValueError("Insufficient balance")
+            source.adjust_balance(-amount)
+            dest.adjust_balance(amount)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+        self._bump_version(source_id)
+        self._bump_version(dest_id)
+
+    def _bump_version(self, account_id: str) -> None:
+        # next() on a shared counter is atomic, so concurrent writes never share a version
+        self._versions[account_id] = next(self._version_counter)
+
+    def get_account_version(self, account_id: str) -> int:
+        version = self._versions.get(account_id)
+        if version is None:
+            raise KeyError(f"Account {account_id} not found")
+        return version
     
+    def enable_striping(self, account_id: str, stripes: int = 8) -> None:
+        """Opt an account into striped balances; callers keep using it as a normal Account."""
+        # the swap holds the balance lock so no locked balance update runs against the old object
+        with self._lock(self._balance_locks, account_id):
+            account = self.get_account(account_id)
+            if isinstance(account, StripedAccount):
+                return
+            self._accounts[account_id] = StripedAccount(account, stripes)
+            self._bump_version(account_id)
+
+    def disable_striping(self, account_id: str) -> None:
+        with self._lock(self._balance_locks, account_id):
+            account = self.get_account(account_id)
+            if isinstance(account, StripedAccount):
+                self._accounts[account_id] = account.unstriped()
+                self._bump_version(account_id)
+
+    def consolidate_striped_accounts(self) -> int:
+        """Fold each striped account's sub-balances together; returns how many were consolidated."""
+        striped = [a for a in list(self._accounts.values()) if isinstance(a, StripedAccount)]
+        for account in striped:
+            account.consolidate()
+        return len(striped)
+
     def get_constraints(self, account_id: str) -> LimitConstraint:
         # If missing, create and persist a new constraint object
-        if account_id not in self._constraints:
-            self._constraints[account_id] = LimitConstraint()
-        return self._constraints[account_id]
+        constraint = self._constraints.get(account_id)
+        if constraint is None:
+            constraint = self._constraints.setdefault(account_id, LimitConstraint())
+        # apply any pending epoch reset before the caller reads usage
+        with self._lock(self._limit_locks, account_id):
+            constraint.refresh()
+        return constraint
 
     def save_constraints(self, account_id: str, constraint: LimitConstraint) -> None:
         self._constraints[account_id] = constraint
@@ -49,3 +207,69 @@ class InMemoryAccountRepository(AccountRepositoryInterface):
     def get_constraint_dict(self) -> Dict[str, LimitConstraint]:
         return self._constraints
 
+    def snapshot(self) -> List[AccountSnapshot]:
+        # Copy the values first so concurrent creates don't disturb iteration
+        return [
+            AccountSnapshot(a.account_id, a.account_type(), a.balance, a.last_interest_date,
+                            getattr(a.interest_strategy, "strategy_id", None))
+            for a in list(self._accounts.values())
+        ]
+
+    def _lock(self, locks: Dict[str, Lock], account_id: str) -> Lock:
+        lock = locks.get(account_id)
+        if lock is None:
+            with self._locks_guard:
+                lock = locks.setdefault(account_id, Lock())
+        return lock
+
+    def try_consume(self, account_id: str, amount: float, at: datetime) -> bool:
+        constraint = self._constraints.get(account_id)
+        if constraint is None:
+            # no limits configured for this account
+            return True
+        with self._lock(self._limit_locks, account_id):
+            constraint.try_consume(amount, utc_date(at), at)
+        return True
+
+    def release(self, account_id: str, amount: float, at: datetime) -> None:
+        constraint = self._constraints.get(account_id)
+        if constraint is None:
+            return
+        with self._lock(self._limit_locks, account_id):
+            constraint.release(amount, utc_date(at), at)
+
+    def check_constraint(self, account_id: str, amount: float, at: datetime) -> None:
+        constraint = self.get_constraints(account_id)
+        with self._lock(self._limit_locks, account_id):
+            constraint.check(amount, utc_date(at), at)
+
+    def refresh_constraints(self, account_ids: Optional[Iterable[str]] = None) -> None:
+        for account_id in list(account_ids if account_ids is not None else self._constraints):
+            constraint = self._constraints.get(account_id)
+            if constraint is not None:
+                with self._lock(self._limit_locks, account_id):
+                    constraint.refresh()
+
+
+class StripeConsolidationJob:
+    """Background thread that periodically consolidates striped accounts."""
+    def __init__(self, account_repo: InMemoryAccountRepository, interval_seconds: float = 60.0):
+        self.account_repo = account_repo
+        self.interval_seconds = interval_seconds
+        self._stop = Event()
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = Thread(target=self._run, name="stripe-consolidation", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.account_repo.consolidate_striped_accounts()
@@ -0,0 +1,220 @@
+# infrastructure/audit_log.py
+import bisect
+import gzip
+import json
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# each record is a 4-byte big-endian length followed by that many bytes of JSON
+_LENGTH = struct.Struct(">I")
+_SEGMENT = re.compile(r"^segment-(\d{6})\.log(\.gz)?$")
+INDEX_FILE = "index.tsv"
+# sealed segments are compressed as independent gzip members of this many raw bytes
+BLOCK_BYTES = 64 * 1024
+
+
+class SegmentedAuditLog:
+    """
+    Append-only audit log of transaction records. Records go into size-
+    rotated segment files; a sidecar index maps transaction_id to
+    (segment, offset) so a lookup reads one record instead of scanning.
+    Sealed segments are gzip-compressed on a background thread in
+    independent blocks, with a block map beside each, so a lookup in a
+    compressed segment decompresses at most one block (plus the tail of a
+    record that crosses into the next).
+    """
+    def __init__(self, directory: str, segment_bytes: int = 16 * 2**20, compress_sealed: bool = True):
+        if segment_bytes <= _LENGTH.size:
+            raise ValueError("Segment size is too small")
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.compress_sealed = compress_sealed
+        os.makedirs(directory, exist_ok=True)
+        self._lock = Lock()
+        self._index: Dict[str, Tuple[int, int]] = {}
+        # segment -> (raw offsets, compressed offsets) of its gzip blocks
+        self._blocks: Dict[int, Tuple[List[int], List[int]]] = {}
+        self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-compress")
+        self._load_index()
+        segments = self._segments()
+        self._segment = max(segments) if segments else 1
+        if self._segment in segments and segments[self._segment].endswith(".gz"):
+            # never append to a sealed segment
+            self._segment += 1
+        else:
+            self._truncate_torn_tail(self._path(self._segment))
+        self._file = open(self._path(self._segment), "ab")
+        self._index_file = open(os.path.join(directory, INDEX_FILE), "a", encoding="utf-8")
+        # compress anything sealed by a run that stopped before compressing it
+        if compress_sealed:
+            for number, name in segments.items():
+                if number != self._segment and not name.endswith(".gz"):
+                    self._compressor.submit(self._compress, number)
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.log")
+
+    def _segments(self) -> Dict[int, str]:
+        found = {}
+        for name in os.listdir(self.directory):
+            m = _SEGMENT.match(name)
+            if m:
+                number = int(m.group(1))
+                # the compressed copy wins once it exists
+                if number not in found or name.endswith(".gz"):
+                    found[number] = name
+        return found
+
+    @staticmethod
+    def _truncate_torn_tail(path: str) -> None:
+        # a crash mid-append leaves a partial record; appending after it would
+        # hide every later record from iteration, so cut back to the last whole one
+        if not os.path.exists(path):
+            return
+        with open(path, "r+b") as f:
+            end = 0
+            while True:
+                header = f.read(_LENGTH.size)
+                if len(header) < _LENGTH.size:
+                    break
+                (length,) = _LENGTH.unpack(header)
+                if len(f.read(length)) < length:
+                    break
+                end = f.tell()
+            f.truncate(end)
+
+    def _load_index(self) -> None:
+        path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(path):
+            return
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                # a torn last line from a crash is ignored
+                if len(parts) == 3 and parts[2].isdigit():
+                    self._index[parts[0]] = (int(parts[1]), int(parts[2]))
+
+    def append(self, record: Dict[str, Any]) -> Tuple[int, int]:
+        """Write one record (it must carry a transaction_id); returns (segment, offset)."""
+        transaction_id = str(record["transaction_id"])
+        payload = json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+        with self._lock:
+            offset = self._file.tell()
+            if offset and offset + _LENGTH.size + len(payload) > self.segment_bytes:
+                self._rotate()
+                offset = 0
+            self._file.write(_LENGTH.pack(len(payload)) + payload)
+            self._file.flush()
+            location = (self._segment, offset)
+            self._index[transaction_id] = location
+            self._index_file.write(f"{transaction_id}\t{location[0]}\t{location[1]}\n")
+            self._index_file.flush()
+        return location
+
+    def _rotate(self) -> None:
+        self._file.close()
+        sealed = self._segment
+        self._segment += 1
+        self._file = open(self._path(self._segment), "ab")
+        if self.compress_sealed:
+            self._compressor.submit(self._compress, sealed)
+
+    def _compress(self, segment: int) -> None:
+        raw = self._path(segment)
+        tmp = raw + ".gz.tmp"
+        blocks = []
+        with open(raw, "rb") as src, open(tmp, "wb") as dst:
+            raw_offset = 0
+            while True:
+                chunk = src.read(BLOCK_BYTES)
+                if not chunk:
+                    break
+                blocks.append(f"{raw_offset}\t{dst.tell()}\n")
+                # concatenated gzip members still read back as one stream
+                dst.write(gzip.compress(chunk))
+                raw_offset += len(chunk)
+        # the block map is in place before the compressed segment replaces the raw one
+        with open(raw + ".blocks.tmp", "w", encoding="utf-8") as f:
+            f.writelines(blocks)
+        os.replace(raw + ".blocks.tmp", raw + ".blocks")
+        os.replace(tmp, raw + ".gz")
+        os.remove(raw)
+
+    def get(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        location = self._index.get(transaction_id)
+        if location is None:
+            return None
+        segment, offset = location
+        try:
+            f = open(self._path(segment), "rb")
+        except FileNotFoundError:
+            # compressed since it was sealed: decompress only the block holding the record
+            raw_offset, gz_offset = self._block(segment, offset)
+            with open(self._path(segment) + ".gz", "rb") as source:
+                source.seek(gz_offset)
+                with gzip.GzipFile(fileobj=source, mode="rb") as f:
+                    f.seek(offset - raw_offset)
+                    return self._read_record(f)
+        with f:
+            f.seek(offset)
+            return self._read_record(f)
+
+    @staticmethod
+    def _read_record(f) -> Dict[str, Any]:
+        (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+        return json.loads(f.read(length))
+
+    def _block(self, segment: int, offset: int) -> Tuple[int, int]:
+        """(raw offset, compressed offset) of the gzip block containing `offset`."""
+        blocks = self._blocks.get(segment)
+        if blocks is None:
+            raw_offsets, gz_offsets = [], []
+            try:
+                with open(self._path(segment) + ".blocks", encoding="utf-8") as f:
+                    for line in f:
+                        raw_offset, gz_offset = line.split("\t")
+                        raw_offsets.append(int(raw_offset))
+                        gz_offsets.append(int(gz_offset))
+            except FileNotFoundError:
+                # compressed as a single stream: decompress from the start
+                raw_offsets, gz_offsets = [0], [0]
+            blocks = self._blocks[segment] = (raw_offsets, gz_offsets)
+        raw_offsets, gz_offsets = blocks
+        i = bisect.bisect_right(raw_offsets, offset) - 1
+        return raw_offsets[i], gz_offsets[i]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Every record in write order."""
+        for number in sorted(self._segments()):
+            with self._open_segment(number) as f:
+                while True:
+                    header = f.read(_LENGTH.size)
+                    if len(header) < _LENGTH.size:
+                        break
+                    (length,) = _LENGTH.unpack(header)
+                    payload = f.read(length)
+                    if len(payload) < length:
+                        # torn write at the end of a crashed segment
+                        break
+                    yield json.loads(payload)
+
+    def _open_segment(self, segment: int):
+        try:
+            return open(self._path(segment), "rb")
+        except FileNotFoundError:
+            # compressed since it was sealed
+            return gzip.open(self._path(segment) + ".gz", "rb")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Close the active segment and wait for pending compression."""
+        with self._lock:
+            self._file.close()
+            self._index_file.close()
+        self._compressor.shutdown(wait=True)
@@ -1,6 +1,7 @@
 # infrastructure/week3/csv_statement_adapter.py
 import csv
 from io import StringIO
+from typing import Iterator
 from domain.interest.statement import MonthlyStatement
 
 class CsvStatementAdapter:
@@ -8,15 +9,30 @@ class CsvStatementAdapter:
     Adapter to export a MonthlyStatement to CSV format.
     """
     def render(self, statement: MonthlyStatement) -> bytes:
+        return b"".join(self.iter_render(statement))
+
+    def iter_render(self, statement: MonthlyStatement, rows_per_chunk: int = 256) -> Iterator[bytes]:
+        """Yield the CSV as encoded chunks, so only `rows_per_chunk` rows are buffered at a time."""
         buffer = StringIO()
         writer = csv.writer(buffer)
+        for i, row in enumerate(self._rows(statement), 1):
+            writer.writerow(row)
+            if i % rows_per_chunk == 0:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+        tail = buffer.getvalue()
+        if tail:
+            yield tail.encode('utf-8')
+
+    def _rows(self, statement: MonthlyStatement) -> Iterator[list]:
         # Summary header
-        writer.writerow([
+        yield [
             'account_id', 'year', 'month',
             'opening_balance', 'closing_balance',
             'interest_earned', 'generated_on'
-        ])
-        writer.writerow([
+        ]
+        yield [
             statement.account_id,
             statement.year,
             statement.month,
@@ -24,16 +40,15 @@ class CsvStatementAdapter:
             statement.closing_balance,
             statement.interest_earned,
             statement.generated_on.isoformat()
-        ])
-        writer.writerow([])
+        ]
+        yield []
 
         # Transaction detail header
-        writer.writerow(['transaction_id', 'transaction_type', 'amount', 'timestamp'])
+        yield ['transaction_id', 'transaction_type', 'amount', 'timestamp']
         for tx in statement.transactions:
-            writer.writerow([
+            yield [
                 tx.transaction_id,
                 tx.transaction_type,
                 tx.amount,
                 tx.timestamp.isoformat()
-            ])
-        return buffer.getvalue().encode('utf-8')
\ No newline at end of file
+            ]
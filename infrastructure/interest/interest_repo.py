@@ -1,21 +1,53 @@
 import json
 import os
+from datetime import date
+from typing import Dict
+from domain.interest.day_count import ACT_365, BusinessCalendar
 from domain.interest.interest_strategy import InterestStrategy
+from domain.interest.rate_schedule import RateSchedule
 from domain.interest.savings_interest import SavingsInterestStrategy
 from domain.interest.checking_interest import CheckingInterestStrategy
 
 from application.interest.interest_strategy_interface import InterestStrategyRepositoryInterface
 
+# Strategy classes by ID; each takes a RateSchedule
+STRATEGY_TYPES = {
+    "savings": SavingsInterestStrategy,
+    "checking": CheckingInterestStrategy,
+}
+
+
+def build_strategy(strategy_id: str, schedule: RateSchedule, day_count: str = ACT_365,
+                   calendar: BusinessCalendar = None) -> InterestStrategy:
+    strategy_cls = STRATEGY_TYPES.get(strategy_id)
+    if strategy_cls is None:
+        raise ValueError(f"Strategy not implemented for: {strategy_id}")
+    return strategy_cls(schedule=schedule, day_count=day_count, calendar=calendar)
+
 
 class ConfigInterestStrategyRepository(InterestStrategyRepositoryInterface):
     """
     Retrieves InterestStrategy instances based on a strategy ID,
     loading rates from an external JSON configuration file.
+
+    A rate is either a plain number (constant rate), a list of
+    {"effective_from": "YYYY-MM-DD", "rate": 0.05} entries, or an object
+    {"rates": <number or list>, "day_count": "ACT/360"}.
     """
-    def __init__(self, config_path: str = None):
+    def __init__(self, config_path: str = None, calendar: BusinessCalendar = None):
         path_env = os.getenv("INTEREST_CONFIG_PATH")
         self.config_path = config_path or path_env or "config/interest_rates.json"
+        self.calendar = calendar
         self._rates = self._load_rates()
+        self._schedules: Dict[str, RateSchedule] = {}
+        self._day_counts: Dict[str, str] = {}
+        for strategy_id, value in self._rates.items():
+            if isinstance(value, dict):
+                self._day_counts[strategy_id] = value.get("day_count", ACT_365)
+                value = value.get("rates")
+            self._schedules[strategy_id] = self._parse_schedule(strategy_id, value)
+        # one strategy instance per ID, so batch runs can share accrual factors
+        self._strategies: Dict[str, InterestStrategy] = {}
         
     def _load_rates(self) -> dict:
         if not os.path.exists(self.config_path):
@@ -24,12 +56,41 @@ class ConfigInterestStrategyRepository(InterestStrategyRepositoryInterface):
             data = json.load(f)
         return data
 
-    def get_strategy(self, strategy_id: str) -> InterestStrategy:
-        rate = self._rates.get(strategy_id)
-        if rate is None:
+    @staticmethod
+    def _parse_schedule(strategy_id: str, value) -> RateSchedule:
+        if isinstance(value, (int, float)):
+            return RateSchedule.constant(float(value))
+        if isinstance(value, list):
+            return RateSchedule([
+                (date.fromisoformat(entry["effective_from"]), float(entry["rate"]))
+                for entry in value
+            ])
+        raise ValueError(f"Invalid rate configuration for: {strategy_id}")
+
+    def get_rate_schedule(self, strategy_id: str) -> RateSchedule:
+        schedule = self._schedules.get(strategy_id)
+        if schedule is None:
             raise ValueError(f"Unknown interest strategy: {strategy_id}")
-        if strategy_id == "savings":
-            return SavingsInterestStrategy(rate)
-        if strategy_id == "checking":
-            return CheckingInterestStrategy(rate)
-        raise ValueError(f"Strategy not implemented for: {strategy_id}")
\ No newline at end of file
+        return schedule
+
+    def get_rate_schedules(self) -> Dict[str, RateSchedule]:
+        return dict(self._schedules)
+
+    def set_rate(self, strategy_id: str, rate: float, effective_from: date) -> int:
+        # Strategies share the schedule object, so they see the new version immediately
+        if strategy_id not in self._schedules:
+            self._schedules[strategy_id] = RateSchedule()
+        return self._schedules[strategy_id].add_rate(rate, effective_from)
+
+    def get_strategy(self, strategy_id: str) -> InterestStrategy:
+        strategy = self._strategies.get(strategy_id)
+        if strategy is not None:
+            return strategy
+        strategy = build_strategy(
+            strategy_id,
+            self.get_rate_schedule(strategy_id),
+            self._day_counts.get(strategy_id, ACT_365),
+            self.calendar,
+        )
+        self._strategies[strategy_id] = strategy
+        return strategy
@@ -1,5 +1,6 @@
 # infrastructure/week3/implementations.py
-from datetime import date
+from datetime import date, timedelta
+from typing import List, Tuple
 from domain.accounts.create_accounts import Account
 from application.interest.interest_strategy_interface import InterestStrategyRepositoryInterface
 from application.interest.interest_service import InterestServiceInterface
@@ -7,6 +8,10 @@ from application.services import AccountRepositoryInterface
 from domain.interest.interest_service import InterestService as DomainInterestService
 
 from infrastructure.account_repo import InMemoryAccountRepository
+from infrastructure.interest.preview_cache import InterestPreviewCache
+
+# Upper bound on points returned by a single projection (10 years of daily points)
+MAX_PROJECTION_POINTS = 3660
 
 
 class InterestServiceImpl(InterestServiceInterface):
@@ -17,11 +22,14 @@ class InterestServiceImpl(InterestServiceInterface):
     def __init__(
         self,
         account_repo: AccountRepositoryInterface,
-        strategy_repo: InterestStrategyRepositoryInterface
+        strategy_repo: InterestStrategyRepositoryInterface,
+        preview_cache: InterestPreviewCache = None
     ):
         # Repositories are injected, no new() inside methods
         self.account_repo = account_repo
         self.strategy_repo = strategy_repo
+        # Optional memoization of calculate_interest_preview
+        self.preview_cache = preview_cache
 
     def apply_interest_to_account(self, account_id: str, as_of: date) -> float:
         # Use repository to retrieve account
@@ -37,13 +45,63 @@ class InterestServiceImpl(InterestServiceInterface):
         return interest_amount
 
     def apply_interest_batch(self, account_ids, as_of: date):
-        return [self.apply_interest_to_account(aid, as_of) for aid in account_ids]
+        # Accounts sharing a strategy and accrual start share one segment lookup
+        factors = {}
+        results = []
+        for aid in account_ids:
+            account: Account = self.account_repo.get_account(aid)
+            if not account.interest_strategy:
+                account.interest_strategy = self.strategy_repo.get_strategy(account.account_type())
+            strategy = account.interest_strategy
+            key = (id(strategy), account.last_interest_date)
+            if key not in factors:
+                factors[key] = (strategy, strategy.accrual_factor(account.last_interest_date, as_of))
+            factor = factors[key][1]
+            if factor is None:
+                interest = DomainInterestService.apply_interest(account, as_of)
+            else:
+                interest = DomainInterestService.post_interest(account, account.balance * factor, as_of)
+            self.account_repo.update_account(account)
+            results.append(interest)
+        return results
 
     def calculate_interest_preview(self, account_id: str, as_of: date) -> float:
+        cache = self.preview_cache
+        if cache is None:
+            account: Account = self.account_repo.get_account(account_id)
+            strategy = account.interest_strategy or self.strategy_repo.get_strategy(account.account_type())
+            # Do not modify account state
+            return strategy.calculate_interest(account, as_of)
+
+        version = self.account_repo.get_account_version(account_id)
+        strategy = cache.resolved_strategy(account_id, version)
+        if strategy is not None:
+            interest = cache.get((account_id, version, strategy.cache_key(), as_of))
+            if interest is not None:
+                return interest
+        account = self.account_repo.get_account(account_id)
+        if strategy is None:
+            strategy = account.interest_strategy or self.strategy_repo.get_strategy(account.account_type())
+            cache.remember_strategy(account_id, version, strategy)
+        interest = strategy.calculate_interest(account, as_of)
+        cache.put((account_id, version, strategy.cache_key(), as_of), interest)
+        return interest
+
+    def calculate_interest_projection(
+        self, account_id: str, start: date, end: date, step_days: int = 1
+    ) -> List[Tuple[date, float]]:
+        if step_days <= 0:
+            raise ValueError("Projection step must be a positive number of days")
+        if end < start:
+            raise ValueError("Projection end date must not be before start date")
+        points = (end - start).days // step_days + 1
+        if points > MAX_PROJECTION_POINTS:
+            raise ValueError(f"Projection too large: {points} points (max {MAX_PROJECTION_POINTS})")
         account: Account = self.account_repo.get_account(account_id)
         strategy = account.interest_strategy or self.strategy_repo.get_strategy(account.account_type())
-        # Do not modify account state
-        return strategy.calculate_interest(account, as_of)
+        dates = [start + timedelta(days=i * step_days) for i in range(points)]
+        # Whole curve in one pass; account state is left untouched
+        return list(zip(dates, strategy.calculate_interest_curve(account, dates)))
 
     def set_interest_strategy(self, account_id: str, strategy_id: str) -> None:
         account: Account = self.account_repo.get_account(account_id)
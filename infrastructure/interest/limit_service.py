@@ -1,44 +1,70 @@
 from typing import Dict
 from application.interest.limit_check import LimitEnforcementServiceInterface
-from domain.interest.limits_constraint import LimitConstraint
-from datetime import date
+from domain.interest.limits_constraint import DEFAULT_LIMIT_EPOCHS, LimitConstraint, LimitEpochs
+from datetime import datetime
+from domain.clock import Clock, get_clock
 from application.services import AccountRepositoryInterface
 
 class LimitEnforcementServiceImpl(LimitEnforcementServiceInterface):
 
 
 
-    def __init__(self, account_repo: AccountRepositoryInterface):
+    def __init__(self, account_repo: AccountRepositoryInterface, epochs: LimitEpochs = None,
+                 clock: Clock = None):
         self.account_repo: AccountRepositoryInterface = account_repo
+        # Resets bump these counters; constraints clear themselves lazily
+        self.epochs = epochs or DEFAULT_LIMIT_EPOCHS
+        # None follows the process-wide clock
+        self.clock = clock
 
     def check_limit(self, account_id: str, amount: float) -> bool:
-         # Retrieve the live constraint (auto‑saves a new one if none exists)
-        constraint = self.account_repo.get_constraints(account_id)
-        # Perform the check (will raise if violated)
-        constraint.check(amount, date.today())
-        # Persist the fact that we looked it up (in case it was newly created)
-        self.account_repo.save_constraints(account_id, constraint)
+        # Checked under the account's lock in the constraint store (will raise if violated);
+        # a missing constraint is created and saved on the way
+        self.account_repo.check_constraint(account_id, amount, self._clock().now())
         return True
 
+    def try_consume(self, account_id: str, amount: float, at: datetime = None) -> bool:
+        # Check and record happen under the account's lock in the constraint store
+        return self.account_repo.try_consume(account_id, amount, at or self._clock().now())
+
+    def _clock(self) -> Clock:
+        return self.clock or get_clock()
+
+    def release(self, account_id: str, amount: float, at: datetime) -> None:
+        self.account_repo.release(account_id, amount, at)
+
     def reset_limits_daily(self) -> None:
-        
-        for constraint in self.account_repo.get_constraint_dict().values():
-            constraint.daily_used = 0.0
+        # O(1): each constraint notices the new epoch when next touched
+        self.epochs.advance_day()
 
     def reset_limits_monthly(self) -> None:
-        for constraint in self.account_repo.get_constraint_dict().values():
-            constraint.monthly_used = 0.0
+        self.epochs.advance_month()
+
+    def compact_limits(self) -> None:
+        """Optional full scan that applies pending resets to every constraint."""
+        self.account_repo.refresh_constraints()
 
-    def configure_limits(self, account_id: str, daily: float, monthly: float) -> None:
+    def configure_limits(self, account_id: str, daily: float, monthly: float,
+                         rolling_24h: float = None, rolling_30d: float = None) -> None:
         # Create or update constraint for the given account
-        constraint = LimitConstraint(daily_limit=daily, monthly_limit=monthly)
+        constraint = LimitConstraint(
+            daily_limit=daily,
+            monthly_limit=monthly,
+            rolling_24h_limit=rolling_24h,
+            rolling_30d_limit=rolling_30d,
+            epochs=self.epochs,
+        )
         constraints:Dict[str, LimitConstraint] = self.account_repo.get_constraint_dict()
         constraints[account_id] = constraint
 
     def get_limits(self, account_id: str) -> LimitConstraint:
         # Return existing or default constraint
         constraints:Dict[str, LimitConstraint] = self.account_repo.get_constraint_dict()
-        return constraints.get(account_id, LimitConstraint())
+        constraint = constraints.get(account_id)
+        if constraint is None:
+            return LimitConstraint(epochs=self.epochs)
+        self.account_repo.refresh_constraints([account_id])
+        return constraint
 
 
 
@@ -0,0 +1,137 @@
+# infrastructure/interest/pdf_canvas_renderer.py
+from io import BytesIO
+from typing import BinaryIO
+
+from domain.accounts.transaction import Transaction
+from domain.interest.statement import MonthlyStatement
+
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+FONT_SIZE = 8
+LEADING = 11
+MARGIN = 48
+# (heading, x offset from the left margin, right-aligned)
+COLUMNS = (
+    ("Tx ID", 0, False),
+    ("Type", 200, False),
+    ("Amount", 330, True),
+    ("Timestamp", 350, False),
+)
+
+
+class CanvasStatementRenderer:
+    """
+    PDF statement renderer for large transaction tables. Rows are drawn
+    straight onto the ReportLab canvas at precomputed positions instead of
+    going through platypus Table layout, so time and memory grow linearly
+    with the row count. Within a document the repeating page header is
+    drawn once as a form and stamped onto every later page; a form cannot
+    be shared between documents, and its text differs per account anyway.
+    ReportLab keeps finished pages in memory until save(), so output is
+    written in one go rather than page by page. Page layout is computed
+    once per renderer, so callers should reuse one instance.
+    """
+    def __init__(self, page_size=None):
+        try:
+            from reportlab.lib.pagesizes import A4
+            from reportlab.pdfgen.canvas import Canvas
+            self.Canvas = Canvas
+            self.page_size = page_size or A4
+            self.pdf_enabled = True
+        except ImportError:
+            self.pdf_enabled = False
+            return
+        width, height = self.page_size
+        self._x = [(MARGIN + offset, right) for _, offset, right in COLUMNS]
+        self._header_y = height - MARGIN
+        self._table_top = self._header_y - 2 * LEADING
+        self._rows_per_page = int((self._table_top - MARGIN) // LEADING)
+        # the first page gives up room to the title and summary block
+        self._first_page_rows = self._rows_per_page - 9
+
+    def render(self, statement: MonthlyStatement) -> bytes:
+        buffer = BytesIO()
+        self.render_to(statement, buffer)
+        return buffer.getvalue()
+
+    def render_to(self, statement: MonthlyStatement, stream: BinaryIO) -> int:
+        """Write the PDF to `stream`; returns the number of pages."""
+        if not self.pdf_enabled:
+            raise RuntimeError("ReportLab is required for PDF generation.")
+        canvas = self.Canvas(stream, pagesize=self.page_size, pageCompression=1)
+        self._define_header(canvas, statement)
+
+        pages = 1
+        y = self._draw_summary(canvas, statement)
+        remaining = self._first_page_rows
+        text = self._begin_rows(canvas)
+        for tx in statement.transactions:
+            if remaining == 0:
+                canvas.drawText(text)
+                canvas.showPage()
+                pages += 1
+                canvas.doForm("header")
+                text = self._begin_rows(canvas)
+                y = self._table_top
+                remaining = self._rows_per_page
+            self._draw_row(canvas, text, tx, y)
+            y -= LEADING
+            remaining -= 1
+        canvas.drawText(text)
+        canvas.showPage()
+        canvas.save()
+        return pages
+
+    def _define_header(self, canvas, statement: MonthlyStatement) -> None:
+        canvas.beginForm("header")
+        canvas.setFont(BOLD_FONT, FONT_SIZE)
+        canvas.drawString(MARGIN, self._header_y,
+                          f"Statement {statement.account_id} {statement.month}/{statement.year}")
+        self._draw_column_headings(canvas, self._header_y - LEADING)
+        canvas.endForm()
+
+    def _draw_column_headings(self, canvas, y: float) -> None:
+        canvas.setFont(BOLD_FONT, FONT_SIZE)
+        for (heading, _, _), (x, right) in zip(COLUMNS, self._x):
+            if right:
+                canvas.drawRightString(x, y, heading)
+            else:
+                canvas.drawString(x, y, heading)
+
+    def _draw_summary(self, canvas, statement: MonthlyStatement) -> float:
+        y = self._header_y
+        canvas.setFont(BOLD_FONT, 14)
+        canvas.drawString(MARGIN, y, f"Monthly Statement: {statement.month}/{statement.year}")
+        y -= 2 * LEADING
+        canvas.setFont(FONT, FONT_SIZE)
+        for label, value in (
+            ("Account ID", statement.account_id),
+            ("Opening Balance", f"{statement.opening_balance:.2f}"),
+            ("Closing Balance", f"{statement.closing_balance:.2f}"),
+            ("Interest Earned", f"{statement.interest_earned:.2f}"),
+            ("Generated On", statement.generated_on.isoformat()),
+        ):
+            canvas.drawString(MARGIN, y, label)
+            canvas.drawString(MARGIN + 120, y, value)
+            y -= LEADING
+        y -= LEADING
+        self._draw_column_headings(canvas, y)
+        return y - LEADING
+
+    def _begin_rows(self, canvas):
+        # one text object per page keeps the content stream compact
+        text = canvas.beginText()
+        text.setFont(FONT, FONT_SIZE)
+        return text
+
+    def _draw_row(self, canvas, text, tx: Transaction, y: float) -> None:
+        amount = f"{tx.amount:.2f}"
+        (x_id, _), (x_type, _), (x_amount, _), (x_time, _) = self._x
+        text.setTextOrigin(x_id, y)
+        text.textOut(tx.transaction_id)
+        text.setTextOrigin(x_type, y)
+        text.textOut(tx.transaction_type)
+        text.setTextOrigin(x_amount - canvas.stringWidth(amount, FONT, FONT_SIZE), y)
+        text.textOut(amount)
+        text.setTextOrigin(x_time, y)
+        text.textOut(tx.timestamp.isoformat())
@@ -0,0 +1,211 @@
+# infrastructure/interest/pdf_render_pool.py
+import dataclasses
+import hashlib
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import BoundedSemaphore, Lock
+from typing import Dict, Optional
+
+from domain.interest.statement import MonthlyStatement
+from infrastructure.interest.pdf_canvas_renderer import CanvasStatementRenderer
+from infrastructure.interest.pdf_statement_adapter import PdfStatementAdapter
+
+
+class RenderQueueFull(Exception):
+    """Raised when every render slot and queue position is taken."""
+
+
+def statement_digest(statement: MonthlyStatement) -> str:
+    """
+    Content address of a statement: account, period, balances and every
+    transaction. generated_on is left out so an unchanged closed month maps
+    to the same key on every request.
+    """
+    h = hashlib.sha256()
+    h.update(repr((
+        statement.account_id, statement.year, statement.month,
+        statement.opening_balance, statement.closing_balance, statement.interest_earned,
+    )).encode())
+    for tx in statement.transactions:
+        h.update(repr((tx.transaction_id, tx.transaction_type, tx.amount, tx.timestamp.isoformat())).encode())
+    return h.hexdigest()
+
+
+class RenderedStatementCache:
+    """
+    LRU of rendered statement bytes keyed by content digest. Entries evicted
+    from memory are written to `spill_dir` (when given) and read back from
+    there on a later miss. The spill directory is an LRU of its own, holding
+    at most `max_spilled` files; files pushed out of it are deleted.
+    """
+    def __init__(self, max_entries: int = 256, spill_dir: Optional[str] = None,
+                 max_spilled: int = 4096):
+        if max_entries <= 0 or max_spilled <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_entries = max_entries
+        self.max_spilled = max_spilled
+        self.spill_dir = spill_dir
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._spilled: "OrderedDict[str, None]" = OrderedDict()
+        self._lock = Lock()
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+            # files left by an earlier process count towards the limit, oldest first
+            names = [n for n in os.listdir(spill_dir) if n.endswith(".bin")]
+            for name in sorted(names, key=lambda n: os.path.getmtime(os.path.join(spill_dir, n))):
+                self._spilled[name[:-len(".bin")]] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.spill_dir, f"{key}.bin")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+        if self.spill_dir:
+            try:
+                with open(self._path(key), "rb") as f:
+                    data = f.read()
+            except FileNotFoundError:
+                data = None
+            if data is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    if key in self._spilled:
+                        self._spilled.move_to_end(key)
+                self.put(key, data)
+                return data
+        self.misses += 1
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False))
+        if self.spill_dir and evicted:
+            for old_key, old_data in evicted:
+                path = self._path(old_key)
+                if not os.path.exists(path):
+                    # write then rename so readers never see a partial file
+                    tmp = f"{path}.{os.getpid()}.tmp"
+                    with open(tmp, "wb") as f:
+                        f.write(old_data)
+                    os.replace(tmp, path)
+            pruned = []
+            with self._lock:
+                for old_key, _ in evicted:
+                    self._spilled[old_key] = None
+                    self._spilled.move_to_end(old_key)
+                while len(self._spilled) > self.max_spilled:
+                    pruned.append(self._spilled.popitem(last=False)[0])
+            for old_key in pruned:
+                try:
+                    os.remove(self._path(old_key))
+                except FileNotFoundError:
+                    pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "diskHits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "spilled": len(self._spilled),
+            }
+
+
+# above this many rows the canvas renderer is used instead of platypus layout
+CANVAS_RENDER_THRESHOLD = 500
+
+
+# one renderer per worker process, built on first use
+_canvas_renderer: Optional[CanvasStatementRenderer] = None
+
+
+def render_pdf(statement: MonthlyStatement) -> bytes:
+    # runs in a worker process
+    global _canvas_renderer
+    if len(statement.transactions) > CANVAS_RENDER_THRESHOLD:
+        if _canvas_renderer is None:
+            _canvas_renderer = CanvasStatementRenderer()
+        return _canvas_renderer.render(statement)
+    return PdfStatementAdapter().render(statement)
+
+
+class PdfRenderPool:
+    """
+    Renders PDF statements in worker processes so layout never runs in a
+    request thread. At most `max_workers + max_queue` renders are
+    outstanding; further submissions raise RenderQueueFull. Identical
+    statements share one in-flight render and one cache entry.
+    """
+    def __init__(self, max_workers: Optional[int] = 2, max_queue: int = 16,
+                 cache: Optional[RenderedStatementCache] = None):
+        # max_workers=0 renders in the calling thread
+        self.max_workers = max_workers
+        self.cache = cache or RenderedStatementCache()
+        self._slots = BoundedSemaphore((max_workers or 1) + max_queue)
+        self._executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers != 0 else None
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = Lock()
+
+    def submit(self, statement: MonthlyStatement) -> Future:
+        key = statement_digest(statement)
+        cached = self.cache.get(key)
+        if cached is not None:
+            done = Future()
+            done.set_result(cached)
+            return done
+        with self._lock:
+            pending = self._in_flight.get(key)
+            if pending is not None:
+                return pending
+            if not self._slots.acquire(blocking=False):
+                raise RenderQueueFull("PDF render queue is full")
+            # lazy transaction views hold a repository; send the worker a plain list
+            snapshot = dataclasses.replace(statement, transactions=list(statement.transactions))
+            if self._executor is None:
+                future = Future()
+            else:
+                future = self._executor.submit(render_pdf, snapshot)
+            self._in_flight[key] = future
+        if self._executor is None:
+            # render outside the lock; concurrent submits of this key wait on the future
+            try:
+                future.set_result(render_pdf(snapshot))
+            except Exception as e:
+                future.set_exception(e)
+        future.add_done_callback(lambda f: self._finished(key, f))
+        return future
+
+    @property
+    def outstanding(self) -> int:
+        """Renders queued or running."""
+        return len(self._in_flight)
+
+    def render(self, statement: MonthlyStatement, timeout: Optional[float] = None) -> bytes:
+        return self.submit(statement).result(timeout)
+
+    def _finished(self, key: str, future: Future) -> None:
+        # cache before leaving the in-flight map, so a concurrent submit finds one or the other
+        if not future.cancelled() and future.exception() is None:
+            self.cache.put(key, future.result())
+        with self._lock:
+            self._in_flight.pop(key, None)
+        self._slots.release()
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
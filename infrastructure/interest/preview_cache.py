@@ -0,0 +1,104 @@
+# infrastructure/interest/preview_cache.py
+from collections import OrderedDict
+from datetime import date
+from threading import Lock
+from typing import Dict, Optional, Set, Tuple
+
+from domain.interest.interest_strategy import InterestStrategy
+
+# (account_id, account_version, strategy cache key, as_of)
+PreviewKey = Tuple[str, int, tuple, date]
+
+
+class InterestPreviewCache:
+    """
+    Bounded LRU cache of interest previews. Keys include the account's state
+    version, so any persisted deposit, withdrawal, transfer or interest
+    posting makes older entries unreachable; they are evicted as soon as a
+    newer version of the account is seen.
+    """
+    def __init__(self, max_entries: int = 10000):
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[PreviewKey, float]" = OrderedDict()
+        self._keys_by_account: Dict[str, Set[PreviewKey]] = {}
+        # account_id -> (version, strategy) so repeat previews skip the account fetch
+        self._strategies: Dict[str, Tuple[int, InterestStrategy]] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def resolved_strategy(self, account_id: str, version: int) -> Optional[InterestStrategy]:
+        with self._lock:
+            resolved = self._strategies.get(account_id)
+            if resolved is None:
+                return None
+            if resolved[0] != version:
+                self._invalidate_locked(account_id)
+                return None
+            return resolved[1]
+
+    def remember_strategy(self, account_id: str, version: int, strategy: InterestStrategy) -> None:
+        with self._lock:
+            current = self._strategies.get(account_id)
+            if current is not None and current[0] != version:
+                self._invalidate_locked(account_id)
+            self._strategies[account_id] = (version, strategy)
+
+    def get(self, key: PreviewKey) -> Optional[float]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: PreviewKey, value: float) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._keys_by_account.setdefault(key[0], set()).add(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                keys = self._keys_by_account.get(old_key[0])
+                if keys is not None:
+                    keys.discard(old_key)
+                    if not keys:
+                        del self._keys_by_account[old_key[0]]
+                self.evictions += 1
+
+    def invalidate(self, account_id: str) -> None:
+        with self._lock:
+            self._invalidate_locked(account_id)
+
+    def _invalidate_locked(self, account_id: str) -> None:
+        self._strategies.pop(account_id, None)
+        keys = self._keys_by_account.pop(account_id, ())
+        for key in keys:
+            self._entries.pop(key, None)
+        if keys:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_account.clear()
+            self._strategies.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
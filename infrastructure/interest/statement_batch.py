@@ -0,0 +1,224 @@
+# infrastructure/interest/statement_batch.py
+import hashlib
+import os
+import re
+import shutil
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from application.services import AccountRepositoryInterface
+from domain.clock import get_clock
+from domain.interest.statement import MonthlyStatement
+from infrastructure.interest.csv_statement_adapter import CsvStatementAdapter
+from infrastructure.interest.pdf_render_pool import render_pdf
+from infrastructure.interest.statementgenerator import StatementServiceImpl
+
+MANIFEST = "_completed.txt"
+PARTS_DIR = "_parts"
+
+
+@dataclass
+class BatchReport:
+    year: int
+    month: int
+    accounts: int
+    generated: int
+    skipped: int
+    seconds: float
+    bytes_written: int
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        """Statements generated per second."""
+        return self.generated / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"Statements {self.year}-{self.month:02d}: {self.generated} generated, "
+            f"{self.skipped} already done, {len(self.failed)} failed of {self.accounts} accounts "
+            f"in {self.seconds:.1f}s ({self.throughput:.1f}/s, {self.bytes_written / 2**20:.1f} MiB)"
+        )
+
+
+def _render(statement: MonthlyStatement, formats: Tuple[str, ...]) -> Dict[str, bytes]:
+    # Runs in a worker process
+    out = {}
+    if "csv" in formats:
+        out["csv"] = CsvStatementAdapter().render(statement)
+    if "pdf" in formats:
+        out["pdf"] = render_pdf(statement)
+    return out
+
+
+class MonthEndStatementJob:
+    """
+    Generates every account's statement for a month. Accounts are processed
+    in chunks: statements for a chunk are built with one bulk read, rendered
+    in worker processes and written under `output_dir/YYYY-MM/<prefix>/`
+    (or into one zip per prefix when `archive` is set). Finished accounts
+    are appended to a manifest, so a rerun skips them and picks up where an
+    interrupted run stopped.
+
+    Archives are written as one part zip per shard and chunk, and the parts
+    are merged into `<prefix>.zip` once at the end of the run, so every
+    statement is written and copied a bounded number of times. Parts left
+    by an interrupted run are merged by the next one.
+    """
+    def __init__(
+        self,
+        account_repo: AccountRepositoryInterface,
+        statement_service: StatementServiceImpl,
+        output_dir: str,
+        formats: Sequence[str] = ("csv", "pdf"),
+        archive: bool = False,
+        shard_chars: int = 2,
+        chunk_size: int = 256,
+        max_workers: Optional[int] = None,
+    ):
+        unknown = set(formats) - {"csv", "pdf"}
+        if unknown:
+            raise ValueError(f"Unsupported statement formats: {sorted(unknown)}")
+        self.account_repo = account_repo
+        self.statement_service = statement_service
+        self.output_dir = output_dir
+        self.formats = tuple(formats)
+        self.archive = archive
+        self.shard_chars = shard_chars
+        self.chunk_size = chunk_size
+        # max_workers=0 renders in the calling process
+        self.max_workers = max_workers
+
+    def run(self, year: int, month: int, as_of: Optional[date] = None) -> BatchReport:
+        started = time.perf_counter()
+        period_dir = os.path.join(self.output_dir, f"{year:04d}-{month:02d}")
+        os.makedirs(period_dir, exist_ok=True)
+        manifest_path = os.path.join(period_dir, MANIFEST)
+        done = self._completed(manifest_path)
+
+        account_ids = sorted(s.account_id for s in self.account_repo.snapshot())
+        pending = [i for i in account_ids if i not in done]
+        report = BatchReport(year, month, len(account_ids), 0, len(account_ids) - len(pending), 0.0, 0)
+        as_of = as_of or get_clock().today()
+
+        pool = ProcessPoolExecutor(max_workers=self.max_workers) if self.max_workers != 0 else None
+        try:
+            with open(manifest_path, "a", encoding="utf-8") as manifest:
+                for start in range(0, len(pending), self.chunk_size):
+                    chunk = pending[start:start + self.chunk_size]
+                    statements = self.statement_service.generate_statements(chunk, year, month, as_of)
+                    for account_id in chunk:
+                        if account_id not in statements:
+                            # closed since the run listed the accounts
+                            report.failed[account_id] = "Account not found"
+                    results = self._render_chunk(pool, statements, report)
+                    report.bytes_written += self._write_chunk(period_dir, year, month, results)
+                    for account_id, _ in results:
+                        manifest.write(account_id + "\n")
+                    report.generated += len(results)
+                    # a crash loses at most the chunk in progress
+                    manifest.flush()
+                    os.fsync(manifest.fileno())
+            if self.archive:
+                self._merge_parts(period_dir)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        report.seconds = time.perf_counter() - started
+        return report
+
+    def _render_chunk(self, pool, statements: Dict[str, MonthlyStatement],
+                      report: BatchReport) -> List[Tuple[str, Dict[str, bytes]]]:
+        if pool is None:
+            jobs = [(account_id, None, s) for account_id, s in statements.items()]
+        else:
+            jobs = [(account_id, pool.submit(_render, s, self.formats), s) for account_id, s in statements.items()]
+        results = []
+        for account_id, future, statement in jobs:
+            try:
+                rendered = future.result() if future is not None else _render(statement, self.formats)
+            except Exception as e:
+                report.failed[account_id] = str(e)
+                continue
+            results.append((account_id, rendered))
+        return results
+
+    @staticmethod
+    def _file_id(account_id: str) -> str:
+        # the hash keeps IDs that sanitize alike (a/b and a_b) in separate files
+        digest = hashlib.sha1(account_id.encode("utf-8")).hexdigest()[:10]
+        return f"{re.sub(r'[^A-Za-z0-9_.-]', '_', account_id)}-{digest}"
+
+    def _shard(self, account_id: str) -> str:
+        # keep shard names filesystem-safe whatever the account IDs look like
+        prefix = re.sub(r"[^A-Za-z0-9_-]", "_", account_id[:self.shard_chars])
+        return prefix or "_"
+
+    def _write_chunk(self, period_dir: str, year: int, month: int,
+                     results: List[Tuple[str, Dict[str, bytes]]]) -> int:
+        by_shard: Dict[str, List[Tuple[str, bytes]]] = {}
+        for account_id, rendered in results:
+            safe_id = self._file_id(account_id)
+            files = by_shard.setdefault(self._shard(account_id), [])
+            for fmt, data in rendered.items():
+                files.append((f"{safe_id}-{year:04d}-{month:02d}.{fmt}", data))
+        written = 0
+        for shard, files in by_shard.items():
+            if not files:
+                continue
+            if self.archive:
+                # named after its first entry, so a chunk redone after a crash
+                # replaces its own part instead of adding another
+                parts_dir = os.path.join(period_dir, PARTS_DIR, shard)
+                os.makedirs(parts_dir, exist_ok=True)
+                path = os.path.join(parts_dir, f"{files[0][0]}.zip")
+                with zipfile.ZipFile(path + ".tmp", "w", zipfile.ZIP_DEFLATED) as zf:
+                    for name, data in files:
+                        zf.writestr(name, data)
+                os.replace(path + ".tmp", path)
+            else:
+                shard_dir = os.path.join(period_dir, shard)
+                os.makedirs(shard_dir, exist_ok=True)
+                for name, data in files:
+                    path = os.path.join(shard_dir, name)
+                    with open(path + ".tmp", "wb") as f:
+                        f.write(data)
+                    os.replace(path + ".tmp", path)
+            written += sum(len(data) for _, data in files)
+        return written
+
+    @staticmethod
+    def _merge_parts(period_dir: str) -> None:
+        parts_root = os.path.join(period_dir, PARTS_DIR)
+        if not os.path.isdir(parts_root):
+            return
+        for shard in sorted(os.listdir(parts_root)):
+            parts_dir = os.path.join(parts_root, shard)
+            parts = sorted(os.path.join(parts_dir, name) for name in os.listdir(parts_dir)
+                           if name.endswith(".zip"))
+            path = os.path.join(period_dir, f"{shard}.zip")
+            sources = ([path] if os.path.exists(path) else []) + parts
+            # the merged zip replaces the old one whole, so a crash never leaves
+            # a half-written archive; entries already merged are not repeated
+            with zipfile.ZipFile(path + ".tmp", "w", zipfile.ZIP_DEFLATED) as out:
+                seen = set()
+                for source in sources:
+                    with zipfile.ZipFile(source) as zf:
+                        for info in zf.infolist():
+                            if info.filename not in seen:
+                                seen.add(info.filename)
+                                out.writestr(info, zf.read(info))
+            os.replace(path + ".tmp", path)
+            shutil.rmtree(parts_dir)
+        shutil.rmtree(parts_root, ignore_errors=True)
+
+    @staticmethod
+    def _completed(manifest_path: str) -> set:
+        if not os.path.exists(manifest_path):
+            return set()
+        with open(manifest_path, encoding="utf-8") as f:
+            return {line.strip() for line in f if line.strip()}
@@ -0,0 +1,180 @@
+# infrastructure/interest/statement_cache.py
+import dataclasses
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Tuple
+
+from application.interest.statement_service import StatementServiceInterface
+from application.services import AccountRepositoryInterface
+from domain.accounts.transaction import Transaction
+from domain.interest.statement import MonthlyStatement
+
+# (account_id, year, month)
+StatementKey = Tuple[str, int, int]
+
+
+class _Entry:
+    __slots__ = ("statement", "version", "renders")
+
+    def __init__(self, statement: Optional[MonthlyStatement], version: Optional[int] = None):
+        # None for an entry that so far only holds renders of a streamed statement
+        self.statement = statement
+        # account version the statement was built at; None when not tracked
+        self.version = version
+        # (format, generated_on) -> rendered bytes
+        self.renders: Dict[Tuple[str, date], bytes] = {}
+
+
+class StatementCache:
+    """
+    LRU cache of monthly statements and their rendered outputs. An entry is
+    dropped when a transaction dated inside its period is saved, and is
+    ignored when the caller passes an account version other than the one
+    it was built at (statements carry the current balance). Concurrent
+    misses for the same key share one computation.
+    """
+    def __init__(self, max_entries: int = 1024):
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[StatementKey, _Entry]" = OrderedDict()
+        self._in_flight: Dict[StatementKey, Future] = {}
+        # bumped on invalidation so a computation that raced a save is not stored
+        self._generations: Dict[StatementKey, int] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_or_compute(self, key: StatementKey, compute: Callable[[], MonthlyStatement],
+                       version: Optional[int] = None) -> MonthlyStatement:
+        with self._lock:
+            entry = self._live_entry(key, version)
+            if entry is not None and entry.statement is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.statement
+            self.misses += 1
+            pending = self._in_flight.get(key)
+            if pending is None:
+                future = self._in_flight[key] = Future()
+                generation = self._generations.get(key, 0)
+        if pending is not None:
+            return pending.result()
+        try:
+            statement = compute()
+        except Exception as e:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if self._generations.get(key, 0) == generation:
+                entry = self._live_entry(key, version)
+                if entry is not None:
+                    # keep renders stored while the statement was streamed
+                    entry.statement = statement
+                else:
+                    self._store(key, _Entry(statement, version))
+        future.set_result(statement)
+        return statement
+
+    def _live_entry(self, key: StatementKey, version: Optional[int]) -> Optional[_Entry]:
+        # caller holds the lock; an entry built at another account version is dropped
+        entry = self._entries.get(key)
+        if entry is not None and version is not None and entry.version != version:
+            del self._entries[key]
+            self.invalidations += 1
+            return None
+        return entry
+
+    def _store(self, key: StatementKey, entry: _Entry) -> None:
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def generation(self, key: StatementKey) -> int:
+        """Token for put_render: a render is only stored if no invalidation happened since."""
+        with self._lock:
+            return self._generations.get(key, 0)
+
+    def get_render(self, key: StatementKey, fmt: str, generated_on: date,
+                   version: Optional[int] = None) -> Optional[bytes]:
+        with self._lock:
+            entry = self._live_entry(key, version)
+            return entry.renders.get((fmt, generated_on)) if entry is not None else None
+
+    def put_render(self, key: StatementKey, fmt: str, generated_on: date, data: bytes,
+                   version: Optional[int] = None, generation: Optional[int] = None) -> None:
+        with self._lock:
+            if generation is not None and self._generations.get(key, 0) != generation:
+                return
+            entry = self._live_entry(key, version)
+            if entry is None:
+                entry = _Entry(None, version)
+                self._store(key, entry)
+            entry.renders[(fmt, generated_on)] = data
+
+    def invalidate(self, key: StatementKey) -> None:
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def transaction_saved(self, transaction: Transaction) -> None:
+        """Save listener: drop the statements whose period contains the transaction."""
+        ts = transaction.timestamp
+        for account_id in {transaction.account_id, getattr(transaction, "dest_account_id", None)}:
+            if account_id is not None:
+                self.invalidate((account_id, ts.year, ts.month))
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxEntries": self.max_entries,
+                "invalidations": self.invalidations,
+            }
+
+
+class CachingStatementService(StatementServiceInterface):
+    """
+    StatementServiceInterface decorator that serves statements from a
+    StatementCache. With an account repository, cached statements are also
+    tied to the account version, so balance changes outside the period
+    (interest postings, later transactions) are not served stale.
+    """
+    def __init__(self, inner: StatementServiceInterface, cache: StatementCache,
+                 account_repo: Optional[AccountRepositoryInterface] = None):
+        self.inner = inner
+        self.cache = cache
+        self.account_repo = account_repo
+
+    def account_version(self, account_id: str) -> Optional[int]:
+        return self.account_repo.get_account_version(account_id) if self.account_repo is not None else None
+
+    def generate_statement(self, account_id: str, year: int, month: int, as_of: date) -> MonthlyStatement:
+        statement = self.cache.get_or_compute(
+            (account_id, year, month),
+            lambda: self.inner.generate_statement(account_id, year, month, as_of),
+            self.account_version(account_id),
+        )
+        if statement.generated_on != as_of:
+            statement = dataclasses.replace(statement, generated_on=as_of)
+        return statement
+
+    def stream_statement(self, account_id: str, year: int, month: int, as_of: date) -> MonthlyStatement:
+        # never materialize the rows here; callers cache the rendered output if it is small
+        return self.inner.stream_statement(account_id, year, month, as_of)
+
+    def generate_statements(self, account_ids: List[str], year: int, month: int,
+                            as_of: date) -> Dict[str, MonthlyStatement]:
+        # bulk runs read each statement once; caching them would only evict hot entries
+        return self.inner.generate_statements(account_ids, year, month, as_of)
@@ -1,5 +1,7 @@
 from datetime import date
+from typing import Dict, Iterator, List, Optional
 from application.interest.statement_service import StatementServiceInterface
+from domain.accounts.transaction import Transaction
 from domain.interest.statement import MonthlyStatement
 
 from infrastructure.interest.pdf_statement_adapter import PdfStatementAdapter
@@ -13,7 +15,20 @@ class StatementServiceImpl(StatementServiceInterface):
     def generate_statement(self, account_id: str, year: int, month: int, as_of: date) -> MonthlyStatement:
         account = self.account_repo.get_account(account_id)
         all_txs = self.transaction_repo.list_transactions(account_id)
+        return self._build(account, all_txs, year, month, as_of)
 
+    def generate_statements(self, account_ids: List[str], year: int, month: int,
+                            as_of: date) -> Dict[str, MonthlyStatement]:
+        # one bulk read each for accounts and transactions
+        accounts = self.account_repo.get_accounts(account_ids)
+        txs_by_account = self.transaction_repo.list_transactions_for_accounts(list(accounts))
+        return {
+            account_id: self._build(account, txs_by_account.get(account_id, []), year, month, as_of)
+            for account_id, account in accounts.items()
+        }
+
+    def _build(self, account, all_txs, year: int, month: int, as_of: date) -> MonthlyStatement:
+        account_id = account.account_id
         # Filter transactions for the month
         txs = [t for t in all_txs if t.timestamp.year == year and t.timestamp.month == month]
 
@@ -39,3 +54,62 @@ class StatementServiceImpl(StatementServiceInterface):
             transactions=txs,
             generated_on=as_of
         )
+
+    def stream_statement(self, account_id: str, year: int, month: int, as_of: date) -> MonthlyStatement:
+        account = self.account_repo.get_account(account_id)
+        txs = MonthTransactions(self.transaction_repo, account_id, year, month)
+
+        # One pass for the totals; nothing is kept, the rows are re-read when rendered
+        net_change = 0
+        interest_earned = 0
+        seen = 0
+        for t in txs:
+            seen += 1
+            if t.transaction_type == "DEPOSIT":
+                net_change += t.amount
+            else:
+                net_change -= t.amount
+            if t.transaction_type == "INTEREST":
+                interest_earned += t.amount
+        # the balance is read once, where the pass ended, and the re-read is cut to
+        # the rows the pass saw, so later saves cannot make the document disagree
+        closing_balance = account.balance
+        txs.limit = seen
+
+        return MonthlyStatement(
+            account_id=account_id,
+            year=year,
+            month=month,
+            opening_balance=closing_balance - net_change,
+            closing_balance=closing_balance,
+            interest_earned=interest_earned,
+            transactions=txs,
+            generated_on=as_of
+        )
+
+
+class MonthTransactions:
+    """
+    Re-iterable view of one month's transactions, read from the repository
+    on each pass. With `limit` set, a pass stops after that many rows, which
+    pins it to what an earlier pass saw (the repository only appends).
+    """
+    def __init__(self, transaction_repo, account_id: str, year: int, month: int,
+                 limit: Optional[int] = None):
+        self.transaction_repo = transaction_repo
+        self.account_id = account_id
+        self.year = year
+        self.month = month
+        self.limit = limit
+
+    def __iter__(self) -> Iterator[Transaction]:
+        remaining = self.limit
+        if remaining == 0:
+            return
+        for t in self.transaction_repo.iter_transactions(self.account_id):
+            if t.timestamp.year == self.year and t.timestamp.month == self.month:
+                yield t
+                if remaining is not None:
+                    remaining -= 1
+                    if not remaining:
+                        return
@@ -0,0 +1,204 @@
+# infrastructure/log_analyzer.py
+"""
+Single-pass analyzer for transaction logs in the format written by the
+banking service:
+
+    2025-04-19 04:52:43,267 - banking - INFO - Transaction <id>: Type=DEPOSIT, Amount=10.0, Account=<id>
+    2025-04-19 04:52:54,625 - banking - ERROR - Transaction failed: Insufficient funds
+
+    python -m infrastructure.log_analyzer transactions.log --workers 8 --window-minutes 60
+"""
+import argparse
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Work on bytes throughout: no per-line decoding
+_LINE = re.compile(
+    rb"(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d),\d+ - [^ ]+ - (\w+) - Transaction "
+    rb"(?:failed: ([^\r\n]*)|(\S+): Type=(\w+), Amount=([^,]+), Account=([^,\s]+)(?:, DestAccount=([^,\s]+))?)"
+)
+
+
+@dataclass
+class LogStats:
+    lines: int = 0
+    transactions: int = 0
+    failures: int = 0
+    count_by_type: Counter = field(default_factory=Counter)
+    amount_by_type: Counter = field(default_factory=Counter)
+    # account -> total amount and count of transactions it originated
+    volume_by_account: Counter = field(default_factory=Counter)
+    count_by_account: Counter = field(default_factory=Counter)
+    transfer_total: float = 0.0
+    failure_reasons: Counter = field(default_factory=Counter)
+    # window start ("YYYY-MM-DD HH:MM") -> [transactions, failures]
+    windows: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def error_rate(self) -> float:
+        attempts = self.transactions + self.failures
+        return self.failures / attempts if attempts else 0.0
+
+    def merge(self, other: "LogStats") -> "LogStats":
+        self.lines += other.lines
+        self.transactions += other.transactions
+        self.failures += other.failures
+        self.count_by_type.update(other.count_by_type)
+        self.amount_by_type.update(other.amount_by_type)
+        self.volume_by_account.update(other.volume_by_account)
+        self.count_by_account.update(other.count_by_account)
+        self.transfer_total += other.transfer_total
+        self.failure_reasons.update(other.failure_reasons)
+        for key, (txs, fails) in other.windows.items():
+            bucket = self.windows.setdefault(key, [0, 0])
+            bucket[0] += txs
+            bucket[1] += fails
+        return self
+
+    def to_dict(self, top: int = 10) -> dict:
+        return {
+            "lines": self.lines,
+            "transactions": self.transactions,
+            "failures": self.failures,
+            "errorRate": self.error_rate,
+            "countByType": dict(self.count_by_type),
+            "amountByType": dict(self.amount_by_type),
+            "transferTotal": self.transfer_total,
+            "topAccountsByVolume": self.volume_by_account.most_common(top),
+            "failureReasons": self.failure_reasons.most_common(top),
+            "windows": {k: {"transactions": v[0], "failures": v[1]} for k, v in sorted(self.windows.items())},
+        }
+
+    def summary(self, top: int = 10) -> str:
+        lines = [
+            f"{self.lines} lines, {self.transactions} transactions, {self.failures} failures "
+            f"(error rate {self.error_rate:.2%}), transfers {self.transfer_total:.2f}",
+            f"{'type':<12} {'count':>10} {'amount':>16}",
+        ]
+        for tx_type, count in self.count_by_type.most_common():
+            lines.append(f"{tx_type:<12} {count:>10} {self.amount_by_type[tx_type]:>16.2f}")
+        lines.append(f"{'account':<40} {'count':>8} {'volume':>16}")
+        for account, volume in self.volume_by_account.most_common(top):
+            lines.append(f"{account:<40} {self.count_by_account[account]:>8} {volume:>16.2f}")
+        if self.windows:
+            lines.append(f"{'window':<18} {'transactions':>12} {'failures':>9}")
+            for key, (txs, fails) in sorted(self.windows.items()):
+                lines.append(f"{key:<18} {txs:>12} {fails:>9}")
+        return "\n".join(lines)
+
+
+def _window_key(minute: bytes, window_minutes: int, cache: Dict[bytes, str]) -> str:
+    # minute is b"YYYY-MM-DD HH:MM"; each distinct minute is converted once
+    key = cache.get(minute)
+    if key is None:
+        text = minute.decode()
+        total = int(text[11:13]) * 60 + int(text[14:16])
+        start = total - total % window_minutes if window_minutes < 1440 else 0
+        key = cache[minute] = f"{text[:11]}{start // 60:02d}:{start % 60:02d}"
+    return key
+
+
+def analyze_range(path: str, start: int = 0, end: Optional[int] = None,
+                  window_minutes: Optional[int] = None,
+                  since: Optional[str] = None, until: Optional[str] = None) -> LogStats:
+    """
+    Aggregate the lines that start inside [start, end) of the file. A line
+    straddling `start` belongs to the previous range.
+    """
+    stats = LogStats()
+    match = _LINE.match
+    since_b = since.encode() if since else None
+    until_b = until.encode() if until else None
+    minute_cache: Dict[bytes, str] = {}
+    count_by_type = stats.count_by_type
+    amount_by_type = stats.amount_by_type
+    volume = stats.volume_by_account
+    counts = stats.count_by_account
+    with open(path, "rb", buffering=1 << 20) as f:
+        if start:
+            f.seek(start - 1)
+            # skip to the first line that begins at or after `start`
+            if f.read(1) != b"\n":
+                f.readline()
+        position = f.tell()
+        for line in f:
+            if end is not None and position >= end:
+                break
+            position += len(line)
+            stats.lines += 1
+            m = match(line)
+            if m is None:
+                continue
+            stamp = m.group(1)
+            if (since_b and stamp < since_b) or (until_b and stamp >= until_b):
+                continue
+            failed = m.group(3)
+            if failed is not None:
+                stats.failures += 1
+                stats.failure_reasons[failed.decode("utf-8", "replace")] += 1
+            else:
+                stats.transactions += 1
+                tx_type = m.group(5).decode()
+                try:
+                    amount = float(m.group(6))
+                except ValueError:
+                    amount = 0.0
+                account = m.group(7).decode()
+                count_by_type[tx_type] += 1
+                amount_by_type[tx_type] += amount
+                volume[account] += amount
+                counts[account] += 1
+                if tx_type == "TRANSFER":
+                    stats.transfer_total += amount
+            if window_minutes:
+                bucket = stats.windows.get(key := _window_key(stamp[:16], window_minutes, minute_cache))
+                if bucket is None:
+                    bucket = stats.windows[key] = [0, 0]
+                bucket[1 if failed is not None else 0] += 1
+    return stats
+
+
+def byte_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    parts = max(1, min(parts, size or 1))
+    step = -(-size // parts)
+    return [(i, min(i + step, size)) for i in range(0, size, step)] or [(0, 0)]
+
+
+def analyze(path: str, workers: int = 1, window_minutes: Optional[int] = None,
+            since: Optional[str] = None, until: Optional[str] = None) -> LogStats:
+    """Analyze a log file, splitting it by byte range across `workers` processes."""
+    ranges = byte_ranges(path, workers)
+    if workers <= 1 or len(ranges) == 1:
+        return analyze_range(path, 0, None, window_minutes, since, until)
+    total = LogStats()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(analyze_range, path, start, end, window_minutes, since, until)
+                   for start, end in ranges]
+        for future in futures:
+            total.merge(future.result())
+    return total
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Aggregate transaction log statistics in one pass.")
+    parser.add_argument("path")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--window-minutes", type=int, default=None,
+                        help="also bucket counts into windows of this many minutes")
+    parser.add_argument("--since", help="only lines at or after 'YYYY-MM-DD HH:MM:SS'")
+    parser.add_argument("--until", help="only lines before 'YYYY-MM-DD HH:MM:SS'")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+    stats = analyze(args.path, args.workers, args.window_minutes, args.since, args.until)
+    print(json.dumps(stats.to_dict(args.top), indent=2) if args.json else stats.summary(args.top))
+
+
+if __name__ == "__main__":
+    main()
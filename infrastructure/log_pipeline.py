@@ -0,0 +1,98 @@
+# infrastructure/log_pipeline.py
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+from typing import List, Sequence
+
+_STOP = object()
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Enqueues records for a LogWriter without formatting them. When the queue
+    is full the record is either dropped (and counted) or the caller blocks
+    until there is room.
+    """
+    def __init__(self, log_queue: queue.Queue, block: bool = False):
+        super().__init__(log_queue)
+        self.block = block
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting is the writer's job, but the message is resolved here: its
+        # args may be objects the caller goes on to mutate
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.block:
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogWriter:
+    """
+    Background thread that drains the queue in batches, formats records and
+    writes each batch to every stream handler with a single write and flush.
+    Non-stream handlers get the records one by one.
+    """
+    def __init__(self, log_queue: queue.Queue, handlers: Sequence[logging.Handler], batch_size: int = 256):
+        self.queue = log_queue
+        self.handlers: List[logging.Handler] = list(handlers)
+        self.batch_size = batch_size
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write everything already queued, then stop the thread."""
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+        for handler in self.handlers:
+            handler.flush()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(r is _STOP for r in batch)
+            self._write([r for r in batch if r is not _STOP])
+            if stopping:
+                return
+
+    def _write(self, records: List[logging.LogRecord]) -> None:
+        for handler in self.handlers:
+            try:
+                if isinstance(handler, logging.StreamHandler):
+                    wanted = [r for r in records if r.levelno >= handler.level and handler.filter(r)]
+                    if wanted and handler.stream is None:
+                        # FileHandler(delay=True) opens its file on its first emit
+                        handler.handle(wanted.pop(0))
+                    lines = [handler.format(r) + handler.terminator for r in wanted]
+                    if lines:
+                        with handler.lock:
+                            handler.stream.write("".join(lines))
+                            handler.flush()
+                else:
+                    for record in records:
+                        if record.levelno >= handler.level:
+                            handler.handle(record)
+            except Exception:
+                # a broken sink must not kill the writer thread
+                if records:
+                    handler.handleError(records[-1])
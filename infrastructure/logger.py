@@ -1,11 +1,16 @@
+import atexit
 import logging
 import json
+import queue
 import uuid
 import time
 import functools
+import itertools
 import inspect
 from typing import Any, Callable, Dict, Optional, Union
-from datetime import datetime
+from domain.clock import get_clock
+from infrastructure.audit_log import SegmentedAuditLog
+from infrastructure.log_pipeline import BoundedQueueHandler, LogWriter
 
 # Configure logging formats
 DEFAULT_FORMAT = '%(asctime)s [%(levelname)s] [%(name)s] [%(transaction_id)s] %(message)s'
@@ -15,7 +20,10 @@ class BankingLogger:
    
     
     
-    def __init__(self, app_name: str = "banking-app", log_level: int = logging.INFO):
+    def __init__(self, app_name: str = "banking-app", log_level: int = logging.INFO,
+                 async_mode: bool = False, queue_size: int = 10000, block_when_full: bool = False,
+                 log_file: Optional[str] = None, batch_size: int = 256,
+                 audit_log: Optional[SegmentedAuditLog] = None):
         
         
         # Set up the root logger
@@ -27,13 +35,55 @@ class BankingLogger:
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
             self.root_logger.addHandler(console_handler)
+        if log_file:
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setFormatter(logging.Formatter(DEFAULT_FORMAT))
+            self.root_logger.addHandler(file_handler)
+
+        # Async mode: request threads only enqueue; a writer thread formats and does the I/O
+        self._queue_handler = None
+        self._writer = None
+        if async_mode:
+            self._enable_async(queue_size, block_when_full, batch_size)
         
+        # Optional structured, indexed copy of every log_transaction call
+        self.audit_log = audit_log
+
         # Create specialized loggers
         self.transaction_logger = self._create_transaction_logger(app_name)
         
         # Store component loggers
         self._component_loggers = {}
     
+    def _enable_async(self, queue_size: int, block_when_full: bool, batch_size: int) -> None:
+        log_queue = queue.Queue(maxsize=queue_size)
+        handlers = list(self.root_logger.handlers)
+        for handler in handlers:
+            self.root_logger.removeHandler(handler)
+        self._queue_handler = BoundedQueueHandler(log_queue, block=block_when_full)
+        self.root_logger.addHandler(self._queue_handler)
+        self._writer = LogWriter(log_queue, handlers, batch_size)
+        self._writer.start()
+        atexit.register(self.shutdown)
+
+    @property
+    def dropped_records(self) -> int:
+        return self._queue_handler.dropped if self._queue_handler else 0
+
+    def shutdown(self) -> None:
+        """Flush queued records and stop the writer thread; sync mode just flushes."""
+        if self._writer is not None:
+            self._writer.stop()
+            # later records go straight to the real handlers again
+            self.root_logger.removeHandler(self._queue_handler)
+            for handler in self._writer.handlers:
+                self.root_logger.addHandler(handler)
+            self._writer = None
+            self._queue_handler = None
+            atexit.unregister(self.shutdown)
+        for handler in self.root_logger.handlers:
+            handler.flush()
+    
     def _create_transaction_logger(self, app_name: str) -> logging.Logger:
         """Create a specialized logger for transaction events."""
         logger = logging.getLogger(f"{app_name}.transactions")
@@ -67,6 +117,14 @@ class BankingLogger:
         # Format details as JSON
         details_json = json.dumps(details)
         self.transaction_logger.log(level, f"{transaction_type}: {details_json}", extra=extra)
+        if self.audit_log is not None:
+            self.audit_log.append({
+                'transaction_id': transaction_id,
+                'transaction_type': transaction_type,
+                'level': logging.getLevelName(level),
+                'logged_at': get_clock().now().isoformat(),
+                'details': details,
+            })
     
     def log(self, level: int, message: str, transaction_id: Optional[str] = None, **kwargs) -> None:
                 
@@ -88,73 +146,89 @@ class BankingLogger:
 
 
 # Decorator for method logging
+SENSITIVE_ARGS = frozenset(('password', 'pin', 'secret'))
+
+
 def log_method_call(logger: Optional[Union[BankingLogger, logging.Logger]] = None, 
-                   level: int = logging.DEBUG):
-   
+                   level: int = logging.DEBUG, sample_rate: int = 1):
+    """
+    Log entry, exit and duration of each call at `level`, and exceptions at
+    ERROR. When `level` is disabled the wrapper only adds a function call;
+    `sample_rate=N` logs one call in N.
+    """
+    if sample_rate < 1:
+        raise ValueError("Sample rate must be at least 1")
+
     def decorator(func: Callable) -> Callable:
+        # resolved once, not per call
+        sig = inspect.signature(func)
+        qualname = func.__qualname__
+        calls = itertools.count()
+        # an explicit logger is fixed; otherwise each class gets its component logger
+        # (subclasses inherit the method, so the first caller's class must not stick)
+        by_class: Dict[Optional[type], logging.Logger] = {}
+        # Get actual logger object if BankingLogger was provided
+        fixed = logger.root_logger if isinstance(logger, BankingLogger) else logger
+
+        def resolve(args) -> logging.Logger:
+            if fixed is not None:
+                return fixed
+            owner = args[0].__class__ if args else None
+            log = by_class.get(owner)
+            if log is None:
+                if owner is not None:
+                    log = banking_logger.get_component_logger(owner.__name__.lower())
+                else:
+                    log = banking_logger.root_logger
+                by_class[owner] = log
+            return log
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            # Get appropriate logger
-            nonlocal logger
-            if logger is None:
-                # Try to get class name if it's a method
-                if args and hasattr(args[0], '__class__'):
-                    component = args[0].__class__.__name__.lower()
-                    logger = banking_logger.get_component_logger(component)
-                else:
-                    logger = banking_logger.root_logger
-            
-            # Get actual logger object if BankingLogger was provided
-            log_obj = logger.root_logger if isinstance(logger, BankingLogger) else logger
-            
-            # Generate a unique ID for this call
-            call_id = str(uuid.uuid4())[:8]
-            
-            # Get function signature and arguments
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-            
-            # Filter out sensitive data
-            safe_args = {}
-            for k, v in bound_args.arguments.items():
-                if k in ('password', 'pin', 'secret'):
-                    safe_args[k] = '******'
-                else:
-                    safe_args[k] = v
-            
-            # Remove 'self' from logged arguments
-            if 'self' in safe_args:
-                del safe_args['self']
-            
-            # Log method entry
-            log_obj.log(level, 
-                      f"CALL {func.__qualname__} START [id={call_id}] args={safe_args}", 
-                      extra={'transaction_id': 'N/A'})
-            
-            start_time = time.time()
-            try:
-                result = func(*args, **kwargs)
-                
-                # Log successful completion
-                duration = time.time() - start_time
-                log_obj.log(level, 
-                          f"CALL {func.__qualname__} END [id={call_id}] duration={duration:.4f}s result={result}", 
-                          extra={'transaction_id': 'N/A'})
-                return result
-            except Exception as e:
-                # Log exception
-                duration = time.time() - start_time
-                log_obj.log(logging.ERROR, 
-                          f"CALL {func.__qualname__} ERROR [id={call_id}] duration={duration:.4f}s exception={str(e)}", 
-                          extra={'transaction_id': 'N/A'})
-                raise
-        
+            log = resolve(args)
+            if not log.isEnabledFor(level) or (sample_rate > 1 and next(calls) % sample_rate):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if log.isEnabledFor(logging.ERROR):
+                        log.error("CALL %s ERROR exception=%s", qualname, e, extra=_NO_TX)
+                    raise
+            return _logged_call(log, func, sig, qualname, level, args, kwargs)
+
         return wrapper
-    
+
     return decorator
 
 
+_NO_TX = {'transaction_id': 'N/A'}
+
+
+def _logged_call(log: logging.Logger, func: Callable, sig: inspect.Signature, qualname: str,
+                 level: int, args, kwargs):
+    call_id = uuid.uuid4().hex[:8]
+    bound_args = sig.bind(*args, **kwargs)
+    bound_args.apply_defaults()
+    # Filter out sensitive data and 'self'
+    safe_args = {
+        k: '******' if k in SENSITIVE_ARGS else v
+        for k, v in bound_args.arguments.items() if k != 'self'
+    }
+    log.log(level, "CALL %s START [id=%s] args=%s", qualname, call_id, safe_args, extra=_NO_TX)
+
+    start = time.perf_counter_ns()
+    try:
+        result = func(*args, **kwargs)
+    except Exception as e:
+        duration = (time.perf_counter_ns() - start) / 1e9
+        log.error("CALL %s ERROR [id=%s] duration=%.4fs exception=%s",
+                  qualname, call_id, duration, e, extra=_NO_TX)
+        raise
+    duration = (time.perf_counter_ns() - start) / 1e9
+    log.log(level, "CALL %s END [id=%s] duration=%.4fs result=%s",
+            qualname, call_id, duration, result, extra=_NO_TX)
+    return result
+
+
 # Create a singleton instance
 banking_logger = BankingLogger()
 
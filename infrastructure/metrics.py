@@ -0,0 +1,221 @@
+# infrastructure/metrics.py
+import functools
+import math
+import threading
+from threading import Lock
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Bucket upper bounds in microseconds: 1us, 2us, 4us, ... ~33.5s
+LATENCY_BOUNDS_US: Tuple[int, ...] = tuple(2 ** k for k in range(26))
+_LE = tuple(f'le="{bound / 1e6:g}"' for bound in LATENCY_BOUNDS_US) + ('le="+Inf"',)
+
+Labels = Tuple[str, ...]
+
+
+class _Sharded:
+    """
+    Base for metrics that accumulate in per-thread shards. A writer only
+    ever touches its own thread's dict, so recording takes no lock; the
+    shard list is locked only when a thread records for the first time.
+    Scrapes sum the shards.
+    """
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = Lock()
+
+    def _shard(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            return shard
+
+    def _snapshot(self) -> Iterable[Tuple[Labels, object]]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # list() over a dict runs without releasing the GIL, so a
+            # concurrent insert by the owning thread cannot break it
+            yield from list(shard.items())
+
+    def _labels(self, values: Labels, extra: str = "") -> str:
+        pairs = [f'{k}="{_escape(v)}"' for k, v in zip(self.label_names, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Histogram(_Sharded):
+    """Latency histogram with power-of-two microsecond buckets."""
+    type_name = "histogram"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        super().__init__(name, help_text, label_names)
+        self._overflow = len(LATENCY_BOUNDS_US)
+
+    def observe_ns(self, ns: int, *labels: str) -> None:
+        shard = self._shard()
+        cell = shard.get(labels)
+        if cell is None:
+            # one count per bucket, then the +Inf bucket, then the sum in ns
+            cell = shard[labels] = [0] * (self._overflow + 2)
+        micros = -(-ns // 1000)
+        cell[min((micros - 1).bit_length(), self._overflow) if micros > 1 else 0] += 1
+        cell[-1] += ns
+
+    def observe(self, seconds: float, *labels: str) -> None:
+        self.observe_ns(int(seconds * 1e9), *labels)
+
+    def time(self, *labels: str) -> "_Timer":
+        return _Timer(self, labels)
+
+    def collect(self) -> Dict[Labels, List[int]]:
+        totals: Dict[Labels, List[int]] = {}
+        for labels, cell in self._snapshot():
+            total = totals.get(labels)
+            if total is None:
+                totals[labels] = list(cell)
+            else:
+                for i, value in enumerate(cell):
+                    total[i] += value
+        return totals
+
+    def render(self) -> List[str]:
+        lines = []
+        for labels, cell in sorted(self.collect().items()):
+            cumulative = 0
+            # the last bucket is +Inf, so the final cumulative value is the count
+            for le, count in zip(_LE, cell):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{self._labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(labels)} {cell[-1] / 1e9:.9f}")
+            lines.append(f"{self.name}_count{self._labels(labels)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.started = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.histogram.observe_ns(perf_counter_ns() - self.started, *self.labels)
+
+
+class Gauge(_Sharded):
+    """
+    Gauge made of per-thread deltas (inc/dec may happen on different
+    threads) or, when `read` is given, a callback evaluated at scrape time.
+    """
+    type_name = "gauge"
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 read: Optional[Callable[[], float]] = None):
+        super().__init__(name, help_text, label_names)
+        self.read = read
+
+    def inc(self, amount: float = 1, *labels: str) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def dec(self, amount: float = 1, *labels: str) -> None:
+        self.inc(-amount, *labels)
+
+    def collect(self) -> Dict[Labels, float]:
+        if self.read is not None:
+            return {(): self.read()}
+        totals: Dict[Labels, float] = {}
+        for labels, value in self._snapshot():
+            totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def render(self) -> List[str]:
+        try:
+            values = self.collect()
+        except Exception:
+            # a gauge whose source is unavailable is left out of the scrape
+            return []
+        return [f"{self.name}{self._labels(labels)} {_number(value)}" for labels, value in sorted(values.items())]
+
+
+class MetricsRegistry:
+    """Named metrics rendered together in Prometheus text format."""
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, _Sharded] = {}
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> Histogram:
+        return self._register(Histogram(name, help_text, label_names))
+
+    def gauge(self, name: str, help_text: str, label_names: Sequence[str] = (),
+              read: Optional[Callable[[], float]] = None) -> Gauge:
+        return self._register(Gauge(name, help_text, label_names, read))
+
+    def _register(self, metric):
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def get(self, name: str):
+        return self._metrics[name]
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def instrument(target, histogram: Histogram, methods: Optional[Sequence[str]] = None):
+    """
+    Time the public methods of one object into `histogram`, labelled with
+    the object's class and the method name. Wraps the instance only, so
+    other instances and isinstance checks are unaffected. Returns target.
+    """
+    component = type(target).__name__
+    if methods is None:
+        methods = [name for name in dir(type(target))
+                   if not name.startswith("_") and callable(getattr(type(target), name, None))]
+    for name in methods:
+        setattr(target, name, _timed(getattr(target, name), histogram, (component, name)))
+    return target
+
+
+def _timed(method, histogram: Histogram, labels: Labels):
+    observe = histogram.observe_ns
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            observe(perf_counter_ns() - started, *labels)
+    return wrapper
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, float) and not math.isfinite(value):
+        return "NaN" if math.isnan(value) else ("+Inf" if value > 0 else "-Inf")
+    return f"{value:g}" if isinstance(value, float) else str(value)
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Callable, Dict, Iterator, List
 from application.services import TransactionRepositoryInterface
 from domain.accounts.transaction import Transaction
 
@@ -9,16 +9,29 @@ class InMemoryTransactionRepository(TransactionRepositoryInterface):
         self._transactions: Dict[str, Transaction] = {}
         # index for quick lookup by account
         self._by_account: Dict[str, List[str]] = {}
+        # called with each saved transaction, e.g. to invalidate caches
+        self._save_listeners: List[Callable[[Transaction], None]] = []
+
+    def add_save_listener(self, listener: Callable[[Transaction], None]) -> None:
+        self._save_listeners.append(listener)
 
     def save_transaction(self, transaction: Transaction) -> str:
         self._transactions[transaction.transaction_id] = transaction
         self._by_account.setdefault(transaction.account_id, []).append(transaction.transaction_id)
+        for listener in self._save_listeners:
+            listener(transaction)
         return transaction.transaction_id
 
     def list_transactions(self, account_id: str) -> List[Transaction]:
         tx_ids = self._by_account.get(account_id, [])
         return [self._transactions[tx_id] for tx_id in tx_ids]
     
+    def iter_transactions(self, account_id: str) -> Iterator[Transaction]:
+        tx_ids = self._by_account.get(account_id, [])
+        # bound by the current length so transactions saved mid-iteration are not picked up
+        for i in range(len(tx_ids)):
+            yield self._transactions[tx_ids[i]]
+    
     def find_transaction_by_id(self, tx_id: str) -> Transaction:
         tx = self._transactions.get(tx_id)
         if not tx:
@@ -0,0 +1,288 @@
+# presentation/admission.py
+import asyncio
+import json
+import re
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from starlette.responses import JSONResponse
+
+
+class TokenBucketTable:
+    """
+    Token buckets for many keys, striped across independent locks. Each
+    stripe stores bucket state in two flat float arrays indexed by slot, so
+    a bucket costs a dict entry and two doubles.
+    """
+    def __init__(self, rate: float, burst: float, stripes: int = 16, max_keys_per_stripe: int = 4096):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("Token bucket rate and burst must be positive")
+        self.rate = rate
+        self.burst = burst
+        self.max_keys_per_stripe = max_keys_per_stripe
+        self._stripes = [_BucketStripe() for _ in range(stripes)]
+
+    def try_acquire(self, key: str, now: float, cost: float = 1.0) -> float:
+        """Take `cost` tokens; return 0.0 on success, else seconds until enough tokens exist."""
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            slot = stripe.slots.get(key)
+            if slot is None:
+                slot = stripe.allocate(key, self.burst, now, self.rate, self.max_keys_per_stripe)
+            tokens = min(self.burst, stripe.tokens[slot] + (now - stripe.stamps[slot]) * self.rate)
+            stripe.stamps[slot] = now
+            if tokens >= cost:
+                stripe.tokens[slot] = tokens - cost
+                return 0.0
+            stripe.tokens[slot] = tokens
+            return (cost - tokens) / self.rate
+
+    def refund(self, key: str, cost: float = 1.0) -> None:
+        """Return tokens taken by a request that was rejected further on."""
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            slot = stripe.slots.get(key)
+            if slot is not None:
+                stripe.tokens[slot] = min(self.burst, stripe.tokens[slot] + cost)
+
+    def __len__(self) -> int:
+        return sum(len(s.slots) for s in self._stripes)
+
+
+class _BucketStripe:
+    __slots__ = ("lock", "slots", "tokens", "stamps", "free")
+
+    def __init__(self):
+        self.lock = Lock()
+        self.slots: Dict[str, int] = {}
+        self.tokens = array('d')
+        self.stamps = array('d')
+        self.free: List[int] = []
+
+    def allocate(self, key: str, burst: float, now: float, rate: float, capacity: int) -> int:
+        if len(self.slots) >= capacity:
+            self._evict(burst, now, rate)
+        if self.free:
+            slot = self.free.pop()
+            self.tokens[slot] = burst
+            self.stamps[slot] = now
+        else:
+            slot = len(self.tokens)
+            self.tokens.append(burst)
+            self.stamps.append(now)
+        self.slots[key] = slot
+        return slot
+
+    def _evict(self, burst: float, now: float, rate: float) -> None:
+        # Buckets that have refilled completely hold no state worth keeping
+        full = [k for k, s in self.slots.items()
+                if self.tokens[s] + (now - self.stamps[s]) * rate >= burst]
+        if not full:
+            # otherwise drop the least recently used bucket
+            full = [min(self.slots, key=lambda k: self.stamps[self.slots[k]])]
+        for key in full:
+            self.free.append(self.slots.pop(key))
+
+
+@dataclass
+class RouteLimits:
+    """
+    Admission settings for one route. Rates are requests per second;
+    None disables that bucket. `account_field` names the JSON body field
+    holding the account ID when it is not a path parameter.
+    """
+    client_rate: Optional[float] = None
+    client_burst: Optional[float] = None
+    account_rate: Optional[float] = None
+    account_burst: Optional[float] = None
+    account_field: Optional[str] = None
+    # longest a request may wait for a concurrency slot
+    deadline_ms: float = 1000.0
+
+
+class _Route:
+    def __init__(self, key: Optional[str], limits: RouteLimits):
+        # key is "METHOD /path/{param}"; None for the catch-all default
+        if key is None:
+            self.method, self.regex = None, None
+        else:
+            method, template = key.split(" ", 1)
+            self.method = method.upper()
+            parts = re.split(r"\{(\w+)\}", template)
+            # odd entries are parameter names, even entries literal text
+            pattern = "".join(
+                f"(?P<{part}>[^/]+)" if i % 2 else re.escape(part) for i, part in enumerate(parts)
+            )
+            self.regex = re.compile(f"^{pattern}$")
+        self.limits = limits
+        self.clients = self._table(limits.client_rate, limits.client_burst)
+        self.accounts = self._table(limits.account_rate, limits.account_burst)
+
+    @staticmethod
+    def _table(rate: Optional[float], burst: Optional[float]) -> Optional[TokenBucketTable]:
+        if rate is None:
+            return None
+        return TokenBucketTable(rate, burst or rate)
+
+
+class AdmissionController:
+    """
+    Per-client and per-account token buckets, a global concurrency cap and
+    a bounded wait queue. Requests are rejected fast with 429 when a bucket
+    is empty and 503 when the queue is full or the wait would miss the
+    request's deadline.
+
+    Clients are identified by their peer address. The `X-Client-Id` header
+    is only honoured on requests arriving from `trusted_proxies`, which are
+    expected to set it themselves.
+    """
+    def __init__(self, max_concurrency: int = 64, max_queue: int = 256,
+                 routes: Dict[str, RouteLimits] = None, default: RouteLimits = None,
+                 trusted_proxies: Iterable[str] = ()):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.trusted_proxies = frozenset(trusted_proxies)
+        self._routes = [_Route(key, limits) for key, limits in (routes or {}).items()]
+        self._default = _Route(None, default or RouteLimits())
+        self.in_flight = 0
+        self._waiters: deque = deque()
+        self.rejected_rate = 0
+        self.rejected_overload = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def match(self, method: str, path: str) -> Tuple[_Route, Optional[str]]:
+        for route in self._routes:
+            if route.method == method:
+                m = route.regex.match(path)
+                if m:
+                    return route, m.groupdict().get("account_id")
+        return self._default, None
+
+    def client_id(self, scope, headers: Dict[bytes, bytes]) -> str:
+        peer = (scope.get("client") or ("unknown",))[0]
+        if peer in self.trusted_proxies:
+            return headers.get(b"x-client-id", b"").decode() or peer
+        return peer
+
+    def check_rate(self, route: _Route, client_id: str, account_id: Optional[str], now: float) -> float:
+        if route.clients is not None:
+            wait = route.clients.try_acquire(client_id, now)
+            if wait:
+                return wait
+        if route.accounts is not None and account_id is not None:
+            wait = route.accounts.try_acquire(account_id, now)
+            if wait and route.clients is not None:
+                # a request the account bucket turns away costs the client nothing
+                route.clients.refund(client_id)
+            return wait
+        return 0.0
+
+    async def acquire(self, timeout: float) -> bool:
+        if self.in_flight < self.max_concurrency and not self._waiters:
+            self.in_flight += 1
+            return True
+        if len(self._waiters) >= self.max_queue or timeout <= 0:
+            return False
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            # the slot may have been handed over just as the wait timed out
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            return False
+
+    def release(self) -> None:
+        # hand the slot straight to the oldest live waiter
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.in_flight -= 1
+
+
+class AdmissionControlMiddleware:
+    """ASGI middleware applying an AdmissionController to HTTP requests."""
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        controller = self.controller
+        route, account_id = controller.match(scope["method"], scope["path"])
+        headers = dict(scope.get("headers") or ())
+        client_id = controller.client_id(scope, headers)
+
+        if account_id is None and route.limits.account_field and route.accounts is not None:
+            body = await _read_body(receive)
+            receive = _replay(body, receive)
+            try:
+                account_id = json.loads(body or b"{}").get(route.limits.account_field)
+            except (ValueError, AttributeError):
+                account_id = None
+
+        retry_after = controller.check_rate(route, client_id, account_id, time.monotonic())
+        if retry_after:
+            controller.rejected_rate += 1
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"}, status_code=429,
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+            )
+            await response(scope, receive, send)
+            return
+
+        timeout = route.limits.deadline_ms / 1000
+        client_deadline = headers.get(b"x-request-deadline-ms")
+        if client_deadline:
+            try:
+                timeout = min(timeout, float(client_deadline) / 1000)
+            except ValueError:
+                pass
+        if not await controller.acquire(timeout):
+            controller.rejected_overload += 1
+            response = JSONResponse({"detail": "Server overloaded"}, status_code=503,
+                                    headers={"Retry-After": "1"})
+            await response(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            controller.release()
+
+
+async def _read_body(receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body"):
+            return b"".join(chunks)
+
+
+def _replay(body: bytes, original):
+    # hand the buffered body to the app once, then fall through to the real channel
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await original()
+
+    return receive
@@ -1,19 +1,31 @@
 # main.py
 
-from fastapi import FastAPI, HTTPException, Response
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from anyio import to_thread
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import date
 
 # Domain & Infrastructure imports
+from domain.clock import get_clock
 from infrastructure.account_repo import InMemoryAccountRepository
 from infrastructure.transaction_repo import InMemoryTransactionRepository
 from infrastructure.interest.interest_repo import ConfigInterestStrategyRepository
 from infrastructure.interest.interest_service import InterestServiceImpl
+from infrastructure.interest.preview_cache import InterestPreviewCache
 from infrastructure.interest.limit_service import LimitEnforcementServiceImpl
 from infrastructure.interest.statementgenerator import StatementServiceImpl
+from infrastructure.interest.statement_cache import CachingStatementService, StatementCache
 from infrastructure.interest.csv_statement_adapter import CsvStatementAdapter
-from infrastructure.interest.pdf_statement_adapter import PdfStatementAdapter
+from infrastructure.interest.pdf_render_pool import PdfRenderPool, RenderQueueFull, RenderedStatementCache
+from infrastructure.metrics import MetricsRegistry, instrument
+from presentation.admission import AdmissionControlMiddleware, AdmissionController, RouteLimits
+from presentation.instrumentation import MetricsMiddleware
 
 
 # Application-layer service imports
@@ -37,23 +49,44 @@ class TransferRequest(BaseModel):
     destination_account_id: str
     amount: float
 
+class BalancesRequest(BaseModel):
+    ids: List[str]
+
+# flat id -> balance map; far cheaper to serialize than a list of objects
+class BalancesResponse(BaseModel):
+    balances: Dict[str, float]
+    missing: List[str]
+
+class StripingRequest(BaseModel):
+    stripes: int = 8
+
 class InterestRequest(BaseModel):
     calculationDate: date
 
 class PreviewRequest(BaseModel):
     calculationDate: date
 
+class ProjectionRequest(BaseModel):
+    startDate: date
+    endDate: date
+    stepDays: int = 1
+
 class LimitsConfig(BaseModel):
     dailyLimit: float
     monthlyLimit: float
+    rolling24hLimit: Optional[float] = None
+    rolling30dLimit: Optional[float] = None
 
 # Instantiate repositories
 account_repo     = InMemoryAccountRepository()
 transaction_repo = InMemoryTransactionRepository()
 
+# Limits are enforced on every deposit, withdrawal and transfer
+limit_service    = LimitEnforcementServiceImpl(account_repo)
+
 # Week 1 services
 account_service = AccountCreationService(account_repo)
-tx_service      = TransactionService(account_repo, transaction_repo)
+tx_service      = TransactionService(account_repo, transaction_repo, limit_service)
 
 # Week 2: logging decorator and notifications (if any)
 # If you have a logger decorator, wrap tx_service here.
@@ -62,21 +95,91 @@ tx_service      = TransactionService(account_repo, transaction_repo)
 transfer_service = FundTransferService(
     account_repo,
     transaction_repo,
-    notification_adapter=None  # or your concrete adapter
+    notification_adapter=None,  # or your concrete adapter
+    limit_service=limit_service,
 )
 
 # Week 3 services
 strategy_repo = ConfigInterestStrategyRepository()  # reads config/interest_rates.json
-interest_service = InterestServiceImpl(account_repo, strategy_repo)
-limit_service    = LimitEnforcementServiceImpl(account_repo)
-statement_service = StatementServiceImpl(account_repo, transaction_repo)
+preview_cache = InterestPreviewCache(max_entries=10000)
+interest_service = InterestServiceImpl(account_repo, strategy_repo, preview_cache)
+# Statements are cached per (account, year, month) until a transaction lands in that month
+statement_cache = StatementCache(max_entries=1024)
+transaction_repo.add_save_listener(statement_cache.transaction_saved)
+statement_service = CachingStatementService(
+    StatementServiceImpl(account_repo, transaction_repo), statement_cache, account_repo
+)
+# larger CSV renders are streamed without being kept, so memory stays flat
+MAX_CACHED_CSV_BYTES = 1 << 20
 
 # Statement adapters
 csv_adapter = CsvStatementAdapter()
-pdf_adapter = PdfStatementAdapter()
+# PDF layout runs in worker processes; rendered bytes are cached by content
+pdf_pool = PdfRenderPool(
+    max_workers=2,
+    max_queue=16,
+    cache=RenderedStatementCache(max_entries=256, spill_dir=os.environ.get("STATEMENT_CACHE_DIR")),
+)
+
 
+# Admission control: per-client and per-account token buckets, a global
+# concurrency cap and deadline-aware shedding (429/503 when saturated)
+admission = AdmissionController(
+    max_concurrency=64,
+    max_queue=256,
+    # only these peers may name the client with X-Client-Id
+    trusted_proxies=[p for p in os.environ.get("TRUSTED_PROXIES", "").split(",") if p],
+    routes={
+        "POST /accounts/transfer": RouteLimits(
+            client_rate=50, client_burst=100,
+            account_rate=20, account_burst=40,
+            account_field="source_account_id", deadline_ms=2000,
+        ),
+        "POST /accounts/{account_id}/deposit": RouteLimits(
+            client_rate=100, client_burst=200, account_rate=50, account_burst=100,
+        ),
+        "POST /accounts/{account_id}/withdraw": RouteLimits(
+            client_rate=100, client_burst=200, account_rate=50, account_burst=100,
+        ),
+        "GET /accounts/{account_id}/statement": RouteLimits(
+            client_rate=10, client_burst=20, deadline_ms=5000,
+        ),
+    },
+    default=RouteLimits(client_rate=200, client_burst=400),
+)
 
-app = FastAPI()
+# Metrics, served in Prometheus text format on /metrics
+metrics = MetricsRegistry()
+request_latency = metrics.histogram(
+    "banking_http_request_duration_seconds", "HTTP request latency.", ("method", "route", "status")
+)
+call_latency = metrics.histogram(
+    "banking_call_duration_seconds", "Service, repository and rendering call latency.", ("component", "method")
+)
+requests_in_flight = metrics.gauge("banking_http_requests_in_flight", "HTTP requests being handled.")
+metrics.gauge("banking_admission_queue_depth", "Requests waiting for a concurrency slot.",
+              read=lambda: admission.queue_depth)
+metrics.gauge("banking_pdf_render_outstanding", "PDF renders queued or running.",
+              read=lambda: pdf_pool.outstanding)
+metrics.gauge("banking_threadpool_busy_threads", "Worker threads running sync endpoints.",
+              read=lambda: to_thread.current_default_thread_limiter().borrowed_tokens)
+metrics.gauge("banking_threadpool_capacity", "Worker thread limit for sync endpoints.",
+              read=lambda: to_thread.current_default_thread_limiter().total_tokens)
+for target in (account_repo, transaction_repo, tx_service, transfer_service,
+               interest_service, statement_service.inner):
+    instrument(target, call_latency)
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    # stop the PDF worker processes with the server
+    pdf_pool.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(AdmissionControlMiddleware, controller=admission)
+# added last so it is outermost and also times requests admission control rejects
+app.add_middleware(MetricsMiddleware, latency=request_latency, in_flight=requests_in_flight)
 @app.get("/", tags=["root"])
 def read_root():
     return {"message": "Welcome to the Banking API. See /docs for usage."}
@@ -110,12 +213,48 @@ def withdraw(account_id: str, req: AmountRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+MAX_BALANCE_IDS = 1000
+
+
+@app.get("/accounts/balances", response_model=BalancesResponse)
+def get_balances(ids: List[str] = Query(...)):
+    # accepts ?ids=a&ids=b as well as ?ids=a,b
+    return _balances([i for value in ids for i in value.split(",") if i])
+
+
+@app.post("/accounts/balances", response_model=BalancesResponse)
+def post_balances(req: BalancesRequest):
+    return _balances(req.ids)
+
+
+def _balances(ids: List[str]) -> dict:
+    if len(ids) > MAX_BALANCE_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BALANCE_IDS} ids per request")
+    found = account_repo.get_accounts(ids)
+    return {
+        "balances": {i: a.balance for i, a in found.items()},
+        "missing": [i for i in ids if i not in found],
+    }
+
+
 @app.get("/accounts/{account_id}/balance")
 def get_balance(account_id: str):
     acct = account_repo.get_account(account_id)
     return {"balance": acct.balance}
 
 
+@app.get("/owners/{owner}/accounts")
+def list_owner_accounts(owner: str):
+    # served from the repository's owner index, not a scan of every account
+    return {
+        "owner": owner,
+        "accounts": [
+            {"account_id": a.account_id, "account_type": a.account_type(), "balance": a.balance}
+            for a in account_repo.get_accounts_by_owner(owner)
+        ],
+    }
+
+
 @app.get("/accounts/{account_id}/transactions")
 def list_transactions(account_id: str):
     txs = transaction_repo.list_transactions_for_account(account_id)
@@ -142,6 +281,24 @@ def transfer(req: TransferRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/accounts/{account_id}/striping")
+def enable_striping(account_id: str, req: StripingRequest):
+    # Opt a high fan-in account (merchant, settlement) into striped balances
+    try:
+        account_repo.enable_striping(account_id, req.stripes)
+        return {"account_id": account_id, "stripes": account_repo.get_account(account_id).stripe_count}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.delete("/accounts/{account_id}/striping")
+def disable_striping(account_id: str):
+    try:
+        account_repo.disable_striping(account_id)
+        return {"account_id": account_id, "stripes": 1}
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
 # --- Week 3 Endpoints ---
 
@@ -163,17 +320,34 @@ def preview_interest(account_id: str, req: PreviewRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.get("/interest/preview/cache")
+def preview_cache_stats():
+    return preview_cache.stats()
+
+
+@app.post("/accounts/{account_id}/interest/projection")
+def project_interest(account_id: str, req: ProjectionRequest):
+    try:
+        curve = interest_service.calculate_interest_projection(
+            account_id, req.startDate, req.endDate, req.stepDays
+        )
+        return {
+            "projection": [
+                {"date": d.isoformat(), "interest": interest} for d, interest in curve
+            ]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.patch("/accounts/{account_id}/limits")
 def configure_limits(account_id: str, cfg: LimitsConfig):
     try:
-        limit_service.configure_limits(account_id, cfg.dailyLimit, cfg.monthlyLimit)
+        limit_service.configure_limits(
+            account_id, cfg.dailyLimit, cfg.monthlyLimit, cfg.rolling24hLimit, cfg.rolling30dLimit
+        )
         saved = account_repo.get_constraints(account_id)
-        return {
-            "dailyLimit": saved.daily_limit,
-            "monthlyLimit": saved.monthly_limit,
-            "dailyUsed": saved.daily_used,
-            "monthlyUsed": saved.monthly_used,
-        }
+        return _limits_response(saved)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -181,31 +355,86 @@ def configure_limits(account_id: str, cfg: LimitsConfig):
 @app.get("/accounts/{account_id}/limits")
 def get_limits(account_id: str):
     c = account_repo.get_constraints(account_id)
+    return _limits_response(c)
+
+
+def _limits_response(c):
     return {
         "dailyLimit": c.daily_limit,
         "monthlyLimit": c.monthly_limit,
         "dailyUsed": c.daily_used,
         "monthlyUsed": c.monthly_used,
+        "rolling24hLimit": c.rolling_24h_limit,
+        "rolling30dLimit": c.rolling_30d_limit,
+        "rolling24hUsed": c.rolling_24h_used(),
+        "rolling30dUsed": c.rolling_30d_used(),
     }
 
 
+@app.get("/statements/cache")
+def statement_cache_stats():
+    return statement_cache.stats()
+
+
+# async so the thread pool gauges are read on the event loop
+@app.get("/metrics")
+async def get_metrics():
+    return Response(content=metrics.render(), media_type=MetricsRegistry.CONTENT_TYPE)
+
+
 @app.get("/accounts/{account_id}/statement")
-def get_statement(
+async def get_statement(
     account_id: str,
     year: int,
     month: int,
     format: Optional[str] = "json"
 ):
     try:
-        stmt = statement_service.generate_statement(account_id, year, month, date.today())
+        today = get_clock().today()
+        key = (account_id, year, month)
+        # read before building, so a write that races the build invalidates the result
+        version = statement_service.account_version(account_id)
+        generation = statement_cache.generation(key)
         if format.lower() == "csv":
-            data = csv_adapter.render(stmt)
-            return Response(content=data, media_type="text/csv")
-        elif format.lower() == "pdf":
-            data = pdf_adapter.render(stmt)
+            cached = statement_cache.get_render(key, "csv", today, version)
+            if cached is not None:
+                return Response(content=cached, media_type="text/csv")
+            # rows are read and encoded as the client consumes them
+            stmt = await run_in_threadpool(
+                statement_service.stream_statement, account_id, year, month, today
+            )
+            chunks = _caching_chunks(key, today, version, generation, csv_adapter.iter_render(stmt))
+            return StreamingResponse(chunks, media_type="text/csv")
+        stmt = await run_in_threadpool(
+            statement_service.generate_statement, account_id, year, month, today
+        )
+        if format.lower() == "pdf":
+            data = statement_cache.get_render(key, "pdf", today, version)
+            if data is None:
+                with call_latency.time("PdfRenderPool", "render"):
+                    # hashing the statement and probing the disk cache stay off the event loop
+                    data = await asyncio.wrap_future(await run_in_threadpool(pdf_pool.submit, stmt))
+                statement_cache.put_render(key, "pdf", today, data, version, generation)
             return Response(content=data, media_type="application/pdf")
         else:
             # JSON fallback
             return stmt
+    except RenderQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+
+def _caching_chunks(key, generated_on, version, generation, chunks):
+    # pass CSV chunks through to the client; keep the output only while it stays small
+    parts, size = [], 0
+    for chunk in chunks:
+        if parts is not None:
+            size += len(chunk)
+            if size <= MAX_CACHED_CSV_BYTES:
+                parts.append(chunk)
+            else:
+                parts = None
+        yield chunk
+    if parts is not None:
+        statement_cache.put_render(key, "csv", generated_on, b"".join(parts), version, generation)
@@ -0,0 +1,42 @@
+# presentation/instrumentation.py
+from time import perf_counter_ns
+
+from infrastructure.metrics import Gauge, Histogram
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording request latency by method, route template and
+    status, and the number of requests in flight. Latency runs until the
+    response body has been sent, so streamed responses are timed in full.
+    """
+    def __init__(self, app, latency: Histogram, in_flight: Gauge):
+        self.app = app
+        self.latency = latency
+        self.in_flight = in_flight
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc()
+        started = perf_counter_ns()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.in_flight.dec()
+            # the router stores the matched route in the scope; label by its
+            # template so path parameters do not explode the series count
+            route = scope.get("route")
+            self.latency.observe_ns(
+                perf_counter_ns() - started,
+                scope["method"], getattr(route, "path", "unmatched"), str(status),
+            )
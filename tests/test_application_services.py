@@ -21,7 +21,7 @@ def test_create_account_calls_repo_and_business_rule():
         mock_repo.create_account.assert_called_once()
         mock_check.assert_called_once_with(owner, initial_deposit, account_type)
 
-def test_deposit_calls_repos_and_updates_account():
+def test_deposit_applies_delta_in_repo():
     mock_account_repo = Mock()
     mock_transaction_repo = Mock()
     service = TransactionService(mock_account_repo, mock_transaction_repo)
@@ -29,8 +29,6 @@ def test_deposit_calls_repos_and_updates_account():
     account_id = "acc123"
     amount = 500.0
 
-    mock_account = Mock()
-    mock_account_repo.get_account.return_value = mock_account
     mock_transaction_repo.save_transaction.return_value = "tx123"
 
     with patch("application.services.Transaction", autospec=True) as mock_transaction_class:
@@ -38,12 +36,12 @@ def test_deposit_calls_repos_and_updates_account():
 
         result = service.deposit(account_id, amount)
 
-        mock_account.deposit.assert_called_once_with(amount)
-        mock_account_repo.update_account.assert_called_once_with(mock_account)
+        mock_account_repo.apply_delta.assert_called_once_with(account_id, amount)
+        mock_account_repo.get_account.assert_not_called()
         mock_transaction_repo.save_transaction.assert_called_once()
         assert result == "tx123"
 
-def test_withdraw_calls_repos_and_updates_account():
+def test_withdraw_applies_guarded_delta_in_repo():
     mock_account_repo = Mock()
     mock_transaction_repo = Mock()
     service = TransactionService(mock_account_repo, mock_transaction_repo)
@@ -51,8 +49,6 @@ def test_withdraw_calls_repos_and_updates_account():
     account_id = "acc123"
     amount = 300.0
 
-    mock_account = Mock()
-    mock_account_repo.get_account.return_value = mock_account
     mock_transaction_repo.save_transaction.return_value = "tx456"
 
     with patch("application.services.Transaction", autospec=True) as mock_transaction_class:
@@ -60,7 +56,39 @@ def test_withdraw_calls_repos_and_updates_account():
 
         result = service.withdraw(account_id, amount)
 
-        mock_account.withdraw.assert_called_once_with(amount)
-        mock_account_repo.update_account.assert_called_once_with(mock_account)
+        mock_account_repo.apply_delta.assert_called_once_with(account_id, -amount, min_balance=0.0)
+        mock_account_repo.update_account.assert_not_called()
         mock_transaction_repo.save_transaction.assert_called_once()
         assert result == "tx456"
+
+def test_submitted_operations_are_batched_per_account():
+    from concurrent.futures import ThreadPoolExecutor
+    from infrastructure.account_repo import InMemoryAccountRepository
+    from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+    account_repo = InMemoryAccountRepository()
+    account_repo.create_account(AccountFactory.create_account("checking", "hot", "Ann", 0.0))
+    tx_repo = InMemoryTransactionRepository()
+    service = TransactionService(account_repo, tx_repo, batch_window=0.01)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = list(pool.map(lambda _: service.submit_deposit("hot", 10.0), range(40)))
+    bad = service.submit_withdraw("hot", 1000.0)
+
+    assert account_repo.get_account("hot").balance == 400.0
+    assert len({f.result() for f in futures}) == 40
+    with pytest.raises(ValueError):
+        bad.result()
+    assert len(tx_repo.list_transactions("hot")) == 40
+    assert service.batcher.batches < 40
+    assert service.batcher.operations == 41
+    # apply locks are released once an account has no batch in progress
+    assert service.batcher._apply_locks == {}
+
+    # batched and direct withdrawals share the repository's balance check
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        batched = [pool.submit(service.submit_withdraw, "hot", 10.0) for _ in range(30)]
+        direct = [pool.submit(service.withdraw, "hot", 10.0) for _ in range(30)]
+    outcomes = [f.result().exception() is None for f in batched] + [f.exception() is None for f in direct]
+    assert sum(outcomes) == 40
+    assert account_repo.get_account("hot").balance == 0.0
@@ -85,3 +85,24 @@ def test_transaction_service_list_and_get_transaction(capsys, tx_service, accoun
     out = capsys.readouterr().out
     # since logger logs get_transaction, it should appear
     assert f"Fetching transaction {tx_id}" in out
+
+def test_limits_enforced_and_failed_debit_rolls_back(account_repo, transaction_repo):
+    from application.services import TransactionService
+    from infrastructure.interest.limit_service import LimitEnforcementServiceImpl
+    limit_service = LimitEnforcementServiceImpl(account_repo)
+    limit_service.configure_limits("SRC", 50.0, 500.0)
+    service = TransactionService(account_repo, transaction_repo, limit_service)
+    transfers = FundTransferService(account_repo, transaction_repo, limit_service=limit_service)
+
+    service.withdraw("SRC", 30.0)
+    with pytest.raises(ValueError, match="Daily limit exceeded"):
+        transfers.transfer_funds("SRC", "DST", 30.0)
+    assert account_repo.get_account("SRC").balance == 70.0
+
+    # insufficient funds: usage recorded by try_consume is released again
+    limit_service.configure_limits("SRC", 500.0, 500.0)
+    with pytest.raises(ValueError, match="Insufficient"):
+        service.withdraw("SRC", 100.0)
+    assert account_repo.get_constraints("SRC").daily_used == 0.0
+    transfers.transfer_funds("SRC", "DST", 20.0)
+    assert account_repo.get_constraints("SRC").daily_used == 20.0
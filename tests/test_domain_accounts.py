@@ -25,3 +25,25 @@ def test_withdraw_transaction():
     txn = transaction.Transaction("txn2", "WITHDRAW", 300)
     account.withdraw(txn.amount)
     assert account.balance == 200
+
+def test_transactions_and_accounts_use_installed_clock():
+    from datetime import date, datetime, timedelta, timezone
+    from domain.clock import CoarseClock, FrozenClock, set_clock
+
+    frozen = FrozenClock(datetime(2024, 3, 31, 23, 0, tzinfo=timezone.utc))
+    previous = set_clock(frozen)
+    try:
+        tx = transaction.Transaction("123", "DEPOSIT", 10.0)
+        assert tx.timestamp == datetime(2024, 3, 31, 23, 0, tzinfo=timezone.utc)
+        frozen.advance(hours=2)
+        account = factory.AccountFactory.create_account("checking", "123", "John Doe", 0)
+        assert account.last_interest_date == date(2024, 4, 1)
+    finally:
+        set_clock(previous)
+
+    coarse = CoarseClock(resolution_seconds=60)
+    assert coarse.now() is coarse.now()
+    # limits count days in UTC whichever clock is installed
+    assert coarse.today() == coarse.now().date()
+    east = timezone(timedelta(hours=2))
+    assert FrozenClock(datetime(2024, 4, 1, 1, 0, tzinfo=east)).today() == date(2024, 3, 31)
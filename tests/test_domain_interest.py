@@ -1,3 +1,4 @@
+import pytest
 from domain.interest import checking_interest, savings_interest, limits_constraint, limit_account
 from domain.accounts.factory import AccountFactory
 
@@ -23,3 +24,95 @@ def test_limits_constraint():
     except Exception:
         result = False
     assert result
+
+def test_interest_curve_matches_pointwise_calculation():
+    from datetime import timedelta
+    account = AccountFactory.create_account("savings", "acc3", "User3", 1000)
+    strategy = savings_interest.SavingsInterestStrategy(annual_rate=0.05)
+    dates = [account.last_interest_date + timedelta(days=d) for d in (0, 30, 365)]
+    curve = strategy.calculate_interest_curve(account, dates)
+    assert curve == pytest.approx([strategy.calculate_interest(account, d) for d in dates])
+    assert account.balance == 1000
+
+def test_rate_schedule_splits_period_into_segments():
+    from datetime import date
+    from domain.interest.rate_schedule import RateSchedule
+    schedule = RateSchedule([(date(2024, 1, 1), 0.05)])
+    schedule.add_rate(0.10, date(2024, 1, 11))
+    assert schedule.version == 1
+    assert schedule.segments(date(2024, 1, 1), date(2024, 1, 21)) == [
+        (date(2024, 1, 1), date(2024, 1, 11), 0.05),
+        (date(2024, 1, 11), date(2024, 1, 21), 0.10),
+    ]
+    assert schedule.rate_days(date(2024, 1, 1), date(2024, 1, 21)) == pytest.approx(10 * 0.05 + 10 * 0.10)
+    assert schedule.rate_days(date(2024, 1, 5), date(2024, 1, 8)) == pytest.approx(3 * 0.05)
+
+def test_savings_interest_uses_effective_dated_rates():
+    from datetime import date
+    from domain.interest.rate_schedule import RateSchedule
+    schedule = RateSchedule([(date(2024, 1, 1), 0.0), (date(2024, 7, 1), 0.0365)])
+    account = AccountFactory.create_account("savings", "acc4", "User4", 1000)
+    account.last_interest_date = date(2024, 1, 1)
+    strategy = savings_interest.SavingsInterestStrategy(schedule=schedule)
+    # only the 10 days after the rate change earn interest
+    assert strategy.calculate_interest(account, date(2024, 7, 11)) == pytest.approx(1.0)
+
+def test_business_calendar_counts_and_conventions():
+    from datetime import date
+    from domain.interest.day_count import BusinessCalendar
+    calendar = BusinessCalendar(2024, 2025, holidays=[date(2024, 12, 25)])
+    # Mon 2024-12-23 .. Mon 2024-12-30: Christmas and the weekend are excluded
+    assert calendar.business_days_between(date(2024, 12, 23), date(2024, 12, 30)) == 4
+    assert not calendar.is_business_day(date(2024, 12, 25))
+    assert calendar.year_fraction(date(2024, 1, 31), date(2024, 3, 31), "30/360") == pytest.approx(60 / 360)
+    assert calendar.year_fraction(date(2024, 1, 1), date(2024, 1, 19), "ACT/360") == pytest.approx(18 / 360)
+    with pytest.raises(ValueError):
+        calendar.business_days_between(date(2020, 1, 1), date(2024, 1, 1))
+    # the day after the range is only valid as an interval end
+    assert calendar.business_days_between(date(2025, 12, 29), date(2026, 1, 1)) == 3
+    with pytest.raises(ValueError):
+        calendar.is_business_day(date(2026, 1, 1))
+
+def test_savings_interest_with_act_360_day_count():
+    from datetime import date
+    account = AccountFactory.create_account("savings", "acc5", "User5", 3600)
+    account.last_interest_date = date(2024, 1, 1)
+    strategy = savings_interest.SavingsInterestStrategy(annual_rate=0.10, day_count="ACT/360")
+    assert strategy.calculate_interest(account, date(2024, 1, 11)) == pytest.approx(10.0)
+
+def test_rolling_24h_limit_spans_midnight():
+    from datetime import datetime, timedelta
+    constraint = limits_constraint.LimitConstraint(daily_limit=100, rolling_24h_limit=100)
+    evening = datetime(2024, 3, 1, 23, 0)
+    constraint.check(100, evening.date(), evening)
+    constraint.record(100, evening.date(), evening)
+    # the calendar day resets at midnight, the rolling window does not
+    morning = evening + timedelta(hours=2)
+    with pytest.raises(ValueError, match="Rolling 24-hour"):
+        constraint.check(50, morning.date(), morning)
+    next_evening = evening + timedelta(hours=24, minutes=30)
+    constraint.check(100, next_evening.date(), next_evening)
+    assert constraint.rolling_24h_used(next_evening) == 0.0
+
+def test_rolling_window_counter_memory_is_bounded():
+    from datetime import datetime, timedelta
+    from domain.interest.rolling_window import RollingWindowCounter
+    counter = RollingWindowCounter(3600, 4)
+    start = datetime(2024, 1, 1)
+    for minute in range(0, 600, 5):
+        counter.add(1.0, start + timedelta(minutes=minute))
+    assert len(counter._sums) == 5
+    # the last hour holds 12 five-minute records, over-stated by at most one 15-minute bucket
+    assert counter.total(start + timedelta(minutes=595)) <= 15
+
+
+def test_rolling_window_counter_keeps_amounts_for_the_full_window():
+    from datetime import datetime, timedelta
+    from domain.interest.rolling_window import RollingWindowCounter
+    counter = RollingWindowCounter(24 * 3600, 24)
+    # recorded one minute before an hourly bucket boundary
+    recorded = datetime(2024, 1, 1, 10, 59)
+    counter.add(100.0, recorded)
+    for elapsed in (timedelta(hours=23, minutes=47), timedelta(hours=23, minutes=59, seconds=59)):
+        assert counter.total(recorded + elapsed) == 100.0
+    assert counter.total(recorded + timedelta(hours=24, minutes=1)) == 0.0
@@ -60,8 +60,109 @@ def test_get_and_save_constraints(repo):
     saved = repo.get_constraints("acc8")
     assert saved.daily_limit == 1000
 
+def test_constraint_readers_take_the_account_lock(repo):
+    from datetime import datetime, timezone
+    from threading import Thread
+    repo.save_constraints("acc10", LimitConstraint(daily_limit=100))
+    lock = repo._lock(repo._limit_locks, "acc10")
+    done = []
+    readers = [
+        Thread(target=lambda: done.append(repo.check_constraint("acc10", 50.0, datetime.now(timezone.utc)))),
+        Thread(target=lambda: done.append(repo.refresh_constraints())),
+    ]
+    with lock:
+        for t in readers:
+            t.start()
+        for t in readers:
+            t.join(0.05)
+        assert done == []
+    for t in readers:
+        t.join()
+    assert len(done) == 2
+    with raises(ValueError):
+        repo.check_constraint("acc10", 150.0, datetime.now(timezone.utc))
+
 def test_get_constraint_dict(repo):
     repo.save_constraints("acc9", LimitConstraint(daily_limit=500))
     constraints = repo.get_constraint_dict()
     assert "acc9" in constraints
     assert constraints["acc9"].daily_limit == 500
+
+def test_striped_account_is_transparent(repo):
+    from concurrent.futures import ThreadPoolExecutor
+    from domain.accounts.striped_account import StripedAccount
+    repo.create_account(AccountFactory.create_account("checking", "merchant", "Shop", 100))
+    repo.enable_striping("merchant", stripes=4)
+    account = repo.get_account("merchant")
+    assert isinstance(account, StripedAccount)
+    assert account.account_type() == "checking"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda _: account.deposit(1.0), range(200)))
+    assert account.balance == 300
+    account.withdraw(250)
+    assert account.balance == 50
+    with raises(ValueError):
+        account.withdraw(51)
+
+    assert repo.consolidate_striped_accounts() == 1
+    assert account.stripe_balances() == [50, 0, 0, 0]
+    repo.disable_striping("merchant")
+    plain = repo.get_account("merchant")
+    assert not isinstance(plain, StripedAccount)
+    assert plain.balance == 50
+    # a credit through a stale striped reference is refused rather than lost
+    assert not account.credit_if_live(5.0)
+    repo.apply_delta("merchant", 5.0)
+    assert plain.balance == 55
+
+def test_apply_delta_and_transfer(repo):
+    repo.create_account(AccountFactory.create_account("checking", "d1", "Ann", 100.0))
+    repo.create_account(AccountFactory.create_account("checking", "d2", "Ben", 10.0))
+    version = repo.get_account_version("d1")
+
+    assert repo.apply_delta("d1", -40.0, min_balance=0.0) == 60.0
+    assert repo.get_account_version("d1") > version
+    with pytest.raises(ValueError):
+        repo.apply_delta("d1", -61.0, min_balance=0.0)
+
+    repo.apply_transfer("d1", "d2", 60.0)
+    assert repo.get_account("d1").balance == 0.0
+    assert repo.get_account("d2").balance == 70.0
+    with pytest.raises(ValueError):
+        repo.apply_transfer("d1", "d2", 1.0)
+
+    # transfers into a striped account do not take the destination's balance lock
+    repo.enable_striping("d2", stripes=4)
+    repo._balance_locks.pop("d2", None)
+    repo.apply_delta("d1", 20.0)
+    repo.apply_transfer("d1", "d2", 5.0)
+    assert repo.get_account("d1").balance == 15.0
+    assert repo.get_account("d2").balance == 75.0
+    assert "d2" not in repo._balance_locks
+    with pytest.raises(ValueError):
+        repo.apply_transfer("d1", "d2", 16.0)
+
+def test_apply_deltas_applies_in_order_and_reports_each(repo):
+    repo.create_account(AccountFactory.create_account("checking", "b1", "Ann", 10.0))
+    version = repo.get_account_version("b1")
+
+    results = repo.apply_deltas("b1", [(5.0, None), (-20.0, 0.0), (-15.0, 0.0)])
+    assert results[0] == 15.0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 0.0
+    assert repo.get_account("b1").balance == 0.0
+    assert repo.get_account_version("b1") > version
+
+def test_owner_index_follows_create_update_and_close(repo):
+    repo.create_account(AccountFactory.create_account("checking", "o1", "Ann", 0.0))
+    repo.create_account(AccountFactory.create_account("savings", "o2", "Ann", 0.0))
+    moved = AccountFactory.create_account("savings", "o2", "Ben", 0.0)
+    repo.update_account(moved)
+    assert [a.account_id for a in repo.get_accounts_by_owner("Ann")] == ["o1"]
+    assert repo.get_accounts_by_owner("Ben") == [moved]
+
+    repo.close_account("o1")
+    assert repo.get_accounts_by_owner("Ann") == []
+    with raises(KeyError):
+        repo.get_account("o1")
@@ -0,0 +1,301 @@
+import json
+import pytest
+from datetime import date
+from domain.accounts.factory import AccountFactory
+from infrastructure.account_repo import InMemoryAccountRepository
+from infrastructure.interest.interest_repo import ConfigInterestStrategyRepository
+from infrastructure.interest.interest_service import InterestServiceImpl
+
+
+@pytest.fixture
+def strategy_repo(tmp_path):
+    config = tmp_path / "rates.json"
+    config.write_text(json.dumps({
+        "savings": [{"effective_from": "2024-01-01", "rate": 0.0365}],
+        "checking": 0.0365,
+    }))
+    return ConfigInterestStrategyRepository(str(config))
+
+@pytest.fixture
+def account_repo():
+    repo = InMemoryAccountRepository()
+    for account_id in ("S1", "S2"):
+        account = AccountFactory.create_account("savings", account_id, "Owner", 1000.0)
+        account.last_interest_date = date(2024, 1, 1)
+        repo.create_account(account)
+    return repo
+
+def test_set_rate_applies_from_effective_date_only(strategy_repo, account_repo):
+    service = InterestServiceImpl(account_repo, strategy_repo)
+    version = strategy_repo.set_rate("savings", 0.0, date(2024, 1, 11))
+    assert version == 1
+    # 10 days at 3.65% on 1000, then nothing
+    assert service.calculate_interest_preview("S1", date(2024, 2, 1)) == pytest.approx(1.0)
+
+def test_batch_matches_single_account_interest(strategy_repo, account_repo):
+    service = InterestServiceImpl(account_repo, strategy_repo)
+    expected = service.calculate_interest_preview("S1", date(2024, 1, 31))
+    results = service.apply_interest_batch(["S1", "S2"], date(2024, 1, 31))
+    assert results == pytest.approx([expected, expected])
+    assert account_repo.get_account("S2").balance == pytest.approx(1000.0 + expected)
+    assert account_repo.get_account("S2").last_interest_date == date(2024, 1, 31)
+
+def test_rate_simulation_leaves_live_accounts_untouched(strategy_repo, account_repo):
+    from infrastructure.interest.rate_simulation import RateScenario, RateSimulationEngine
+    engine = RateSimulationEngine(account_repo, strategy_repo, max_workers=2)
+    report = engine.run([RateScenario("savings+25bp", shifts={"savings": 0.0025})], date(2024, 12, 31))
+
+    baseline = report.result("baseline")
+    shifted = report.result("savings+25bp")
+    days = (date(2024, 12, 31) - date(2024, 1, 1)).days
+    assert baseline.per_account["S1"] == pytest.approx(1000.0 * 0.0365 * days / 365)
+    assert shifted.total_interest - baseline.total_interest == pytest.approx(2 * 1000.0 * 0.0025 * days / 365)
+    assert "savings+25bp" in report.summary()
+    assert account_repo.get_account("S1").balance == 1000.0
+    assert strategy_repo.get_rate_schedule("savings").current_rate == 0.0365
+
+def test_rate_simulation_uses_each_accounts_own_strategy(strategy_repo, account_repo):
+    from domain.accounts.snapshot import AccountSnapshot
+    from domain.interest.interest_strategy import InterestStrategy
+    from infrastructure.interest.rate_simulation import RateScenario, RateSimulationEngine, _simulate
+    InterestServiceImpl(account_repo, strategy_repo).set_interest_strategy("S2", "checking")
+    engine = RateSimulationEngine(account_repo, strategy_repo, max_workers=0)
+    report = engine.run([RateScenario("savings+25bp", shifts={"savings": 0.0025})], date(2024, 12, 31))
+    days = (date(2024, 12, 31) - date(2024, 1, 1)).days
+    delta = report.result("savings+25bp").total_interest - report.result("baseline").total_interest
+    # S2 now earns the checking rate, so only S1 moves
+    assert delta == pytest.approx(1000.0 * 0.0025 * days / 365)
+
+    class NonLinear(InterestStrategy):
+        def calculate_interest(self, account, as_of):
+            return 0.0
+    snapshot = AccountSnapshot("N1", "custom", 500.0, date(2024, 1, 1))
+    assert _simulate("x", {"custom": NonLinear()}, [snapshot], date(2024, 2, 1)).total_interest == 0.0
+
+def test_preview_cache_hits_until_account_changes(strategy_repo, account_repo):
+    from infrastructure.interest.preview_cache import InterestPreviewCache
+    cache = InterestPreviewCache(max_entries=10)
+    service = InterestServiceImpl(account_repo, strategy_repo, cache)
+    as_of = date(2024, 1, 11)
+
+    first = service.calculate_interest_preview("S1", as_of)
+    assert service.calculate_interest_preview("S1", as_of) == first
+    assert cache.stats()["hits"] == 1
+
+    account = account_repo.get_account("S1")
+    account.deposit(1000.0)
+    account_repo.update_account(account)
+    assert service.calculate_interest_preview("S1", as_of) == pytest.approx(2 * first)
+
+    strategy_repo.set_rate("savings", 0.0, date(2024, 1, 1))
+    assert service.calculate_interest_preview("S1", as_of) == 0.0
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["invalidations"] == 1
+    assert 0 < stats["hitRate"] < 1
+
+def test_limit_resets_are_lazy_epoch_bumps(account_repo):
+    from domain.interest.limits_constraint import LimitEpochs
+    from infrastructure.interest.limit_service import LimitEnforcementServiceImpl
+    service = LimitEnforcementServiceImpl(account_repo, epochs=LimitEpochs())
+    service.configure_limits("S1", 100.0, 1000.0)
+    constraint = account_repo.get_constraint_dict()["S1"]
+    constraint.record(80.0, date(2024, 1, 2))
+
+    service.reset_limits_daily()
+    # nothing is scanned; the stored counter is cleared on next touch
+    assert constraint.daily_used == 80.0
+    assert account_repo.get_constraints("S1").daily_used == 0.0
+    assert constraint.monthly_used == 80.0
+
+    service.reset_limits_monthly()
+    service.compact_limits()
+    assert constraint.monthly_used == 0.0
+
+def test_streamed_csv_matches_buffered_render(account_repo):
+    from datetime import datetime, timezone
+    from domain.accounts.transaction import Transaction
+    from infrastructure.interest.csv_statement_adapter import CsvStatementAdapter
+    from infrastructure.interest.statementgenerator import StatementServiceImpl
+    from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+    tx_repo = InMemoryTransactionRepository()
+    for i in range(10):
+        tx = Transaction("S1", "DEPOSIT" if i % 2 else "WITHDRAW", 5.0)
+        tx.timestamp = datetime(2024, 1, 1 + i, tzinfo=timezone.utc)
+        tx_repo.save_transaction(tx)
+    service = StatementServiceImpl(account_repo, tx_repo)
+    adapter = CsvStatementAdapter()
+
+    streamed = service.stream_statement("S1", 2024, 1, date(2024, 2, 1))
+    buffered = service.generate_statement("S1", 2024, 1, date(2024, 2, 1))
+    assert streamed.opening_balance == buffered.opening_balance
+    chunks = list(adapter.iter_render(streamed, rows_per_chunk=4))
+    assert len(chunks) > 1
+    assert b"".join(chunks) == adapter.render(buffered)
+
+    # a transaction saved after the statement was built is not in its rows
+    late = Transaction("S1", "DEPOSIT", 7.0)
+    late.timestamp = datetime(2024, 1, 30, tzinfo=timezone.utc)
+    tx_repo.save_transaction(late)
+    account_repo.apply_delta("S1", 7.0)
+    assert len(list(streamed.transactions)) == 10
+    assert b"".join(adapter.iter_render(streamed, rows_per_chunk=4)) == adapter.render(buffered)
+
+def test_pdf_pool_renders_each_statement_once(tmp_path):
+    pytest.importorskip("reportlab")
+    from domain.interest.statement import MonthlyStatement
+    from infrastructure.interest.pdf_render_pool import PdfRenderPool, RenderedStatementCache
+
+    cache = RenderedStatementCache(max_entries=1, spill_dir=str(tmp_path))
+    pool = PdfRenderPool(max_workers=0, cache=cache)
+    jan = MonthlyStatement("S1", 2024, 1, 0.0, 10.0, 0.0, [], date(2024, 2, 1))
+    feb = MonthlyStatement("S1", 2024, 2, 10.0, 10.0, 0.0, [], date(2024, 3, 1))
+
+    first = pool.render(jan)
+    assert first.startswith(b"%PDF")
+    pool.render(feb)  # pushes January out of memory and onto disk
+    again = MonthlyStatement("S1", 2024, 1, 0.0, 10.0, 0.0, [], date(2024, 6, 1))
+    assert pool.render(again) == first
+    assert cache.stats()["diskHits"] == 1
+
+def test_rendered_cache_prunes_its_spill_directory(tmp_path):
+    from infrastructure.interest.pdf_render_pool import RenderedStatementCache
+
+    cache = RenderedStatementCache(max_entries=1, spill_dir=str(tmp_path), max_spilled=2)
+    for key in ("a", "b", "c", "d"):
+        cache.put(key, key.encode())
+    # b and c are on disk, a was pushed out of the spill directory and deleted
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["b.bin", "c.bin"]
+    assert cache.get("a") is None
+    assert cache.get("b") == b"b"
+
+    reopened = RenderedStatementCache(max_entries=1, spill_dir=str(tmp_path), max_spilled=1)
+    reopened.put("e", b"e")
+    reopened.put("f", b"f")
+    assert [p.name for p in tmp_path.iterdir()] == ["e.bin"]
+
+def test_canvas_renderer_paginates_large_statements():
+    pytest.importorskip("reportlab")
+    from domain.accounts.transaction import Transaction
+    from domain.interest.statement import MonthlyStatement
+    from infrastructure.interest.pdf_canvas_renderer import CanvasStatementRenderer
+    from io import BytesIO
+    import re
+
+    renderer = CanvasStatementRenderer()
+    for rows, expected_pages in ((10, 1), (200, 4)):
+        txs = [Transaction("S1", "DEPOSIT", float(i)) for i in range(rows)]
+        statement = MonthlyStatement("S1", 2024, 1, 0.0, 0.0, 0.0, txs, date(2024, 2, 1))
+        out = BytesIO()
+        pages = renderer.render_to(statement, out)
+        pdf = out.getvalue()
+        assert pdf.startswith(b"%PDF")
+        assert pages == expected_pages == len(re.findall(rb"/Type /Page\b(?!s)", pdf))
+        # the page header is one form per document, however many pages use it
+        assert pdf.count(b"/Subtype /Form") == 1
+
+def test_month_end_job_writes_sharded_statements_and_resumes(account_repo, tmp_path):
+    import zipfile
+    from infrastructure.interest.statement_batch import MonthEndStatementJob
+    from infrastructure.interest.statementgenerator import StatementServiceImpl
+    from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+    for account_id in ("S/x", "S_x", "gone"):
+        account_repo.create_account(AccountFactory.create_account("savings", account_id, "Owner", 1.0))
+
+    class ClosingMidRun(StatementServiceImpl):
+        def generate_statements(self, account_ids, year, month, as_of):
+            if "gone" in account_ids:
+                account_repo.close_account("gone")
+            return super().generate_statements(account_ids, year, month, as_of)
+
+    service = ClosingMidRun(account_repo, InMemoryTransactionRepository())
+    job = MonthEndStatementJob(account_repo, service, str(tmp_path), formats=("csv",),
+                               archive=True, shard_chars=1, chunk_size=2, max_workers=0)
+    report = job.run(2024, 1, date(2024, 2, 1))
+    assert (report.generated, report.skipped) == (4, 0)
+    assert report.failed == {"gone": "Account not found"}
+    with zipfile.ZipFile(tmp_path / "2024-01" / "S.zip") as zf:
+        names = sorted(zf.namelist())
+    # IDs that sanitize alike still get their own entries
+    assert len(names) == 4
+    assert names[0].startswith("S1-") and names[0].endswith("-2024-01.csv")
+    assert not list((tmp_path / "2024-01").glob("*.tmp"))
+    assert not (tmp_path / "2024-01" / "_parts").exists()
+
+    again = job.run(2024, 1, date(2024, 2, 1))
+    assert (again.generated, again.skipped) == (0, 4)
+
+    # a run interrupted before merging leaves its parts for the next run
+    account_repo.create_account(AccountFactory.create_account("savings", "S-new", "Owner", 1.0))
+    def crash(period_dir):
+        raise RuntimeError("interrupted")
+    job._merge_parts = crash
+    with pytest.raises(RuntimeError):
+        job.run(2024, 1, date(2024, 2, 1))
+    del job._merge_parts
+    resumed = job.run(2024, 1, date(2024, 2, 1))
+    assert (resumed.generated, resumed.skipped) == (0, 5)
+    with zipfile.ZipFile(tmp_path / "2024-01" / "S.zip") as zf:
+        assert len(zf.namelist()) == 5
+
+def test_statement_cache_invalidates_only_its_period(account_repo):
+    from datetime import datetime, timezone
+    from threading import Barrier, Thread
+    from domain.accounts.transaction import Transaction
+    from infrastructure.interest.statement_cache import CachingStatementService, StatementCache
+    from infrastructure.interest.statementgenerator import StatementServiceImpl
+    from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+    tx_repo = InMemoryTransactionRepository()
+    cache = StatementCache()
+    tx_repo.add_save_listener(cache.transaction_saved)
+    inner = StatementServiceImpl(account_repo, tx_repo)
+    calls = []
+    barrier = Barrier(4)
+
+    class Counting:
+        def generate_statement(self, *args):
+            calls.append(args)
+            return inner.generate_statement(*args)
+
+    service = CachingStatementService(Counting(), cache)
+    def request():
+        barrier.wait()
+        service.generate_statement("S1", 2024, 1, date(2024, 2, 1))
+    threads = [Thread(target=request) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+
+    def save(day):
+        tx = Transaction("S1", "DEPOSIT", 5.0)
+        tx.timestamp = datetime(2024, day[0], day[1], tzinfo=timezone.utc)
+        tx_repo.save_transaction(tx)
+
+    save((2, 3))
+    service.generate_statement("S1", 2024, 1, date(2024, 3, 1))
+    assert len(calls) == 1
+    save((1, 20))
+    statement = service.generate_statement("S1", 2024, 1, date(2024, 3, 1))
+    assert len(calls) == 2
+    assert len(statement.transactions) == 1
+
+def test_statement_cache_follows_balance_changes_and_streams_uncached(account_repo):
+    from infrastructure.interest.statement_cache import CachingStatementService, StatementCache
+    from infrastructure.interest.statementgenerator import MonthTransactions, StatementServiceImpl
+    from infrastructure.transaction_repo import InMemoryTransactionRepository
+
+    cache = StatementCache()
+    inner = StatementServiceImpl(account_repo, InMemoryTransactionRepository())
+    service = CachingStatementService(inner, cache, account_repo)
+    assert service.generate_statement("S1", 2024, 1, date(2024, 2, 1)).closing_balance == 1000.0
+    # a balance change outside the period still changes the closing balance
+    account_repo.apply_delta("S1", 25.0)
+    assert service.generate_statement("S1", 2024, 1, date(2024, 2, 1)).closing_balance == 1025.0
+
+    streamed = service.stream_statement("S1", 2024, 2, date(2024, 3, 1))
+    assert isinstance(streamed.transactions, MonthTransactions)
+    assert cache.stats()["size"] == 1
@@ -0,0 +1,155 @@
+import logging
+import queue
+from infrastructure.log_pipeline import BoundedQueueHandler
+from infrastructure.logger import BankingLogger
+
+
+def test_async_logger_writes_everything_on_shutdown(tmp_path):
+    log_file = tmp_path / "app.log"
+    logger = BankingLogger("async-test", async_mode=True, log_file=str(log_file), batch_size=16)
+    for i in range(100):
+        logger.info(f"message {i}", transaction_id=str(i))
+    logger.shutdown()
+    lines = log_file.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[-1].endswith("message 99")
+    assert logger.dropped_records == 0
+
+
+def test_queue_handler_drops_when_full():
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("x", logging.INFO, __file__, 1, "hello", None, None)
+    handler.emit(record)
+    handler.emit(record)
+    assert handler.dropped == 1
+
+
+def test_queued_records_keep_the_message_as_it_was_logged(tmp_path):
+    from infrastructure.log_pipeline import LogWriter
+
+    log_queue = queue.Queue()
+    handler = BoundedQueueHandler(log_queue)
+    state = {"balance": 10}
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "result=%s", (state,), None))
+    state["balance"] = 99
+    file_handler = logging.FileHandler(str(tmp_path / "delayed.log"), delay=True)
+    writer = LogWriter(log_queue, [file_handler])
+    writer.start()
+    handler.emit(logging.LogRecord("x", logging.INFO, __file__, 1, "second", None, None))
+    writer.stop()
+    file_handler.close()
+    assert (tmp_path / "delayed.log").read_text().splitlines() == ["result={'balance': 10}", "second"]
+
+
+def test_log_method_call_skips_work_when_disabled_and_samples(caplog):
+    from infrastructure.logger import log_method_call
+
+    log = logging.getLogger("method-call-test")
+    log.setLevel(logging.DEBUG)
+
+    @log_method_call(log, sample_rate=3)
+    def add(a, b, pin=None):
+        return a + b
+
+    with caplog.at_level(logging.DEBUG, logger="method-call-test"):
+        results = [add(i, 1, pin="1234") for i in range(6)]
+    assert results == [1, 2, 3, 4, 5, 6]
+    starts = [r.getMessage() for r in caplog.records if " START " in r.getMessage()]
+    assert len(starts) == 2
+    assert "******" in starts[0] and "1234" not in starts[0]
+
+    caplog.clear()
+    log.setLevel(logging.INFO)
+    assert add(1, 1) == 2
+    assert caplog.records == []
+
+def test_log_method_call_logs_each_class_under_its_own_component(caplog):
+    from infrastructure.logger import log_method_call
+
+    class Base:
+        @log_method_call(level=logging.INFO)
+        def run(self):
+            return type(self).__name__
+
+    class Child(Base):
+        pass
+
+    with caplog.at_level(logging.INFO):
+        assert Base().run() == "Base"
+        assert Child().run() == "Child"
+    names = [r.name for r in caplog.records if " START " in r.getMessage()]
+    assert [n.rsplit(".", 1)[-1] for n in names] == ["base", "child"]
+
+
+def test_audit_log_rotates_compresses_and_finds_records(tmp_path):
+    from infrastructure.audit_log import SegmentedAuditLog
+
+    audit = SegmentedAuditLog(str(tmp_path), segment_bytes=200)
+    logger = BankingLogger("audit-test", audit_log=audit)
+    for i in range(20):
+        logger.log_transaction("DEPOSIT", f"tx-{i}", {"amount": i, "account": "A1"})
+    audit.close()
+    assert sorted(p.name for p in tmp_path.glob("*.gz"))[0] == "segment-000001.log.gz"
+
+    reopened = SegmentedAuditLog(str(tmp_path), segment_bytes=200)
+    assert reopened.get("tx-3")["details"] == {"amount": 3, "account": "A1"}
+    assert reopened.get("tx-19")["transaction_type"] == "DEPOSIT"
+    assert reopened.get("missing") is None
+    assert [r["transaction_id"] for r in reopened] == [f"tx-{i}" for i in range(20)]
+    reopened.close()
+
+
+def test_audit_log_recovers_from_torn_write_and_reads_compressed_blocks(tmp_path, monkeypatch):
+    from infrastructure import audit_log
+    from infrastructure.audit_log import SegmentedAuditLog
+
+    audit = SegmentedAuditLog(str(tmp_path / "torn"))
+    for i in range(3):
+        audit.append({"transaction_id": f"t{i}"})
+    audit.close()
+    with open(tmp_path / "torn" / "segment-000001.log", "ab") as f:
+        f.write(b"\x00\x00\x01\x00{partial")
+    reopened = SegmentedAuditLog(str(tmp_path / "torn"))
+    reopened.append({"transaction_id": "t9"})
+    assert [r["transaction_id"] for r in reopened] == ["t0", "t1", "t2", "t9"]
+    assert reopened.get("t9") == {"transaction_id": "t9"}
+    reopened.close()
+
+    monkeypatch.setattr(audit_log, "BLOCK_BYTES", 256)
+    audit = SegmentedAuditLog(str(tmp_path / "blocks"), segment_bytes=4096)
+    for i in range(100):
+        audit.append({"transaction_id": f"b{i}", "padding": "x" * 40})
+    audit.close()
+    assert (tmp_path / "blocks" / "segment-000001.log.gz").exists()
+    reopened = SegmentedAuditLog(str(tmp_path / "blocks"), segment_bytes=4096)
+    assert len(reopened._block(1, 4000)) == 2 and reopened._block(1, 4000)[0] > 0
+    assert all(reopened.get(f"b{i}")["transaction_id"] == f"b{i}" for i in range(100))
+    assert len(list(reopened)) == 100
+    reopened.close()
+
+
+def test_log_analyzer_byte_ranges_match_single_pass(tmp_path):
+    from infrastructure.log_analyzer import analyze_range, byte_ranges, LogStats
+
+    log_file = tmp_path / "transactions.log"
+    log_file.write_text(
+        "2025-04-19 04:52:43,267 - banking - INFO - Transaction t1: Type=DEPOSIT, Amount=100.0, Account=a\n"
+        "2025-04-19 04:52:54,625 - banking - ERROR - Transaction failed: Insufficient funds\n"
+        "2025-04-19 05:10:01,000 - banking - INFO - Transaction t2: Type=TRANSFER, Amount=30.0, Account=a, DestAccount=b\n"
+        "2025-04-19 05:20:01,000 - banking - INFO - unrelated message\n"
+        "2025-04-19 05:30:01,000 - banking - INFO - Transaction t3: Type=WITHDRAW, Amount=20.0, Account=b\n"
+    )
+    whole = analyze_range(str(log_file), window_minutes=60)
+    assert (whole.lines, whole.transactions, whole.failures) == (5, 3, 1)
+    assert whole.volume_by_account == {"a": 130.0, "b": 20.0}
+    assert whole.transfer_total == 30.0
+    assert whole.windows == {"2025-04-19 04:00": [1, 1], "2025-04-19 05:00": [2, 0]}
+
+    # ranges that cut through lines still count every line exactly once
+    merged = LogStats()
+    for start, end in byte_ranges(str(log_file), 7):
+        merged.merge(analyze_range(str(log_file), start, end, window_minutes=60))
+    assert merged.to_dict() == whole.to_dict()
+
+    later = analyze_range(str(log_file), since="2025-04-19 05:00:00")
+    assert (later.transactions, later.failures) == (2, 0)
@@ -0,0 +1,94 @@
+import asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from presentation.admission import (
+    AdmissionControlMiddleware, AdmissionController, RouteLimits, TokenBucketTable,
+)
+
+
+def make_client(controller):
+    app = FastAPI()
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+
+    @app.post("/accounts/transfer")
+    def transfer(body: dict):
+        return {"ok": True}
+
+    @app.post("/accounts/{account_id}/deposit")
+    def deposit(account_id: str):
+        return {"ok": True}
+
+    return TestClient(app)
+
+def test_token_bucket_refills_over_time():
+    table = TokenBucketTable(rate=1.0, burst=2.0, stripes=2)
+    assert table.try_acquire("a", now=0.0) == 0.0
+    assert table.try_acquire("a", now=0.0) == 0.0
+    assert table.try_acquire("a", now=0.0) > 0
+    assert table.try_acquire("b", now=0.0) == 0.0
+    assert table.try_acquire("a", now=1.0) == 0.0
+
+def test_token_bucket_table_is_bounded():
+    table = TokenBucketTable(rate=1.0, burst=1.0, stripes=1, max_keys_per_stripe=8)
+    for i in range(100):
+        table.try_acquire(f"k{i}", now=float(i))
+    assert len(table) <= 8
+
+def test_per_account_bucket_from_path_and_body():
+    controller = AdmissionController(routes={
+        "POST /accounts/{account_id}/deposit": RouteLimits(account_rate=0.001, account_burst=1),
+        "POST /accounts/transfer": RouteLimits(account_rate=0.001, account_burst=1,
+                                               account_field="source_account_id"),
+    })
+    client = make_client(controller)
+    assert client.post("/accounts/A/deposit").status_code == 200
+    response = client.post("/accounts/A/deposit")
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+    assert client.post("/accounts/B/deposit").status_code == 200
+
+    assert client.post("/accounts/transfer", json={"source_account_id": "A"}).status_code == 200
+    assert client.post("/accounts/transfer", json={"source_account_id": "A"}).status_code == 429
+
+def test_client_bucket_ignores_client_id_from_untrusted_peers():
+    limits = RouteLimits(client_rate=0.001, client_burst=1)
+    client = make_client(AdmissionController(default=limits))
+    assert client.post("/accounts/A/deposit", headers={"x-client-id": "one"}).status_code == 200
+    assert client.post("/accounts/A/deposit", headers={"x-client-id": "two"}).status_code == 429
+
+    # TestClient connects from "testclient"; as a trusted proxy its header names the client
+    client = make_client(AdmissionController(default=limits, trusted_proxies=["testclient"]))
+    assert client.post("/accounts/A/deposit", headers={"x-client-id": "one"}).status_code == 200
+    assert client.post("/accounts/A/deposit", headers={"x-client-id": "two"}).status_code == 200
+
+def test_account_rejection_refunds_the_client_token():
+    controller = AdmissionController(routes={
+        "POST /accounts/{account_id}/deposit": RouteLimits(
+            client_rate=0.001, client_burst=2, account_rate=0.001, account_burst=1),
+    })
+    client = make_client(controller)
+    assert client.post("/accounts/A/deposit").status_code == 200
+    assert client.post("/accounts/A/deposit").status_code == 429
+    assert client.post("/accounts/B/deposit").status_code == 200
+
+def test_saturated_concurrency_sheds_with_503():
+    controller = AdmissionController(max_concurrency=1, max_queue=0)
+    client = make_client(controller)
+    controller.in_flight = 1  # simulate a request holding the only slot
+    assert client.post("/accounts/A/deposit").status_code == 503
+    controller.in_flight = 0
+    assert client.post("/accounts/A/deposit").status_code == 200
+    assert controller.in_flight == 0
+
+def test_waiter_gets_released_slot():
+    async def scenario():
+        controller = AdmissionController(max_concurrency=1, max_queue=1)
+        assert await controller.acquire(0.1)
+        waiting = asyncio.ensure_future(controller.acquire(1.0))
+        await asyncio.sleep(0)
+        assert controller.queue_depth == 1
+        controller.release()
+        assert await waiting
+        controller.release()
+        return controller.in_flight
+    assert asyncio.run(scenario()) == 0
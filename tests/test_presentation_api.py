@@ -146,3 +146,52 @@ def test_get_statement_pdf():
     response = client.get("/accounts/stmtacc3/statement?year=2023&month=1&format=pdf")
     assert response.status_code == 200
     assert response.headers["content-type"] == "application/pdf"
+
+def test_interest_projection():
+    client.post("/accounts", json={"account_type": "savings", "account_id": "projacc", "owner": "Proj", "initial_deposit": 1000})
+
+    payload = {"startDate": "2030-01-01", "endDate": "2030-01-31", "stepDays": 10}
+    response = client.post("/accounts/projacc/interest/projection", json=payload)
+    assert response.status_code == 200
+    points = response.json()["projection"]
+    assert [p["date"] for p in points] == ["2030-01-01", "2030-01-11", "2030-01-21", "2030-01-31"]
+    assert points[0]["interest"] < points[-1]["interest"]
+
+    response = client.get("/accounts/projacc/balance")
+    assert response.json()["balance"] == 1000
+
+    bad_payload = {"startDate": "2030-01-31", "endDate": "2030-01-01"}
+    response = client.post("/accounts/projacc/interest/projection", json=bad_payload)
+    assert response.status_code == 400
+
+def test_list_owner_accounts():
+    client.post("/accounts", json={"account_type": "checking", "account_id": "own1", "owner": "Olga", "initial_deposit": 100})
+    client.post("/accounts", json={"account_type": "savings", "account_id": "own2", "owner": "Olga", "initial_deposit": 200})
+    response = client.get("/owners/Olga/accounts")
+    assert response.status_code == 200
+    accounts = response.json()["accounts"]
+    assert [(a["account_id"], a["balance"]) for a in accounts] == [("own1", 100), ("own2", 200)]
+    assert client.get("/owners/Nobody/accounts").json()["accounts"] == []
+
+def test_get_many_balances():
+    client.post("/accounts", json={"account_type": "checking", "account_id": "bal1", "owner": "B", "initial_deposit": 10})
+    client.post("/accounts", json={"account_type": "checking", "account_id": "bal2", "owner": "B", "initial_deposit": 20})
+    response = client.get("/accounts/balances?ids=bal1,bal2&ids=ghost")
+    assert response.status_code == 200
+    assert response.json() == {"balances": {"bal1": 10, "bal2": 20}, "missing": ["ghost"]}
+    response = client.post("/accounts/balances", json={"ids": ["bal2"]})
+    assert response.json() == {"balances": {"bal2": 20}, "missing": []}
+
+def test_metrics_endpoint():
+    client.post("/accounts", json={"account_type": "checking", "account_id": "metricsacc",
+                                   "owner": "Metrics User", "initial_deposit": 10.0})
+    client.post("/accounts/metricsacc/deposit", json={"amount": 5.0})
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'banking_http_request_duration_seconds_count{method="POST",route="/accounts/{account_id}/deposit",status="200"}' in body
+    assert 'banking_call_duration_seconds_count{component="TransactionService",method="deposit"}' in body
+    assert 'component="InMemoryAccountRepository",method="apply_delta"' in body
+    assert "banking_threadpool_capacity 40" in body
+    assert "banking_http_requests_in_flight 1" in body